@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Formato compacto de la agenda (versión 2)
+
+agenda_completa.json repite cada nombre en la agenda, en los dos resúmenes y en las
+preferencias. El formato v2 guarda una sola vez la tabla de participantes y codifica
+con enteros:
+
+    {
+      "formato": "agenda_compacta", "version": 2,
+      "secciones": [...orden de las claves del resultado...],
+      "horarios": ["08:30 - 08:45", ...],          # solo los horarios con citas
+      "vendedores": [...], "compradores": [...],    # tablas de nombres
+      "vendedores_resumen": n, "compradores_resumen": m,
+      "citas": [[horario, comprador, vendedor, vendedor...], ...],
+      "preferencias": [[vendedor, comprador, cumplida], ...],
+      "aristas_sin_color": [[vendedor, comprador], ...],  # solo con el motor "coloreo"
+      "otras": {configuracion, estadisticas, validacion_conflictos, ...}
+    }
+
+Los resúmenes por participante no se guardan: se recalculan al leer (al primer acceso,
+con ResultadoAgenda). Con extensión .gz el archivo se comprime con gzip.
+
+    escribir_agenda_compacta(resultado, "agenda_compacta.json.gz")
+    resultado = cargar_agenda_compacta("agenda_compacta.json.gz")   # misma forma que agenda_completa.json
+"""
+
+import gzip
+import json
+from typing import Dict, List
+
+from modelo_agenda import ResultadoAgenda, TablaIdentificadores
+
+FORMATO_COMPACTO = "agenda_compacta"
+VERSION_FORMATO_COMPACTO = 2
+
+# Secciones del resultado que se codifican con la tabla de participantes
+SECCIONES_CODIFICADAS = ("agenda", "resumen_por_vendedor", "resumen_por_comprador", "preferencias_cumplidas",
+                         "aristas_sin_color")
+
+
+def _abrir(ruta: str, modo: str):
+    if ruta.endswith(".gz"):
+        return gzip.open(ruta, modo + "t", encoding="utf-8")
+    return open(ruta, modo, encoding="utf-8")
+
+
+def codificar_resultado(resultado: Dict) -> Dict:
+    """Convierte el resultado (forma de agenda_completa.json) al documento compacto v2"""
+    vendedores = TablaIdentificadores()
+    compradores = TablaIdentificadores()
+    # Primero los participantes de los resúmenes, en su orden (así se reconstruyen igual)
+    for vendedor in resultado.get("resumen_por_vendedor", {}):
+        vendedores.identificador(vendedor)
+    for comprador in resultado.get("resumen_por_comprador", {}):
+        compradores.identificador(comprador)
+    vendedores_resumen, compradores_resumen = len(vendedores), len(compradores)
+
+    agenda = resultado.get("agenda", {})
+    horarios = list(agenda)
+    citas = []
+    for indice_horario, citas_horario in enumerate(agenda.values()):
+        for cita in citas_horario:
+            fila = [indice_horario, compradores.identificador(cita["comprador"])]
+            fila.extend(vendedores.identificador(v) for v in cita["vendedores"])
+            citas.append(fila)
+
+    preferencias = []
+    for vendedor, lista in resultado.get("preferencias_cumplidas", {}).items():
+        id_vendedor = vendedores.identificador(vendedor)
+        for preferencia in lista:
+            preferencias.append([id_vendedor, compradores.identificador(preferencia["comprador"]),
+                                 1 if preferencia["cumplida"] else 0])
+
+    aristas_sin_color = [[vendedores.identificador(arista["vendedor"]), compradores.identificador(arista["comprador"])]
+                         for arista in resultado.get("aristas_sin_color", [])]
+
+    return {
+        "formato": FORMATO_COMPACTO,
+        "version": VERSION_FORMATO_COMPACTO,
+        "secciones": list(resultado),
+        "horarios": horarios,
+        "vendedores": vendedores.nombres,
+        "compradores": compradores.nombres,
+        "vendedores_resumen": vendedores_resumen,
+        "compradores_resumen": compradores_resumen,
+        "citas": citas,
+        "preferencias": preferencias,
+        "aristas_sin_color": aristas_sin_color,
+        "otras": {clave: resultado[clave] for clave in resultado if clave not in SECCIONES_CODIFICADAS},
+    }
+
+
+def decodificar_resultado(documento: Dict) -> Dict:
+    """Expande un documento compacto v2 a la forma de agenda_completa.json"""
+    if documento.get("formato") != FORMATO_COMPACTO or documento.get("version") != VERSION_FORMATO_COMPACTO:
+        raise ValueError(f"Formato de agenda no soportado: {documento.get('formato')} v{documento.get('version')}")
+    horarios: List[str] = documento["horarios"]
+    vendedores: List[str] = documento["vendedores"]
+    compradores: List[str] = documento["compradores"]
+
+    agenda = {horario: [] for horario in horarios}
+    for fila in documento["citas"]:
+        agenda[horarios[fila[0]]].append({
+            "comprador": compradores[fila[1]],
+            "vendedores": [vendedores[i] for i in fila[2:]]
+        })
+
+    preferencias_cumplidas = {}
+    for id_vendedor, id_comprador, cumplida in documento["preferencias"]:
+        preferencias_cumplidas.setdefault(vendedores[id_vendedor], []).append(
+            {"comprador": compradores[id_comprador], "cumplida": bool(cumplida)})
+
+    aristas_sin_color = [{"vendedor": vendedores[id_vendedor], "comprador": compradores[id_comprador]}
+                         for id_vendedor, id_comprador in documento["aristas_sin_color"]]
+
+    otras = documento["otras"]
+    codificadas = {"agenda": agenda, "preferencias_cumplidas": preferencias_cumplidas,
+                   "aristas_sin_color": aristas_sin_color,
+                   "resumen_por_vendedor": None, "resumen_por_comprador": None}
+    datos = {clave: codificadas[clave] if clave in codificadas else otras[clave] for clave in documento["secciones"]}
+    # Los resúmenes se recalculan desde la agenda la primera vez que se leen
+    return ResultadoAgenda(datos, vendedores[:documento["vendedores_resumen"]],
+                           compradores[:documento["compradores_resumen"]])
+
+
+def escribir_agenda_compacta(resultado: Dict, ruta: str = "agenda_compacta.json.gz"):
+    """Guarda el resultado en formato compacto v2 (gzip si la ruta termina en .gz)"""
+    with _abrir(ruta, "w") as archivo:
+        json.dump(codificar_resultado(resultado), archivo, ensure_ascii=False, separators=(",", ":"))
+
+
+def cargar_agenda_compacta(ruta: str = "agenda_compacta.json.gz") -> Dict:
+    """Lee un archivo compacto v2 y devuelve el resultado con la forma de agenda_completa.json"""
+    with _abrir(ruta, "r") as archivo:
+        return decodificar_resultado(json.load(archivo))
@@ -13,40 +13,210 @@ Múltiples citas simultáneas permitidas
 
 import random
 import csv
+import itertools
 import os
+import sys
+import time
+import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Tuple, Optional, Set
+from typing import Callable, List, Dict, Tuple, Optional, Set
 import json
 
+from agenda_compacta import escribir_agenda_compacta
+from documentos_word import DOCX_DISPONIBLE, generar_documentos_word
+from excel_agenda import OPENPYXL_DISPONIBLE, escribir_excel_agenda
+from flujo_costo_minimo import RedFlujoCostoMinimo
+from html_agenda import escribir_vistas_html
+from instancia_compilada import (CARPETA_CACHE, guardar_instancia_compilada, hash_origen, leer_instancia_compilada,
+                                 ruta_instancia)
+from json_agenda import escribir_resultado
+from modelo_agenda import Cita, MatrizEncuentros, ResultadoAgenda, TablaIdentificadores
+from recursos_estaticos import BROTLI_DISPONIBLE, PAGINAS_SITIO, publicar_sitio
+from vista_tensorial import NUMPY_DISPONIBLE, VistaTensorial
+
+# Motores disponibles para generar_agenda_optimizada
+MOTORES_AGENDA = ("voraz", "flujo", "coloreo")
+
+# Versión de los motores: cambiarla invalida los resultados guardados en caché
+VERSION_MOTOR = "2.1"
+
+# Registro del organizador: los mensajes de los bucles internos van en DEBUG y se
+# formatean solo si ese nivel está activo (argumentos estilo %, nunca f-strings)
+logger = logging.getLogger("agenda_rueda_negocios")
+
+
+class FormateadorJsonLineas(logging.Formatter):
+    """Formatea cada registro como una línea JSON (para logs de procesos por lotes)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        registro = {
+            "tiempo": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "nivel": record.levelname,
+            "funcion": record.funcName,
+            "mensaje": record.getMessage().strip()
+        }
+        if record.exc_info:
+            registro["excepcion"] = self.formatException(record.exc_info)
+        return json.dumps(registro, ensure_ascii=False)
+
+
+def configurar_registro(nivel: int = logging.INFO, archivo_json: Optional[str] = None,
+                        silencioso: bool = False) -> logging.Logger:
+    """Configura el registro del organizador
+
+    nivel: nivel mínimo en consola (logging.DEBUG muestra el detalle cita por cita)
+    archivo_json: si se indica, agrega un manejador que escribe una línea JSON por mensaje
+    silencioso: descarta todo mensaje; al estar el nivel por encima de CRITICAL
+    no se formatea ningún argumento
+    """
+    for manejador in list(logger.handlers):
+        logger.removeHandler(manejador)
+        manejador.close()
+    logger.propagate = False
+
+    if silencioso:
+        logger.setLevel(logging.CRITICAL + 1)
+        return logger
+
+    logger.setLevel(nivel)
+    consola = logging.StreamHandler(sys.stdout)
+    consola.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(consola)
+
+    if archivo_json:
+        manejador_json = logging.FileHandler(archivo_json, encoding="utf-8")
+        manejador_json.setFormatter(FormateadorJsonLineas())
+        logger.addHandler(manejador_json)
+    return logger
+
+
+# Métodos del camino crítico cuyas llamadas cuenta la instrumentación
+METODOS_INSTRUMENTADOS = ("_puede_agendar_cita_grupo", "_verificar_disponibilidad_horaria",
+                          "_encontrar_vendedores_disponibles")
+
+# Motivos por los que _puede_agendar_cita_grupo rechaza una cita
+MOTIVOS_RECHAZO = ("ocupado", "ventana", "repetido", "tope", "prohibido")
+
+# Tipos de violación que reporta validar_agenda
+TIPOS_VIOLACION = ("vendedor_doble", "comprador_doble", "participante_doble", "fuera_de_ventana",
+                   "encuentro_repetido", "grupo_excedido", "vendedor_sobre_tope", "par_prohibido")
+
+# Métodos que modifican la agenda; en modo depuración se valida después de cada uno
+METODOS_MUTACION = ("_registrar_cita", "_agregar_vendedor_a_cita", "_retirar_vendedor_de_cita")
+
+# Configuración del evento por defecto (equivale a configuracion_evento.json).
+# Los horarios "desde"/"hasta" delimitan franjas completas: un slot pertenece a la
+# ventana si empieza en o después de "desde" y termina en o antes de "hasta".
+CONFIGURACION_EVENTO_POR_DEFECTO = {
+    "horario": {"inicio": "08:30", "fin": "13:00", "duracion_cita": 15},
+    "descansos": [
+        {"nombre": "Coffee Break", "inicio": "10:00", "fin": "10:15"}
+    ],
+    "limites": {
+        "max_citas_vendedor": 11,
+        "max_vendedores_por_cita": 3,
+        "max_citas_por_slot": 10
+    },
+    "disponibilidad": [
+        {"participante": "REGIONAL S.A.S", "rol": "comprador", "desde": "08:30", "hasta": "10:30"},
+        {"participante": "NEIRA YORK COFFEE", "rol": "comprador", "desde": "10:15", "hasta": "12:00"},
+        {"participante": "ENCADENAMIENTOS PRODUCTIVOS -  CAFE AROMAS DEL EJE / CAFÉ GRANEAO.", "rol": "comprador",
+         "desde": "10:15", "hasta": "11:15"},
+        {"participante": "CAFÉ ORIGEN DE LA MONTAÑA", "rol": "vendedor", "desde": "11:15"},
+        {"participante": "La vuelta", "rol": "vendedor", "desde": "12:00"},
+        {"participante": "Café Del Tajo", "rol": "vendedor", "desde": "11:15"},
+        {"participante": "Café Tradición Premium", "rol": "vendedor", "desde": "11:15"}
+    ],
+    "pares_prohibidos": [
+        {"comprador": "ENCADENAMIENTOS PRODUCTIVOS -  CAFE AROMAS DEL EJE / CAFÉ GRANEAO.", "vendedor": "Café Del Tajo"},
+        {"comprador": "ENCADENAMIENTOS PRODUCTIVOS -  CAFE AROMAS DEL EJE / CAFÉ GRANEAO.", "vendedor": "Café Tradición Premium"}
+    ],
+    "citas_fijas": [
+        {"vendedor": "D'CLEO COFFEE", "comprador": "BOX BRAND", "horario": "08:30"}
+    ]
+}
+
+
+def cargar_configuracion_evento(ruta_archivo: str) -> Optional[Dict]:
+    """Lee un archivo de configuración del evento en formato JSON o TOML"""
+    if not os.path.exists(ruta_archivo):
+        logger.error("Archivo de configuración %s no encontrado.", ruta_archivo)
+        return None
+
+    try:
+        if ruta_archivo.lower().endswith(".toml"):
+            import tomllib
+            with open(ruta_archivo, 'rb') as file:
+                return tomllib.load(file)
+        with open(ruta_archivo, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except Exception as e:
+        logger.error("Error al leer la configuración del evento: %s", e)
+        return None
+
+
+def _ejecutar_arranque(tarea: Tuple) -> Dict:
+    """Ejecuta un arranque del multiarranque en un proceso de trabajo"""
+    ruta_preferencias, configuracion, motor, semilla, tiempo_mejora, instrumentar, validar_cada_paso, sin_cache = tarea
+
+    organizador = AgendaRuedaNegocios(configuracion, semilla=semilla)
+    if instrumentar:
+        organizador.activar_instrumentacion()
+    if validar_cada_paso:
+        organizador.activar_validacion_continua()
+    # Los mensajes de cada proceso se silencian para no intercalarlos
+    configurar_registro(silencioso=True)
+    # El proceso principal ya compiló la instancia: cada arranque la lee sin volver a depurar el CSV
+    # (con sin_cache no se lee ni se escribe nada en la caché)
+    if sin_cache:
+        organizador.cargar_preferencias_archivo(ruta_preferencias)
+    else:
+        organizador.cargar_preferencias_compiladas(ruta_preferencias)
+    resultado = organizador.generar_agenda_optimizada(motor=motor, tiempo_mejora=tiempo_mejora)
+
+    return {
+        "semilla": semilla,
+        "motor": motor,
+        "preferencias_cumplidas": resultado["estadisticas"]["preferencias_cumplidas"],
+        "conflictos": resultado["validacion_conflictos"]["total_conflictos"],
+        "estado": organizador._copiar_estado_agenda(),
+        "extras": {clave: resultado[clave] for clave in ("aristas_sin_color", "mejora_local") if clave in resultado},
+        "instrumentacion": resultado.get("instrumentacion"),
+        "validacion_continua": organizador.validacion_continua
+    }
+
+
+def clave_cache_agenda(ruta_preferencias: str, configuracion: Dict, parametros: Dict) -> str:
+    """Hash SHA-256 del CSV de preferencias, la configuración, los parámetros (semilla, motor...) y VERSION_MOTOR"""
+    import hashlib
+    resumen = hashlib.sha256()
+    with open(ruta_preferencias, 'rb') as file:
+        for bloque in iter(lambda: file.read(1 << 16), b""):
+            resumen.update(bloque)
+    resumen.update(json.dumps(configuracion, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+    resumen.update(json.dumps(parametros, sort_keys=True).encode('utf-8'))
+    resumen.update(VERSION_MOTOR.encode('utf-8'))
+    return resumen.hexdigest()
+
+
 class AgendaRuedaNegocios:
-    def __init__(self):
-        self.inicio = datetime.strptime("08:30", "%H:%M")  # Extendido para Regional SAS
-        self.fin = datetime.strptime("13:00", "%H:%M")
-        self.duracion_cita = 15  # minutos - vuelto a 15 minutos
-        self.max_citas_vendedor = 11  # Sin restricción práctica - pueden tener hasta 11 citas
+    def __init__(self, configuracion: Optional[Dict] = None, semilla: Optional[int] = None):
+        # Generador aleatorio propio: con una semilla explícita las ejecuciones son reproducibles
+        self.semilla = semilla
+        self.rng = random.Random(semilla)
         self.num_vendedores = 25
         self.num_compradores = 10
-        self.vendedores_por_cita = 3  # Cambiado: 3 vendedores por cita por defecto (nueva restricción)
-        
-        # RESTRICCIÓN COFFEE BREAK: Slot 6 (10:00-10:15) inhabilitado
-        self.slot_coffee_break = 6  # 10:00-10:15 es Coffee Break
-        
-        # Calcular slots de tiempo disponibles
-        total_minutos = int((self.fin - self.inicio).total_seconds() / 60)
-        self.num_slots = total_minutos // self.duracion_cita
-        
-        # Generar horarios
-        self.horarios = self._generar_horarios()
         
         # Inicializar listas vacías - se llenarán al cargar preferencias
         self.vendedores = []
         self.compradores = []
         
-        # Agenda: {slot: [(comprador, [vendedor1, vendedor2, vendedor3]), ...]}
-        self.agenda = {i: [] for i in range(self.num_slots)}
+        # Nombres internados con identificadores enteros estables por rol
+        self.ids_vendedor = TablaIdentificadores()
+        self.ids_comprador = TablaIdentificadores()
         
-        # Tracking para evitar repeticiones comprador-vendedor
-        self.encuentros_realizados = {}  # {comprador: set(vendedores_ya_vistos)}
+        # Tracking para evitar repeticiones comprador-vendedor: matriz de bits comprador × vendedor
+        self.encuentros_realizados = MatrizEncuentros(self.ids_vendedor)
         
         # Contadores - se inicializarán después de cargar participantes
         self.citas_por_vendedor = {}
@@ -60,6 +230,118 @@ class AgendaRuedaNegocios:
         
         # Flag para saber si ya se cargaron los participantes
         self.participantes_cargados = False
+        self.ruta_preferencias = None
+
+        # Tiempos por fase y contadores del camino crítico (None = instrumentación apagada)
+        self.instrumentacion = None
+
+        # Violaciones detectadas en modo depuración (None = validación continua apagada)
+        self.validacion_continua = None
+
+        # Horario, descansos, ventanas de disponibilidad, pares prohibidos, citas fijas y límites
+        self._aplicar_configuracion(configuracion or CONFIGURACION_EVENTO_POR_DEFECTO)
+
+    def _aplicar_configuracion(self, configuracion: Dict):
+        """Compila la configuración del evento en tablas de restricciones"""
+        self.configuracion_evento = configuracion
+
+        horario = configuracion.get("horario", {})
+        self.inicio = datetime.strptime(horario.get("inicio", "08:30"), "%H:%M")
+        self.fin = datetime.strptime(horario.get("fin", "13:00"), "%H:%M")
+        self.duracion_cita = int(horario.get("duracion_cita", 15))  # minutos
+
+        limites = configuracion.get("limites", {})
+        self.max_citas_vendedor = int(limites.get("max_citas_vendedor", 11))
+        self.vendedores_por_cita = int(limites.get("max_vendedores_por_cita", 3))  # Máximo de vendedores por cita
+        self.max_citas_por_slot = int(limites.get("max_citas_por_slot", 10))
+        
+        # Calcular slots de tiempo disponibles
+        total_minutos = int((self.fin - self.inicio).total_seconds() / 60)
+        self.num_slots = total_minutos // self.duracion_cita
+        
+        # Generar horarios
+        self.horarios = self._generar_horarios()
+        self.mascara_todos_slots = (1 << self.num_slots) - 1
+
+        # Descansos (p. ej. COFFEE BREAK 10:00-10:15): slots inhabilitados para todos
+        self.slots_descanso = set()
+        for descanso in configuracion.get("descansos", []):
+            self.slots_descanso.update(self._slots_en_ventana(descanso.get("inicio"), descanso.get("fin")))
+        self.mascara_slots_habiles = self.mascara_todos_slots
+        for slot in self.slots_descanso:
+            self.mascara_slots_habiles &= ~(1 << slot)
+
+        # Matriz participante x slot de disponibilidad, una máscara de bits por participante y rol
+        self.disponibilidad_vendedor = {}
+        self.disponibilidad_comprador = {}
+        for ventana in configuracion.get("disponibilidad", []):
+            tabla = self.disponibilidad_vendedor if ventana.get("rol") == "vendedor" else self.disponibilidad_comprador
+            mascara = 0
+            for slot in self._slots_en_ventana(ventana.get("desde"), ventana.get("hasta")):
+                mascara |= 1 << slot
+            participante = ventana["participante"]
+            # Varias ventanas para el mismo participante se suman
+            tabla[participante] = (tabla.get(participante, 0) | mascara) & self.mascara_slots_habiles
+
+        # Conjunto hash de pares (comprador, vendedor) que no deben reunirse
+        self.pares_prohibidos = {
+            (par["comprador"], par["vendedor"]) for par in configuracion.get("pares_prohibidos", [])
+        }
+
+        # Citas fijas: (vendedor, comprador, slot)
+        self.citas_fijas = []
+        for cita in configuracion.get("citas_fijas", []):
+            slots = self._slots_en_ventana(cita.get("horario"), None)
+            if slots:
+                self.citas_fijas.append((cita["vendedor"], cita["comprador"], slots[0]))
+            else:
+                logger.warning("⚠️  Cita fija fuera del horario del evento: %s", cita)
+
+        # Agenda: {slot: [(comprador, [vendedor1, vendedor2, vendedor3]), ...]}
+        self.agenda = {i: [] for i in range(self.num_slots)}
+
+        # Índice de ocupación (se mantiene en cada alta de cita):
+        # - ocupacion_vendedores: {slot: {vendedor: comprador}}
+        # - ocupacion_compradores: {slot: {comprador: índice de la cita en self.agenda[slot]}}
+        # - slots_libres_*: {participante: máscara de bits con los slots libres (bit i = slot i)}
+        self.ocupacion_vendedores = {}
+        self.ocupacion_compradores = {}
+        self.slots_libres_vendedor = {}
+        self.slots_libres_comprador = {}
+        self._reconstruir_indice_ocupacion()
+
+    def _slots_en_ventana(self, desde: Optional[str], hasta: Optional[str]) -> List[int]:
+        """Slots que empiezan en o después de 'desde' y terminan en o antes de 'hasta' (HH:MM)"""
+        inicio_ventana = datetime.strptime(desde, "%H:%M") if desde else self.inicio
+        fin_ventana = datetime.strptime(hasta, "%H:%M") if hasta else self.fin
+        slots = []
+        for slot in range(self.num_slots):
+            inicio_slot = self.inicio + timedelta(minutes=slot * self.duracion_cita)
+            fin_slot = inicio_slot + timedelta(minutes=self.duracion_cita)
+            if inicio_slot >= inicio_ventana and fin_slot <= fin_ventana:
+                slots.append(slot)
+        return slots
+
+    def cargar_configuracion_evento(self, ruta_archivo: str) -> bool:
+        """Carga la configuración del evento (JSON/TOML) antes de generar la agenda"""
+        if any(self.agenda.values()):
+            logger.error("Error: la configuración del evento debe cargarse antes de generar la agenda.")
+            return False
+
+        configuracion = cargar_configuracion_evento(ruta_archivo)
+        if configuracion is None:
+            return False
+
+        try:
+            self._aplicar_configuracion(configuracion)
+        except (KeyError, ValueError, TypeError) as e:
+            logger.error("Error en la configuración del evento %s: %s", ruta_archivo, e)
+            return False
+
+        logger.info("Configuración del evento cargada desde %s: %s slots, %s en descanso, %s pares prohibidos, "
+                    "%s citas fijas", ruta_archivo, self.num_slots, len(self.slots_descanso),
+                    len(self.pares_prohibidos), len(self.citas_fijas))
+        return True
 
     def _generar_horarios(self) -> List[str]:
         """Genera la lista de horarios disponibles"""
@@ -74,134 +356,416 @@ class AgendaRuedaNegocios:
             
         return horarios
 
+    def _reconstruir_indice_ocupacion(self):
+        """Reconstruye el índice de ocupación a partir de self.agenda"""
+        self.ocupacion_vendedores = {slot: {} for slot in range(self.num_slots)}
+        self.ocupacion_compradores = {slot: {} for slot in range(self.num_slots)}
+        self.slots_libres_vendedor = {v: self.mascara_todos_slots for v in self.vendedores}
+        self.slots_libres_comprador = {c: self.mascara_todos_slots for c in self.compradores}
+
+        for slot, citas in self.agenda.items():
+            for i, (comprador, vendedores) in enumerate(citas):
+                self._indexar_comprador(slot, comprador, i)
+                for vendedor in vendedores:
+                    self._indexar_vendedor(slot, vendedor, comprador)
+
+        self._reconstruir_indice_candidatos()
+
+    def _reconstruir_indice_candidatos(self):
+        """Reconstruye el índice invertido comprador→vendedores solicitantes y los candidatos por (comprador, slot)"""
+        # Índice invertido en el orden de self.preferencias_citas: {comprador: [vendedores que lo solicitaron]}
+        self.solicitantes_por_comprador = {}
+        for vendedor, compradores_pref in self.preferencias_citas.items():
+            for comprador in compradores_pref:
+                self.solicitantes_por_comprador.setdefault(comprador, []).append(vendedor)
+        self._orden_solicitantes = {
+            comprador: {v: i for i, v in enumerate(vendedores)}
+            for comprador, vendedores in self.solicitantes_por_comprador.items()
+        }
+        self._posicion_vendedor = {v: i for i, v in enumerate(self.vendedores)}
+
+        # Candidatos por (comprador, slot): vendedores que solicitaron al comprador, disponibles
+        # en el horario, libres en el slot y por debajo de max_citas_vendedor
+        # (se calcula una máscara por vendedor y un conjunto de elegibles por slot; cada
+        # entrada es la intersección con los solicitantes del comprador)
+        elegibles_por_slot = [set() for _ in range(self.num_slots)]
+        for vendedor in self.preferencias_citas:
+            if self.citas_por_vendedor.get(vendedor, self.max_citas_vendedor) >= self.max_citas_vendedor:
+                continue
+            mascara = (self.slots_libres_vendedor.get(vendedor, self.mascara_todos_slots) &
+                       self.disponibilidad_vendedor.get(vendedor, self.mascara_slots_habiles))
+            while mascara:
+                bit = mascara & -mascara
+                slot = bit.bit_length() - 1
+                if slot >= self.num_slots:
+                    break
+                elegibles_por_slot[slot].add(vendedor)
+                mascara ^= bit
+
+        self.candidatos_por_comprador_slot = {}
+        for comprador, vendedores in self.solicitantes_por_comprador.items():
+            solicitantes = set(vendedores)
+            for slot, elegibles in enumerate(elegibles_por_slot):
+                self.candidatos_por_comprador_slot[(comprador, slot)] = solicitantes & elegibles
+
+    def _actualizar_candidatos_tras_cita(self, slot: int, vendedor: str):
+        """Retira al vendedor de los candidatos del slot y, si llegó al tope de citas, de todos los slots"""
+        compradores_pref = self.preferencias_citas.get(vendedor, [])
+        if self.citas_por_vendedor[vendedor] >= self.max_citas_vendedor:
+            slots = range(self.num_slots)
+        else:
+            slots = (slot,)
+        for comprador in compradores_pref:
+            for s in slots:
+                candidatos = self.candidatos_por_comprador_slot.get((comprador, s))
+                if candidatos is not None:
+                    candidatos.discard(vendedor)
+
+    def _solicitantes_disponibles(self, comprador: str, slot: int, orden_vendedores: bool = False) -> List[str]:
+        """Vendedores que solicitaron al comprador y pueden tomar cita en el slot, en O(candidatos)
+
+        Por defecto se devuelven en el orden de las preferencias; con orden_vendedores=True,
+        en el orden de self.vendedores.
+        """
+        candidatos = self.candidatos_por_comprador_slot.get((comprador, slot))
+        if not candidatos:
+            return []
+        orden = self._posicion_vendedor if orden_vendedores else self._orden_solicitantes[comprador]
+        return sorted(candidatos, key=orden.__getitem__)
+
+    def _indexar_vendedor(self, slot: int, vendedor: str, comprador: str):
+        """Marca al vendedor como ocupado con el comprador en el slot"""
+        self.ocupacion_vendedores[slot][vendedor] = comprador
+        libres = self.slots_libres_vendedor.get(vendedor, self.mascara_todos_slots)
+        self.slots_libres_vendedor[vendedor] = libres & ~(1 << slot)
+
+    def _indexar_comprador(self, slot: int, comprador: str, indice_cita: int):
+        """Marca al comprador como ocupado en el slot"""
+        self.ocupacion_compradores[slot][comprador] = indice_cita
+        libres = self.slots_libres_comprador.get(comprador, self.mascara_todos_slots)
+        self.slots_libres_comprador[comprador] = libres & ~(1 << slot)
+
+    def _vendedor_ocupado(self, vendedor: str, slot: int) -> bool:
+        """Indica en O(1) si el vendedor ya tiene cita en el slot"""
+        return not (self.slots_libres_vendedor.get(vendedor, self.mascara_todos_slots) >> slot) & 1
+
+    def _comprador_ocupado(self, comprador: str, slot: int) -> bool:
+        """Indica en O(1) si el comprador ya tiene cita en el slot"""
+        return not (self.slots_libres_comprador.get(comprador, self.mascara_todos_slots) >> slot) & 1
+
+    def _vendedores_ocupados_en_slot(self, slot: int) -> int:
+        """Cantidad de vendedores con cita en el slot"""
+        return len(self.ocupacion_vendedores[slot])
+
+    def _registrar_cita(self, slot: int, comprador: str, vendedores: List[str]):
+        """Agrega una cita a la agenda y actualiza contadores, encuentros e índice de ocupación"""
+        self.agenda[slot].append(Cita(comprador, vendedores))
+        self._indexar_comprador(slot, comprador, len(self.agenda[slot]) - 1)
+        for vendedor in vendedores:
+            self._indexar_vendedor(slot, vendedor, comprador)
+            self.citas_por_vendedor[vendedor] += 1
+            self.encuentros_realizados.agregar(comprador, vendedor)
+            self._actualizar_candidatos_tras_cita(slot, vendedor)
+        self.citas_por_comprador[comprador] += 1
+
+    def _agregar_vendedor_a_cita(self, slot: int, indice_cita: int, vendedor: str):
+        """Agrega un vendedor a una cita existente y actualiza contadores, encuentros e índice"""
+        cita = self.agenda[slot][indice_cita]
+        cita.vendedores.append(vendedor)
+        comprador = cita.comprador
+        self._indexar_vendedor(slot, vendedor, comprador)
+        self.citas_por_vendedor[vendedor] += 1
+        self.encuentros_realizados.agregar(comprador, vendedor)
+        self._actualizar_candidatos_tras_cita(slot, vendedor)
+
+    def _retirar_vendedor_de_cita(self, slot: int, vendedor: str) -> Optional[str]:
+        """Retira al vendedor de su cita en el slot (eliminando la cita si queda vacía)
+
+        Actualiza contadores, encuentros, preferencias cumplidas e índices. Devuelve el
+        comprador de la cita o None si el vendedor no tenía cita en el slot.
+        """
+        comprador = self.ocupacion_vendedores[slot].pop(vendedor, None)
+        if comprador is None:
+            return None
+
+        indice_cita = self.ocupacion_compradores[slot][comprador]
+        cita = self.agenda[slot][indice_cita]
+        if len(cita.vendedores) > 1:
+            cita.vendedores.remove(vendedor)
+        else:
+            # La cita queda vacía: eliminarla y reindexar las citas posteriores del slot
+            del self.agenda[slot][indice_cita]
+            del self.ocupacion_compradores[slot][comprador]
+            self.slots_libres_comprador[comprador] = self.slots_libres_comprador.get(comprador, 0) | (1 << slot)
+            self.citas_por_comprador[comprador] -= 1
+            for i in range(indice_cita, len(self.agenda[slot])):
+                self.ocupacion_compradores[slot][self.agenda[slot][i][0]] = i
+
+        estaba_en_tope = self.citas_por_vendedor[vendedor] >= self.max_citas_vendedor
+        self.slots_libres_vendedor[vendedor] = self.slots_libres_vendedor.get(vendedor, 0) | (1 << slot)
+        self.citas_por_vendedor[vendedor] -= 1
+        self.encuentros_realizados.quitar(comprador, vendedor)
+        self.citas_preferencia_asignadas.discard((vendedor, comprador))
+        self._restaurar_candidatos_tras_retiro(slot, vendedor, estaba_en_tope)
+        return comprador
+
+    def _restaurar_candidatos_tras_retiro(self, slot: int, vendedor: str, estaba_en_tope: bool):
+        """Vuelve a incluir al vendedor en los candidatos de los slots donde queda libre"""
+        if self.citas_por_vendedor[vendedor] >= self.max_citas_vendedor:
+            return
+        slots = range(self.num_slots) if estaba_en_tope else (slot,)
+        for s in slots:
+            if (self._vendedor_ocupado(vendedor, s) or
+                    not self._verificar_disponibilidad_horaria(vendedor, s, es_vendedor=True)):
+                continue
+            for comprador in self.preferencias_citas.get(vendedor, []):
+                self.candidatos_por_comprador_slot.setdefault((comprador, s), set()).add(vendedor)
+
+    def _leer_csv_preferencias(self, ruta_archivo: str) -> Tuple[List[str], List[str], Dict[str, List[str]]]:
+        """Lee el CSV: (vendedores, compradores, preferencias) en orden de aparición, sin duplicados"""
+        # Diccionarios para recopilar nombres únicos en orden de aparición
+        # (un set haría depender el orden de PYTHONHASHSEED)
+        vendedores_set = {}
+        compradores_set = {}
+        preferencias = {}
+        
+        with open(ruta_archivo, 'r', encoding='utf-8') as file:
+            reader = csv.reader(file)
+            
+            # Saltar encabezado si existe
+            primera_fila = next(reader, None)
+            filas = reader
+            if primera_fila and not ('vendedor' in primera_fila[0].lower() or 'nombre' in primera_fila[0].lower()):
+                # No era encabezado, procesarla como dato
+                filas = itertools.chain([primera_fila], reader)
+            
+            for row in filas:
+                if len(row) >= 2:
+                    vendedor = self.ids_vendedor.internar(row[0].strip())
+                    comprador = self.ids_comprador.internar(row[1].strip())
+                    if vendedor and comprador:
+                        vendedores_set[vendedor] = None
+                        compradores_set[comprador] = None
+                        # dict como conjunto ordenado: descarta repetidos en O(1)
+                        preferencias.setdefault(vendedor, {})[comprador] = None
+        
+        return list(vendedores_set), list(compradores_set), {v: list(c) for v, c in preferencias.items()}
+
     def cargar_preferencias_archivo(self, ruta_archivo: str) -> bool:
         """Carga las preferencias de citas desde un archivo CSV"""
         try:
             if not os.path.exists(ruta_archivo):
-                print(f"Archivo {ruta_archivo} no encontrado.")
+                logger.error("Archivo %s no encontrado.", ruta_archivo)
                 return False
             
-            # Conjuntos temporales para recopilar nombres únicos
-            vendedores_set = set()
-            compradores_set = set()
-            
-            with open(ruta_archivo, 'r', encoding='utf-8') as file:
-                reader = csv.reader(file)
-                
-                # Saltar encabezado si existe
-                primera_fila = next(reader, None)
-                if primera_fila and ('vendedor' in primera_fila[0].lower() or 'nombre' in primera_fila[0].lower()):
-                    pass  # Era encabezado, continuar con los datos
-                else:
-                    # No era encabezado, procesarla como dato
-                    if primera_fila and len(primera_fila) >= 2:
-                        vendedor = primera_fila[0].strip()
-                        comprador = primera_fila[1].strip()
-                        if vendedor and comprador:
-                            vendedores_set.add(vendedor)
-                            compradores_set.add(comprador)
-                            if vendedor not in self.preferencias_citas:
-                                self.preferencias_citas[vendedor] = []
-                            if comprador not in self.preferencias_citas[vendedor]:
-                                self.preferencias_citas[vendedor].append(comprador)
-                
-                # Procesar el resto del archivo
-                for row in reader:
-                    if len(row) >= 2:
-                        vendedor = row[0].strip()
-                        comprador = row[1].strip()
-                        if vendedor and comprador:
-                            vendedores_set.add(vendedor)
-                            compradores_set.add(comprador)
-                            if vendedor not in self.preferencias_citas:
-                                self.preferencias_citas[vendedor] = []
-                            if comprador not in self.preferencias_citas[vendedor]:
-                                self.preferencias_citas[vendedor].append(comprador)
-            
-            # Actualizar listas de participantes con nombres reales
-            self.vendedores = list(vendedores_set)
-            self.compradores = list(compradores_set)
-            
-            # Completar con nombres genéricos si es necesario
-            while len(self.vendedores) < self.num_vendedores:
-                nuevo_nombre = f"Vendedor_Extra_{len(self.vendedores)+1:02d}"
-                self.vendedores.append(nuevo_nombre)
-            
-            while len(self.compradores) < self.num_compradores:
-                nuevo_nombre = f"Comprador_Extra_{len(self.compradores)+1:02d}"
-                self.compradores.append(nuevo_nombre)
-            
-            # Inicializar contadores con los nombres reales
-            self.citas_por_vendedor = {v: 0 for v in self.vendedores}
-            self.citas_por_comprador = {c: 0 for c in self.compradores}
-            
-            # Inicializar tracking de encuentros para evitar repeticiones
-            self.encuentros_realizados = {c: set() for c in self.compradores}
+            vendedores, compradores, preferencias = self._leer_csv_preferencias(ruta_archivo)
+            self._instalar_participantes(vendedores, compradores, preferencias, ruta_archivo)
+            return True
             
-            # Actualizar números reales
-            self.num_vendedores = len(self.vendedores)
-            self.num_compradores = len(self.compradores)
+        except Exception as e:
+            logger.error("Error al cargar archivo de preferencias: %s", e)
+            return False
+
+    def cargar_preferencias_compiladas(self, ruta_archivo: str, carpeta_cache: str = CARPETA_CACHE) -> bool:
+        """Como cargar_preferencias_archivo, pero a través de una instancia binaria precompilada
+
+        La instancia se guarda en carpeta_cache/instancias con el hash SHA-256 del CSV y de la
+        configuración del evento. Si el hash coincide se carga sin leer el CSV; si no (o si no
+        existe), se lee el CSV y se vuelve a compilar.
+        """
+        try:
+            if not os.path.exists(ruta_archivo):
+                logger.error("Archivo %s no encontrado.", ruta_archivo)
+                return False
             
-            self.participantes_cargados = True
+            hash_fuente = hash_origen(ruta_archivo, self.configuracion_evento)
+            ruta_compilada = ruta_instancia(ruta_archivo, carpeta_cache)
+            instancia = leer_instancia_compilada(ruta_compilada, hash_fuente)
+            if instancia is not None:
+                logger.info("⚡ Instancia precompilada: %s", ruta_compilada)
+                vendedores = [self.ids_vendedor.internar(v) for v in instancia["vendedores"]]
+                compradores = [self.ids_comprador.internar(c) for c in instancia["compradores"]]
+                internar_comprador = self.ids_comprador.internar
+                preferencias = {
+                    self.ids_vendedor.internar(v): [internar_comprador(c) for c in lista]
+                    for v, lista in instancia["preferencias"].items()
+                }
+            else:
+                vendedores, compradores, preferencias = self._leer_csv_preferencias(ruta_archivo)
+                try:
+                    guardar_instancia_compilada(ruta_compilada, hash_fuente, vendedores, compradores,
+                                                preferencias, self.configuracion_evento)
+                    logger.info("💾 Instancia compilada en: %s", ruta_compilada)
+                except OSError as e:
+                    logger.warning("⚠️  No se pudo guardar la instancia compilada: %s", e)
             
-            total_preferencias = sum(len(compradores) for compradores in self.preferencias_citas.values())
-            print(f"Cargadas {total_preferencias} preferencias de citas de {len(self.preferencias_citas)} vendedores desde {ruta_archivo}")
-            print(f"Vendedores encontrados: {len(vendedores_set)}")
-            print(f"Compradores encontrados: {len(compradores_set)}")
+            self._instalar_participantes(vendedores, compradores, preferencias, ruta_archivo)
             return True
             
         except Exception as e:
-            print(f"Error al cargar archivo de preferencias: {e}")
+            logger.error("Error al cargar archivo de preferencias: %s", e)
             return False
 
+    def _instalar_participantes(self, vendedores: List[str], compradores: List[str],
+                                preferencias: Dict[str, List[str]], ruta_archivo: str):
+        """Incorpora los participantes y preferencias leídos e inicializa contadores e índices"""
+        for vendedor, compradores_pref in preferencias.items():
+            existentes = self.preferencias_citas.setdefault(vendedor, [])
+            for comprador in compradores_pref:
+                if comprador not in existentes:
+                    existentes.append(comprador)
+        
+        # Actualizar listas de participantes con nombres reales
+        self.vendedores = list(vendedores)
+        self.compradores = list(compradores)
+        self.ruta_preferencias = ruta_archivo
+        
+        # Completar con nombres genéricos si es necesario
+        while len(self.vendedores) < self.num_vendedores:
+            nuevo_nombre = f"Vendedor_Extra_{len(self.vendedores)+1:02d}"
+            self.vendedores.append(self.ids_vendedor.internar(nuevo_nombre))
+        
+        while len(self.compradores) < self.num_compradores:
+            nuevo_nombre = f"Comprador_Extra_{len(self.compradores)+1:02d}"
+            self.compradores.append(self.ids_comprador.internar(nuevo_nombre))
+        
+        # Inicializar contadores con los nombres reales
+        self.citas_por_vendedor = {v: 0 for v in self.vendedores}
+        self.citas_por_comprador = {c: 0 for c in self.compradores}
+        
+        # Inicializar tracking de encuentros para evitar repeticiones
+        self.encuentros_realizados = MatrizEncuentros(self.ids_vendedor, self.compradores)
+        self._reconstruir_indice_ocupacion()
+        
+        # Actualizar números reales
+        self.num_vendedores = len(self.vendedores)
+        self.num_compradores = len(self.compradores)
+        
+        self.participantes_cargados = True
+        
+        total_preferencias = sum(len(compradores) for compradores in self.preferencias_citas.values())
+        logger.info("Cargadas %s preferencias de citas de %s vendedores desde %s", total_preferencias, len(self.preferencias_citas), ruta_archivo)
+        logger.info("Vendedores encontrados: %s", len(vendedores))
+        logger.info("Compradores encontrados: %s", len(compradores))
+
     def _inicializar_participantes_por_defecto(self):
         """Inicializa participantes con nombres genéricos si no se cargaron preferencias"""
         if not self.participantes_cargados:
-            self.vendedores = [f"Vendedor_{i+1:02d}" for i in range(self.num_vendedores)]
-            self.compradores = [f"Comprador_{i+1:02d}" for i in range(self.num_compradores)]
+            self.vendedores = [self.ids_vendedor.internar(f"Vendedor_{i+1:02d}") for i in range(self.num_vendedores)]
+            self.compradores = [self.ids_comprador.internar(f"Comprador_{i+1:02d}") for i in range(self.num_compradores)]
             self.citas_por_vendedor = {v: 0 for v in self.vendedores}
             self.citas_por_comprador = {c: 0 for c in self.compradores}
+            self._reconstruir_indice_ocupacion()
             self.participantes_cargados = True
 
+    # ------------------------------------------------------------------
+    # Instrumentación: tiempos por fase y contadores del camino crítico
+    # ------------------------------------------------------------------
+
+    def activar_instrumentacion(self, activa: bool = True):
+        """Activa (o apaga) la medición de fases, llamadas y motivos de rechazo
+
+        Con la instrumentación apagada los métodos del camino crítico no se tocan, así que
+        no hay costo alguno. Al activarla se instalan envoltorios en la instancia que cuentan
+        las llamadas de METODOS_INSTRUMENTADOS y clasifican cada rechazo de
+        _puede_agendar_cita_grupo según MOTIVOS_RECHAZO.
+        """
+        for nombre in METODOS_INSTRUMENTADOS:
+            self.__dict__.pop(nombre, None)
+        if not activa:
+            self.instrumentacion = None
+            return
+
+        self.instrumentacion = {
+            "fases": {},
+            "llamadas": {nombre: 0 for nombre in METODOS_INSTRUMENTADOS},
+            "rechazos": {motivo: 0 for motivo in MOTIVOS_RECHAZO}
+        }
+        llamadas = self.instrumentacion["llamadas"]
+        rechazos = self.instrumentacion["rechazos"]
+
+        def contar(nombre, metodo):
+            def envoltorio(*args, **kwargs):
+                llamadas[nombre] += 1
+                return metodo(*args, **kwargs)
+            return envoltorio
+
+        for nombre in METODOS_INSTRUMENTADOS:
+            setattr(self, nombre, contar(nombre, getattr(type(self), nombre).__get__(self)))
+
+        puede_agendar = type(self)._puede_agendar_cita_grupo.__get__(self)
+
+        def puede_agendar_instrumentado(vendedores, comprador, slot):
+            llamadas["_puede_agendar_cita_grupo"] += 1
+            if puede_agendar(vendedores, comprador, slot):
+                return True
+            rechazos[self._motivo_rechazo_cita_grupo(vendedores, comprador, slot)] += 1
+            return False
+
+        self._puede_agendar_cita_grupo = puede_agendar_instrumentado
+
+    def _motivo_rechazo_cita_grupo(self, vendedores: List[str], comprador: str, slot: int) -> str:
+        """Primer motivo por el que _puede_agendar_cita_grupo rechaza la cita (mismo orden de verificación)
+
+        Consulta las tablas directamente para no inflar los contadores de llamadas.
+        """
+        habiles = self.mascara_slots_habiles
+        if not (self.disponibilidad_comprador.get(comprador, habiles) >> slot) & 1:
+            return "ventana"
+        if any(not (self.disponibilidad_vendedor.get(v, habiles) >> slot) & 1 for v in vendedores):
+            return "ventana"
+        if any((comprador, v) in self.pares_prohibidos for v in vendedores):
+            return "prohibido"
+        if len(vendedores) > self.vendedores_por_cita or any(
+                self.citas_por_vendedor.get(v, self.max_citas_vendedor) >= self.max_citas_vendedor for v in vendedores):
+            return "tope"
+        if comprador in self.ocupacion_compradores[slot] or any(v in self.ocupacion_vendedores[slot] for v in vendedores):
+            return "ocupado"
+        return "repetido"
+
+    def _iniciar_fase(self, nombre: str) -> Optional[Tuple[str, float, float]]:
+        """Marca el inicio de una fase medida; devuelve None si la instrumentación está apagada"""
+        if self.instrumentacion is None:
+            return None
+        return nombre, time.perf_counter(), time.process_time()
+
+    def _cerrar_fase(self, marca: Optional[Tuple[str, float, float]]):
+        """Acumula el tiempo de pared y de CPU de la fase iniciada con _iniciar_fase"""
+        if marca is None or self.instrumentacion is None:
+            return
+        nombre, inicio, inicio_cpu = marca
+        fase = self.instrumentacion["fases"].setdefault(nombre, {"segundos": 0.0, "segundos_cpu": 0.0, "veces": 0})
+        fase["segundos"] += time.perf_counter() - inicio
+        fase["segundos_cpu"] += time.process_time() - inicio_cpu
+        fase["veces"] += 1
+
+    def _resumen_instrumentacion(self) -> Dict:
+        """Copia serializable de la instrumentación para el resultado"""
+        return {
+            "fases": {nombre: {"segundos": round(fase["segundos"], 6), "segundos_cpu": round(fase["segundos_cpu"], 6),
+                               "veces": fase["veces"]}
+                      for nombre, fase in self.instrumentacion["fases"].items()},
+            "llamadas": dict(self.instrumentacion["llamadas"]),
+            "rechazos": dict(self.instrumentacion["rechazos"])
+        }
+
+    def _acumular_instrumentacion(self, medicion: Dict):
+        """Suma a esta instancia una medición de _resumen_instrumentacion (p. ej. de un arranque en otro proceso)"""
+        for nombre, fase in medicion["fases"].items():
+            acumulada = self.instrumentacion["fases"].setdefault(nombre, {"segundos": 0.0, "segundos_cpu": 0.0, "veces": 0})
+            for campo in ("segundos", "segundos_cpu", "veces"):
+                acumulada[campo] += fase[campo]
+        for grupo in ("llamadas", "rechazos"):
+            for nombre, veces in medicion[grupo].items():
+                self.instrumentacion[grupo][nombre] = self.instrumentacion[grupo].get(nombre, 0) + veces
+
     def _verificar_disponibilidad_horaria(self, participante: str, slot: int, es_vendedor: bool = True) -> bool:
         """Verifica si un participante está disponible en el horario del slot específico"""
-        # RESTRICCIÓN COFFEE BREAK: Slot 6 (10:00-10:15) inhabilitado para todos
-        if slot == self.slot_coffee_break:
-            return False
-            
-        # NUEVA RESTRICCIÓN: Regional SAS solo disponible de 8:30 a 10:30 (slots 0-7 con 15 min cada uno desde 8:30)
-        if participante == "REGIONAL S.A.S" and not es_vendedor:  # Es comprador
-            return slot <= 7  # Slots 0-7 cubren desde 8:30 hasta 10:15
-        
-        # Restricciones horarias específicas reactivadas
-        if participante == "NEIRA YORK COFFEE" and not es_vendedor:  # Es comprador
-            # Ajustado: NEIRA YORK COFFEE de 10:15 a 12:00 (slots 7-13 con nuevo inicio 8:30)
-            return 7 <= slot <= 13  # Slots 7-13 cubren desde 10:15 hasta 12:00
-        
-        if participante == "ENCADENAMIENTOS PRODUCTIVOS -  CAFE AROMAS DEL EJE / CAFÉ GRANEAO." and not es_vendedor:  # Es comprador
-            # Ajustado: ENCADENAMIENTOS PRODUCTIVOS de 10:15 a 11:15 (slots 7-10 con nuevo inicio 8:30)
-            return 7 <= slot <= 10  # Slots 7-10 cubren desde 10:15 hasta 11:15
-        
-        # NUEVA RESTRICCIÓN: Café Origen de la Montaña ES ENCADENAMIENTOS PRODUCTIVOS
-        if participante == "CAFÉ ORIGEN DE LA MONTAÑA" and es_vendedor:  # Es vendedor
-            # Debe actuar primero como comprador (ENCADENAMIENTOS), luego como vendedor
-            # Como vendedor, disponible después de sus citas como comprador (después slot 10)
-            return slot >= 11  # Disponible después de 11:15
-        
-        if participante == "La vuelta" and es_vendedor:  # Es vendedor
-            # Ajustado: La vuelta de 12:00 a 13:00 (slots 14-17 con nuevo inicio 8:30)
-            return slot >= 14  # Slots 14-17 cubren desde 12:00 hasta 13:00
-        
-        if participante == "Café Del Tajo" and es_vendedor:  # Es vendedor
-            # Ajustado: Café Del Tajo de 11:15 a 13:00 (slots 11-17 con nuevo inicio 8:30)
-            return slot >= 11  # Slots 11-17 cubren desde 11:15 hasta 13:00
-        
-        if participante == "Café Tradición Premium" and es_vendedor:  # Es vendedor
-            # Ajustado: Café Tradición Premium de 11:15 a 13:00 (slots 11-17 con nuevo inicio 8:30)
-            return slot >= 11  # Slots 11-17 cubren desde 11:15 hasta 13:00
-        
-        # Para todos los demás participantes, siempre disponibles
-        return True
+        # Consulta a la matriz de disponibilidad compilada desde la configuración del evento.
+        # Los participantes sin ventana propia están disponibles en todos los slots hábiles
+        # (los descansos, como el COFFEE BREAK, ya están excluidos de las máscaras)
+        tabla = self.disponibilidad_vendedor if es_vendedor else self.disponibilidad_comprador
+        return bool((tabla.get(participante, self.mascara_slots_habiles) >> slot) & 1)
 
     def _puede_agendar_cita_grupo(self, vendedores: List[str], comprador: str, slot: int) -> bool:
         """Verifica si se puede agendar una cita grupal (3 vendedores + 1 comprador)"""
@@ -215,38 +779,39 @@ class AgendaRuedaNegocios:
             if not self._verificar_disponibilidad_horaria(vendedor, slot, es_vendedor=True):
                 return False
         
-        # RESTRICCIÓN ESPECÍFICA: ENCADENAMIENTOS PRODUCTIVOS no se reúne con Café Del Tajo ni Café Tradición Premium
-        if comprador == "ENCADENAMIENTOS PRODUCTIVOS -  CAFE AROMAS DEL EJE / CAFÉ GRANEAO.":
+        # RESTRICCIÓN ESPECÍFICA: pares comprador-vendedor prohibidos por la configuración
+        # (p. ej. ENCADENAMIENTOS PRODUCTIVOS no se reúne con Café Del Tajo ni Café Tradición Premium)
+        if self.pares_prohibidos:
             for vendedor in vendedores:
-                if vendedor in ["Café Del Tajo", "Café Tradición Premium"]:
+                if (comprador, vendedor) in self.pares_prohibidos:
                     return False  # No permitir esta combinación
         
-        # NUEVA RESTRICCIÓN: Verificar que solo hay 3 vendedores máximo por cita
-        if len(vendedores) > 3:
-            return False  # Máximo 3 vendedores por cita
+        # NUEVA RESTRICCIÓN: Verificar el máximo de vendedores por cita
+        if len(vendedores) > self.vendedores_por_cita:
+            return False  # Máximo 3 vendedores por cita (por defecto)
         
         # Verificar límite de citas por vendedor
         for vendedor in vendedores:
-            if vendedor not in self.vendedores:
+            if vendedor not in self.citas_por_vendedor:
                 return False
             if self.citas_por_vendedor[vendedor] >= self.max_citas_vendedor:
                 return False
-        
+
+        # Verificar que el comprador no esté ocupado en este slot (consulta O(1) al índice)
+        if self._comprador_ocupado(comprador, slot):
+            return False  # Este comprador ya tiene una cita en este slot
+
         # NUEVA VERIFICACIÓN: No permitir que un vendedor tenga citas simultáneas con diferentes compradores
         for vendedor in vendedores:
-            for cita_comprador, cita_vendedores in self.agenda[slot]:
-                if vendedor in cita_vendedores and cita_comprador != comprador:
-                    return False  # Este vendedor ya tiene una cita con otro comprador en este slot
+            if self._vendedor_ocupado(vendedor, slot):
+                return False  # Este vendedor ya tiene una cita con otro comprador en este slot
         
-        # Verificar que el comprador no esté ocupado en este slot
-        for cita_comprador, cita_vendedores in self.agenda[slot]:
-            if cita_comprador == comprador:
-                return False  # Este comprador ya tiene una cita en este slot
-        
-        # NUEVA VERIFICACIÓN: No repetir encuentros comprador-vendedor
-        if comprador in self.encuentros_realizados:
+        # NUEVA VERIFICACIÓN: No repetir encuentros comprador-vendedor (fila de la matriz de bits)
+        encuentros = self.encuentros_realizados.fila(comprador)
+        if encuentros:
+            ids = self.ids_vendedor.ids
             for vendedor in vendedores:
-                if vendedor in self.encuentros_realizados[comprador]:
+                if (encuentros >> ids[vendedor]) & 1:
                     return False  # Este comprador ya se reunió con este vendedor
         
         return True
@@ -256,17 +821,15 @@ class AgendaRuedaNegocios:
         if excluir is None:
             excluir = set()
         
-        # COFFEE BREAK: Slot 6 (10:00-10:15) inhabilitado
-        if slot == self.slot_coffee_break:
+        # COFFEE BREAK y demás descansos: slots inhabilitados
+        if slot in self.slots_descanso:
             return []
         
         disponibles = []
-        
+
         # Vendedores ya ocupados en este slot (cualquier cita en este slot los hace no disponibles)
-        ocupados = set()
-        for _, vendedores_en_slot in self.agenda[slot]:
-            ocupados.update(vendedores_en_slot)
-        
+        ocupados = self.ocupacion_vendedores[slot]
+
         for vendedor in self.vendedores:
             if (vendedor not in ocupados and 
                 vendedor not in excluir and
@@ -276,44 +839,488 @@ class AgendaRuedaNegocios:
         
         return disponibles
 
-    def generar_agenda_optimizada(self) -> Dict:
-        """Genera la agenda optimizada distribuyendo las citas equitativamente"""
-        print("Generando agenda optimizada...")
+    def generar_agenda_optimizada(self, motor: str = "voraz", tiempo_mejora: float = 0.0,
+                                  callback_progreso=None, cancelar=None) -> Dict:
+        """Genera la agenda optimizada distribuyendo las citas equitativamente
+
+        motor: "voraz" (llenado estratégico por slot), "flujo" (flujo de costo mínimo por slot)
+        o "coloreo" (coloreo global de las preferencias)
+        tiempo_mejora: segundos para la fase de mejora por búsqueda local (0 = sin mejora);
+        callback_progreso y cancelar se pasan a mejorar_agenda
+        """
+        if motor not in MOTORES_AGENDA:
+            raise ValueError(f"Motor desconocido: {motor}. Opciones: {', '.join(MOTORES_AGENDA)}")
+        logger.info("Generando agenda optimizada (motor: %s)...", motor)
         
         # Asegurarse de que los participantes estén inicializados
         self._inicializar_participantes_por_defecto()
         
         # Solo asignar citas con preferencias específicas (sin citas aleatorias)
-        print("Procesando preferencias específicas...")
-        self._asignar_citas_con_preferencias()
+        logger.info("Procesando preferencias específicas...")
+        marca = self._iniciar_fase(f"asignacion_{motor}")
+        if motor == "flujo":
+            self._asignar_citas_flujo_costo_minimo()
+        elif motor == "coloreo":
+            self._asignar_citas_coloreo_global()
+        else:
+            self._asignar_citas_con_preferencias()
+        self._cerrar_fase(marca)
+        
+        # Fase opcional de mejora: cambiar segundos de cómputo por más preferencias cumplidas
+        mejora_local = None
+        if tiempo_mejora > 0:
+            logger.info("Mejorando agenda por búsqueda local (%g s)...", tiempo_mejora)
+            marca = self._iniciar_fase("mejora_local")
+            mejora_local = self.mejorar_agenda(tiempo_mejora, callback_progreso, cancelar)
+            self._cerrar_fase(marca)
+            logger.info("   Preferencias cumplidas: %s → %s", mejora_local['preferencias_cumplidas_inicial'],
+                        mejora_local['preferencias_cumplidas_final'])
+        
+        resultado = self._construir_resultado()
+        if motor == "coloreo":
+            resultado["aristas_sin_color"] = self.aristas_sin_color
+        if mejora_local is not None:
+            resultado["mejora_local"] = mejora_local
+        if self.instrumentacion is not None:
+            resultado["instrumentacion"] = self._resumen_instrumentacion()
         
-        # Validar que no hay conflictos de vendedores con citas simultáneas
-        print("\nValidando agenda para conflictos de vendedores...")
-        validacion_conflictos = self._validar_agenda_sin_conflictos()
+        return resultado
+
+    def _construir_resultado(self) -> Dict:
+        """Valida la agenda actual y la formatea como resultado"""
+        # Validar todas las restricciones (cruces, ventanas, repeticiones, límites y pares prohibidos)
+        logger.info("\nValidando agenda...")
+        marca = self._iniciar_fase("validacion")
+        validacion_conflictos = self.validar_agenda()
+        self._cerrar_fase(marca)
         
         if validacion_conflictos["tiene_conflictos"]:
-            print(f"⚠️  CONFLICTOS DETECTADOS: {validacion_conflictos['total_conflictos']} conflictos encontrados")
-            print(f"   Vendedores afectados: {', '.join(validacion_conflictos['vendedores_afectados'])}")
+            logger.warning("⚠️  CONFLICTOS DETECTADOS: %s conflictos encontrados (%s)", validacion_conflictos['total_conflictos'],
+                           ', '.join(f"{tipo} {n}" for tipo, n in validacion_conflictos['por_tipo'].items() if n))
+            logger.warning("   Vendedores afectados: %s", ', '.join(validacion_conflictos['vendedores_afectados']))
             for conflicto in validacion_conflictos["conflictos"]:
-                print(f"   🔴 {conflicto['horario']}: {', '.join(conflicto['vendedores_en_conflicto'])} en conflicto")
-                print(f"      - Cita 1: {conflicto['cita1']['comprador']} con {conflicto['cita1']['vendedores']}")
-                print(f"      - Cita 2: {conflicto['cita2']['comprador']} con {conflicto['cita2']['vendedores']}")
+                logger.warning("   🔴 %s %s: %s con %s (%s)", conflicto['horario'], conflicto['tipo'],
+                               conflicto['comprador'], ', '.join(conflicto['vendedores']), conflicto['detalle'])
         else:
-            print("✅ Validación exitosa: No se detectaron conflictos de vendedores con citas simultáneas")
+            logger.info("✅ Validación exitosa: sin cruces, ventanas, repeticiones, excesos ni pares prohibidos")
         
+        marca = self._iniciar_fase("formateo")
         resultado = self._formatear_resultado()
+        self._cerrar_fase(marca)
         resultado["validacion_conflictos"] = validacion_conflictos
-        
+        return resultado
+
+    # ------------------------------------------------------------------
+    # Edición incremental: altas y bajas sin volver a resolver la agenda
+    # ------------------------------------------------------------------
+
+    def agregar_vendedor(self, vendedor: str) -> bool:
+        """Da de alta un vendedor sin citas; devuelve False si ya existía"""
+        if vendedor in self.citas_por_vendedor:
+            return False
+        vendedor = self.ids_vendedor.internar(vendedor)
+        self.vendedores.append(vendedor)
+        self.citas_por_vendedor[vendedor] = 0
+        self.slots_libres_vendedor[vendedor] = self.mascara_todos_slots
+        self._posicion_vendedor[vendedor] = max(self._posicion_vendedor.values(), default=-1) + 1
+        self.num_vendedores = len(self.vendedores)
+        return True
+
+    def agregar_comprador(self, comprador: str) -> bool:
+        """Da de alta un comprador sin citas; devuelve False si ya existía"""
+        if comprador in self.citas_por_comprador:
+            return False
+        comprador = self.ids_comprador.internar(comprador)
+        self.compradores.append(comprador)
+        self.citas_por_comprador[comprador] = 0
+        self.encuentros_realizados.agregar_comprador(comprador)
+        self.slots_libres_comprador[comprador] = self.mascara_todos_slots
+        self.num_compradores = len(self.compradores)
+        return True
+
+    def agregar_preferencia(self, vendedor: str, comprador: str) -> Optional[int]:
+        """Registra una preferencia nueva y la agenda en un solo slot si es posible
+
+        Da de alta a los participantes que no existan. Devuelve el slot asignado o None.
+        """
+        self.agregar_vendedor(vendedor)
+        self.agregar_comprador(comprador)
+        compradores_pref = self.preferencias_citas.setdefault(vendedor, [])
+        if comprador in compradores_pref:
+            return None
+        compradores_pref.append(comprador)
+
+        # Índice invertido y candidatos por (comprador, slot)
+        solicitantes = self.solicitantes_por_comprador.setdefault(comprador, [])
+        self._orden_solicitantes.setdefault(comprador, {})[vendedor] = len(solicitantes)
+        solicitantes.append(vendedor)
+        if self.citas_por_vendedor[vendedor] < self.max_citas_vendedor:
+            for slot in range(self.num_slots):
+                if (not self._vendedor_ocupado(vendedor, slot) and
+                        self._verificar_disponibilidad_horaria(vendedor, slot, es_vendedor=True)):
+                    self.candidatos_por_comprador_slot.setdefault((comprador, slot), set()).add(vendedor)
+
+        return self._colocar_preferencia(vendedor, comprador)
+
+    def eliminar_preferencia(self, vendedor: str, comprador: str) -> bool:
+        """Elimina una preferencia; si ya tenía cita, la retira y repara solo ese slot"""
+        compradores_pref = self.preferencias_citas.get(vendedor, [])
+        if comprador not in compradores_pref:
+            return False
+
+        slots_afectados = [slot for slot in range(self.num_slots)
+                           if self.ocupacion_vendedores[slot].get(vendedor) == comprador]
+        for slot in slots_afectados:
+            self._retirar_vendedor_de_cita(slot, vendedor)
+
+        compradores_pref.remove(comprador)
+        if not compradores_pref:
+            del self.preferencias_citas[vendedor]
+        self._quitar_solicitante(comprador, vendedor)
+
+        for slot in slots_afectados:
+            self._reparar_slot(slot, compradores=[comprador], vendedores=[vendedor])
+        return True
+
+    def eliminar_vendedor(self, vendedor: str) -> bool:
+        """Da de baja un vendedor: retira sus citas y repara solo los slots que ocupaba"""
+        if vendedor not in self.citas_por_vendedor:
+            return False
+
+        afectados = []
+        for slot in range(self.num_slots):
+            comprador = self._retirar_vendedor_de_cita(slot, vendedor)
+            if comprador is not None:
+                afectados.append((slot, comprador))
+
+        for comprador in self.preferencias_citas.pop(vendedor, []):
+            self._quitar_solicitante(comprador, vendedor)
+        self.vendedores.remove(vendedor)
+        self.encuentros_realizados.eliminar_vendedor(vendedor)
+        del self.citas_por_vendedor[vendedor]
+        self.slots_libres_vendedor.pop(vendedor, None)
+        self._posicion_vendedor.pop(vendedor, None)
+        self.num_vendedores = len(self.vendedores)
+
+        for slot, comprador in afectados:
+            self._reparar_slot(slot, compradores=[comprador])
+        return True
+
+    def eliminar_comprador(self, comprador: str) -> bool:
+        """Da de baja un comprador: elimina sus citas y reubica a esos vendedores en los mismos slots"""
+        if comprador not in self.citas_por_comprador:
+            return False
+
+        afectados = []
+        for slot in range(self.num_slots):
+            indice_cita = self.ocupacion_compradores[slot].get(comprador)
+            if indice_cita is None:
+                continue
+            vendedores = list(self.agenda[slot][indice_cita][1])
+            for vendedor in vendedores:
+                self._retirar_vendedor_de_cita(slot, vendedor)
+            afectados.append((slot, vendedores))
+
+        for vendedor in self.solicitantes_por_comprador.pop(comprador, []):
+            compradores_pref = self.preferencias_citas.get(vendedor, [])
+            if comprador in compradores_pref:
+                compradores_pref.remove(comprador)
+                if not compradores_pref:
+                    del self.preferencias_citas[vendedor]
+        self._orden_solicitantes.pop(comprador, None)
+        for slot in range(self.num_slots):
+            self.candidatos_por_comprador_slot.pop((comprador, slot), None)
+        self.compradores.remove(comprador)
+        del self.citas_por_comprador[comprador]
+        self.encuentros_realizados.eliminar_comprador(comprador)
+        self.slots_libres_comprador.pop(comprador, None)
+        self.num_compradores = len(self.compradores)
+
+        for slot, vendedores in afectados:
+            self._reparar_slot(slot, vendedores=vendedores)
+        return True
+
+    def _quitar_solicitante(self, comprador: str, vendedor: str):
+        """Quita al vendedor del índice invertido y de los candidatos del comprador"""
+        solicitantes = self.solicitantes_por_comprador.get(comprador, [])
+        if vendedor in solicitantes:
+            solicitantes.remove(vendedor)
+            self._orden_solicitantes[comprador] = {v: i for i, v in enumerate(solicitantes)}
+        for slot in range(self.num_slots):
+            candidatos = self.candidatos_por_comprador_slot.get((comprador, slot))
+            if candidatos is not None:
+                candidatos.discard(vendedor)
+
+    def _puede_sumarse_a_comprador(self, vendedor: str, comprador: str, slot: int) -> bool:
+        """Indica si el vendedor puede sumarse a la cita (existente o nueva) del comprador en el slot"""
+        if (self._vendedor_ocupado(vendedor, slot) or
+                self.citas_por_vendedor.get(vendedor, self.max_citas_vendedor) >= self.max_citas_vendedor or
+                self.encuentros_realizados.contiene(comprador, vendedor) or
+                (comprador, vendedor) in self.pares_prohibidos or
+                not self._verificar_disponibilidad_horaria(vendedor, slot, es_vendedor=True) or
+                not self._verificar_disponibilidad_horaria(comprador, slot, es_vendedor=False)):
+            return False
+        indice_cita = self.ocupacion_compradores[slot].get(comprador)
+        return indice_cita is None or len(self.agenda[slot][indice_cita][1]) < self.vendedores_por_cita
+
+    def _sumar_a_comprador(self, vendedor: str, comprador: str, slot: int):
+        """Suma el vendedor a la cita del comprador en el slot (creándola si no existe)"""
+        indice_cita = self.ocupacion_compradores[slot].get(comprador)
+        if indice_cita is None:
+            self._registrar_cita(slot, comprador, [vendedor])
+        else:
+            self._agregar_vendedor_a_cita(slot, indice_cita, vendedor)
+        if comprador in self.preferencias_citas.get(vendedor, []):
+            self.citas_preferencia_asignadas.add((vendedor, comprador))
+
+    def _colocar_preferencia(self, vendedor: str, comprador: str, slot_minimo: int = 0) -> Optional[int]:
+        """Agenda una preferencia en un solo slot: primero en una cita existente del comprador con lugar
+
+        Solo se consideran los slots desde slot_minimo (los anteriores quedan congelados).
+        """
+        libres_comprador = self.slots_libres_comprador.get(comprador, self.mascara_todos_slots)
+        slots_con_cita = [s for s in range(slot_minimo, self.num_slots) if not (libres_comprador >> s) & 1]
+        slots_libres = [s for s in range(slot_minimo, self.num_slots) if (libres_comprador >> s) & 1]
+        for slot in slots_con_cita + slots_libres:
+            if self._puede_sumarse_a_comprador(vendedor, comprador, slot):
+                self._sumar_a_comprador(vendedor, comprador, slot)
+                return slot
+        return None
+
+    def _reparar_slot(self, slot: int, compradores: List[str] = (), vendedores: List[str] = ()):
+        """Rellena los lugares liberados en un slot con preferencias pendientes, sin tocar otros slots
+
+        Para cada comprador afectado se suman solicitantes pendientes disponibles en el slot; para
+        cada vendedor liberado se busca un comprador pendiente de su lista con lugar en el slot.
+        """
+        if slot in self.slots_descanso:
+            return
+        for comprador in compradores:
+            if comprador not in self.citas_por_comprador:
+                continue
+            for vendedor in self._solicitantes_disponibles(comprador, slot):
+                if self._puede_sumarse_a_comprador(vendedor, comprador, slot):
+                    self._sumar_a_comprador(vendedor, comprador, slot)
+        for vendedor in vendedores:
+            if vendedor not in self.citas_por_vendedor:
+                continue
+            for comprador in self.preferencias_citas.get(vendedor, []):
+                if self._puede_sumarse_a_comprador(vendedor, comprador, slot):
+                    self._sumar_a_comprador(vendedor, comprador, slot)
+                    break
+
+    def reparar_en_vivo(self, slot_actual: int, ausentes: Set[str] = frozenset(),
+                        llegadas_tardias: Optional[Dict[str, int]] = None) -> Dict:
+        """Re-planifica el resto del evento ante ausencias y llegadas tardías
+
+        Los slots anteriores a slot_actual quedan congelados. Los ausentes dejan de estar
+        disponibles desde slot_actual y los tardíos hasta su slot de llegada
+        (llegadas_tardias = {participante: slot_llegada}); sus citas futuras se retiran.
+        Luego se rellenan los lugares liberados y se reubican, desde slot_actual, las
+        preferencias que quedaron pendientes para los participantes afectados, respetando
+        todas las restricciones vigentes. Un slot_actual negativo equivale a 0.
+        """
+        inicio = time.perf_counter()
+        slot_actual = max(slot_actual, 0)
+        llegadas_tardias = llegadas_tardias or {}
+        futuros = range(slot_actual, self.num_slots)
+        citas_antes = {(slot, comprador, vendedor) for slot in futuros
+                       for comprador, vendedores in self.agenda[slot] for vendedor in vendedores}
+
+        # Ventanas bloqueadas por participante: desde slot_actual (ausentes) o hasta la llegada (tardíos)
+        bloqueos = {}
+        for participante in ausentes:
+            bloqueos[participante] = self.mascara_todos_slots & ~((1 << slot_actual) - 1)
+        for participante, slot_llegada in llegadas_tardias.items():
+            bloqueos[participante] = bloqueos.get(participante, 0) | (
+                ((1 << max(slot_llegada, slot_actual)) - 1) & ~((1 << slot_actual) - 1))
+
+        pares_pendientes = []
+        slots_con_lugar = set()
+        vendedores_liberados = {}
+        for participante, bloqueo in bloqueos.items():
+            for slot in futuros:
+                if not (bloqueo >> slot) & 1:
+                    continue
+                comprador = self._retirar_vendedor_de_cita(slot, participante)
+                if comprador is not None:
+                    pares_pendientes.append((participante, comprador))
+                    slots_con_lugar.add((slot, comprador))
+                indice_cita = self.ocupacion_compradores[slot].get(participante)
+                if indice_cita is not None:
+                    for vendedor in list(self.agenda[slot][indice_cita][1]):
+                        self._retirar_vendedor_de_cita(slot, vendedor)
+                        pares_pendientes.append((vendedor, participante))
+                        vendedores_liberados.setdefault(slot, []).append(vendedor)
+
+            # Restringir la matriz de disponibilidad en ambos roles (después de retirar sus citas,
+            # para que la agenda nunca tenga citas fuera de ventana entre un paso y otro)
+            for tabla in (self.disponibilidad_vendedor, self.disponibilidad_comprador):
+                tabla[participante] = tabla.get(participante, self.mascara_slots_habiles) & ~bloqueo
+
+            # Los candidatos del participante en los slots bloqueados dejan de valer
+            for comprador in self.preferencias_citas.get(participante, []):
+                for slot in futuros:
+                    if (bloqueo >> slot) & 1:
+                        candidatos = self.candidatos_por_comprador_slot.get((comprador, slot))
+                        if candidatos is not None:
+                            candidatos.discard(participante)
+
+        # Rellenar los lugares liberados en cada slot futuro afectado
+        for slot, comprador in sorted(slots_con_lugar):
+            self._reparar_slot(slot, compradores=[comprador])
+        for slot, vendedores in sorted(vendedores_liberados.items()):
+            self._reparar_slot(slot, vendedores=vendedores)
+
+        # Reubicar desde slot_actual las preferencias que quedaron pendientes
+        for vendedor, comprador in pares_pendientes:
+            if not self.encuentros_realizados.contiene(comprador, vendedor):
+                self._colocar_preferencia(vendedor, comprador, slot_minimo=slot_actual)
+
+        citas_despues = {(slot, comprador, vendedor) for slot in futuros
+                         for comprador, vendedores in self.agenda[slot] for vendedor in vendedores}
+
+        def describir(citas):
+            return [{"horario": self.horarios[slot], "comprador": comprador, "vendedor": vendedor}
+                    for slot, comprador, vendedor in sorted(citas)]
+
+        resumen = {
+            "slot_actual": slot_actual,
+            "citas_retiradas": describir(citas_antes - citas_despues),
+            "citas_nuevas": describir(citas_despues - citas_antes),
+            "milisegundos": round((time.perf_counter() - inicio) * 1000, 2)
+        }
+        logger.info("🔁 Reparación en vivo desde %s: %s encuentros retirados, %s nuevos (%s ms)",
+                    self.horarios[slot_actual] if slot_actual < self.num_slots else 'fin',
+                    len(resumen['citas_retiradas']), len(resumen['citas_nuevas']), resumen['milisegundos'])
+        return resumen
+
+    def cargar_resultado(self, resultado: Dict):
+        """Carga en esta instancia la agenda de un resultado ya formateado (p. ej. desde la caché)"""
+        self._inicializar_participantes_por_defecto()
+        slot_por_horario = {horario: slot for slot, horario in enumerate(self.horarios)}
+        agenda = {slot: [] for slot in range(self.num_slots)}
+        for horario, citas in resultado["agenda"].items():
+            agenda[slot_por_horario[horario]] = [(cita["comprador"], list(cita["vendedores"])) for cita in citas]
+        preferencias_asignadas = {
+            (vendedor, pref["comprador"])
+            for vendedor, preferencias in resultado.get("preferencias_cumplidas", {}).items()
+            for pref in preferencias if pref["cumplida"]
+        }
+        self._restaurar_estado_agenda((agenda, preferencias_asignadas))
+
+    def generar_agenda_con_cache(self, parametros: Dict, generar, carpeta_cache: str = CARPETA_CACHE) -> Dict:
+        """Devuelve el resultado guardado para estas entradas o lo genera con generar() y lo guarda
+
+        La clave combina el CSV de preferencias cargado, la configuración del evento, los
+        parámetros de la ejecución (semilla, motor, ...) y VERSION_MOTOR. Con la instrumentación
+        o la validación continua activas se resuelve siempre: los tiempos de una ejecución
+        guardada no sirven y la validación paso a paso necesita que la agenda se construya.
+        """
+        if not self.ruta_preferencias:
+            return generar()
+        if self.instrumentacion is not None or self.validacion_continua is not None:
+            logger.info("Instrumentación o validación continua activa: se resuelve sin consultar la caché")
+            return generar()
+
+        clave = clave_cache_agenda(self.ruta_preferencias, self.configuracion_evento, parametros)
+        ruta_cache = os.path.join(carpeta_cache, f"{clave}.json")
+
+        if os.path.exists(ruta_cache):
+            try:
+                with open(ruta_cache, 'r', encoding='utf-8') as f:
+                    resultado = json.load(f)
+                self.cargar_resultado(resultado)
+                logger.info("♻️  Resultado recuperado de la caché: %s", ruta_cache)
+                resultado["cache"] = {"clave": clave, "acierto": True}
+                return resultado
+            except Exception as e:
+                logger.warning("⚠️  Caché ilegible (%s); se vuelve a resolver", e)
+
+        resultado = generar()
+
+        os.makedirs(carpeta_cache, exist_ok=True)
+        ruta_temporal = f"{ruta_cache}.tmp"
+        with open(ruta_temporal, 'w', encoding='utf-8') as f:
+            # Las mediciones son de esta ejecución: no se guardan con la agenda
+            json.dump({clave_resultado: valor for clave_resultado, valor in resultado.items()
+                       if clave_resultado != "instrumentacion"}, f, ensure_ascii=False)
+        os.replace(ruta_temporal, ruta_cache)
+        resultado["cache"] = {"clave": clave, "acierto": False}
+        return resultado
+
+    def generar_agenda_multiarranque(self, ruta_preferencias: str, inicios: int, trabajadores: Optional[int] = None,
+                                     motores: Tuple[str, ...] = ("voraz",), tiempo_mejora: float = 0.0,
+                                     semilla_base: int = 0, sin_cache: bool = False) -> Dict:
+        """Resuelve la agenda con varias semillas (y motores) en paralelo y conserva la mejor
+
+        Cada arranque i usa la semilla semilla_base + i y el motor motores[i % len(motores)], y se
+        ejecuta en un ProcessPoolExecutor con 'trabajadores' procesos. Gana el arranque con más
+        preferencias cumplidas y, a igualdad, menos conflictos (y luego la semilla más baja).
+        La agenda ganadora queda cargada en esta instancia. Con sin_cache los arranques leen el CSV
+        en lugar de la instancia precompilada.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        for motor in motores:
+            if motor not in MOTORES_AGENDA:
+                raise ValueError(f"Motor desconocido: {motor}. Opciones: {', '.join(MOTORES_AGENDA)}")
+
+        instrumentar = self.instrumentacion is not None
+        validar_cada_paso = self.validacion_continua is not None
+        tareas = [
+            (ruta_preferencias, self.configuracion_evento, motores[i % len(motores)], semilla_base + i, tiempo_mejora,
+             instrumentar, validar_cada_paso, sin_cache)
+            for i in range(inicios)
+        ]
+        logger.info("Multiarranque: %s arranques en %s procesos (motores: %s)...",
+                    inicios, trabajadores or os.cpu_count(), ', '.join(motores))
+
+        with ProcessPoolExecutor(max_workers=trabajadores) as executor:
+            ejecuciones = list(executor.map(_ejecutar_arranque, tareas))
+
+        # Las mediciones de los procesos se suman a las de esta instancia (fases en segundos acumulados)
+        for ejecucion in ejecuciones:
+            if ejecucion["instrumentacion"] is not None:
+                self._acumular_instrumentacion(ejecucion["instrumentacion"])
+            if ejecucion["validacion_continua"] is not None:
+                # Los procesos no muestran mensajes: sus violaciones se registran aquí
+                self.validacion_continua["validaciones"] += ejecucion["validacion_continua"]["validaciones"]
+                for violacion in ejecucion["validacion_continua"]["violaciones"]:
+                    logger.error("🔴 [semilla %s] %s produjo %s en %s: %s con %s (%s)", ejecucion["semilla"],
+                                 violacion["metodo"], violacion["tipo"], violacion["horario"], violacion["comprador"],
+                                 violacion["vendedores"], violacion["detalle"])
+                    self.validacion_continua["violaciones"].append({"semilla": ejecucion["semilla"], **violacion})
+
+        ganador = max(ejecuciones, key=lambda e: (e["preferencias_cumplidas"], -e["conflictos"], -e["semilla"]))
+        for ejecucion in ejecuciones:
+            marca = "🏆" if ejecucion is ganador else "  "
+            logger.info("   %s semilla %4s (%s): %s preferencias, %s conflictos", marca, ejecucion['semilla'],
+                        ejecucion['motor'], ejecucion['preferencias_cumplidas'], ejecucion['conflictos'])
+
+        # Cargar la agenda ganadora en esta instancia y formatear el resultado
+        self._inicializar_participantes_por_defecto()
+        self._restaurar_estado_agenda(ganador["estado"])
+        resultado = self._construir_resultado()
+        resultado.update(ganador["extras"])
+        resultado["multiarranque"] = {
+            "semilla_ganadora": ganador["semilla"],
+            "motor_ganador": ganador["motor"],
+            "arranques": [{k: e[k] for k in ("semilla", "motor", "preferencias_cumplidas", "conflictos")}
+                          for e in ejecuciones]
+        }
+        if self.instrumentacion is not None:
+            resultado["instrumentacion"] = self._resumen_instrumentacion()
         return resultado
 
     def _asignar_citas_con_preferencias(self):
         """Asigna citas basadas en las preferencias cargadas"""
         # FASE 1: Concentrar TODOS los participantes en las primeras horas
-        print("Fase 1: Concentrando TODOS los vendedores y compradores en las primeras horas...")
+        logger.info("Fase 1: Concentrando TODOS los vendedores y compradores en las primeras horas...")
         self._garantizar_citas_iniciales_compradores()
         
         # FASE 2: Solo completar preferencias restantes si hay participantes sin asignar
-        print("Fase 2: Completando citas con preferencias restantes (si es necesario)...")
+        logger.info("Fase 2: Completando citas con preferencias restantes (si es necesario)...")
         
         # Crear un mapa de todas las combinaciones vendedor-comprador preferidas
         combinaciones_preferidas = []
@@ -324,7 +1331,7 @@ class AgendaRuedaNegocios:
                     combinaciones_preferidas.append((vendedor, comprador))
         
         if not combinaciones_preferidas:
-            print("✅ No hay preferencias adicionales por procesar - concentración completada")
+            logger.info("✅ No hay preferencias adicionales por procesar - concentración completada")
             return
         
         # Agrupar por comprador para formar citas grupales
@@ -337,7 +1344,7 @@ class AgendaRuedaNegocios:
         # Asignar citas por comprador
         for comprador, vendedores_interesados in vendedores_por_comprador.items():
             # Mezclar para variedad
-            random.shuffle(vendedores_interesados)
+            self.rng.shuffle(vendedores_interesados)
             
             # Dividir vendedores en grupos estratégicos: priorizar 5 citas con 2 vendedores + 5 citas con 3 vendedores
             while len(vendedores_interesados) >= 2:
@@ -361,14 +1368,10 @@ class AgendaRuedaNegocios:
                 # Buscar slot disponible para este grupo
                 slot_asignado = self._buscar_slot_disponible(grupo_vendedores, comprador)
                 if slot_asignado is not None:
-                    self.agenda[slot_asignado].append((comprador, grupo_vendedores))
+                    self._registrar_cita(slot_asignado, comprador, grupo_vendedores)
                     for vendedor in grupo_vendedores:
-                        self.citas_por_vendedor[vendedor] += 1
                         self.citas_preferencia_asignadas.add((vendedor, comprador))
-                        # Registrar encuentro realizado
-                        self.encuentros_realizados[comprador].add(vendedor)
-                    self.citas_por_comprador[comprador] += 1
-                    print(f"✓ Cita preferida asignada: {grupo_vendedores} → {comprador} ({len(grupo_vendedores)} vendedores)")
+                    logger.debug("✓ Cita preferida asignada: %s → %s (%s vendedores)", grupo_vendedores, comprador, len(grupo_vendedores))
             
             # Si quedan vendedores (1 o pocos), intentar completar grupos existentes
             if vendedores_interesados:
@@ -379,105 +1382,447 @@ class AgendaRuedaNegocios:
                     grupo_completo = vendedores_interesados + vendedores_adicionales
                     slot_asignado = self._buscar_slot_disponible(grupo_completo, comprador)
                     if slot_asignado is not None:
-                        self.agenda[slot_asignado].append((comprador, grupo_completo))
+                        self._registrar_cita(slot_asignado, comprador, grupo_completo)
                         for vendedor in grupo_completo:
-                            self.citas_por_vendedor[vendedor] += 1
                             if vendedor in vendedores_interesados:
                                 self.citas_preferencia_asignadas.add((vendedor, comprador))
-                            # Registrar encuentro realizado
-                            self.encuentros_realizados[comprador].add(vendedor)
-                        self.citas_por_comprador[comprador] += 1
-                        print(f"✓ Cita preferida completada: {grupo_completo} → {comprador}")
+                        logger.debug("✓ Cita preferida completada: %s → %s", grupo_completo, comprador)
                 elif len(vendedores_interesados) == 1:
                     # Si solo queda 1 vendedor, crear una cita de 1 vendedor
                     slot_asignado = self._buscar_slot_disponible(vendedores_interesados, comprador)
                     if slot_asignado is not None:
-                        self.agenda[slot_asignado].append((comprador, vendedores_interesados))
+                        self._registrar_cita(slot_asignado, comprador, vendedores_interesados)
                         for vendedor in vendedores_interesados:
-                            self.citas_por_vendedor[vendedor] += 1
                             self.citas_preferencia_asignadas.add((vendedor, comprador))
-                            self.encuentros_realizados[comprador].add(vendedor)
-                        self.citas_por_comprador[comprador] += 1
-                        print(f"✓ Cita preferida individual: {vendedores_interesados} → {comprador}")
+                        logger.debug("✓ Cita preferida individual: %s → %s", vendedores_interesados, comprador)
                 else:
                     # Si no se pueden completar, intentar asignar estos vendedores a otras citas
                     self._asignar_vendedores_restantes(vendedores_interesados, comprador)
 
+    def _asignar_citas_flujo_costo_minimo(self):
+        """Asigna las citas slot por slot resolviendo un flujo máximo de costo mínimo
+
+        Red por slot: fuente → vendedor (capacidad 1) → comprador solicitado (capacidad 1)
+        → sumidero (capacidad = cupos libres de la cita del comprador). Solo se enlazan pares
+        solicitados que aún no se han reunido, no prohibidos y con ambos disponibles en el slot,
+        por lo que el emparejamiento de cada slot es máximo. El costo de cada par es el número de
+        slots posteriores en que todavía podrían reunirse: los pares con ventanas escasas se
+        atienden primero.
+        """
+        logger.info("Motor de flujo de costo mínimo: resolviendo slot por slot...")
+
+        # Las citas fijas se respetan antes de optimizar
+        self._procesar_citas_criticas()
+
+        for slot in range(self.num_slots):
+            if slot in self.slots_descanso:
+                continue
+
+            # Compradores con cupo en este slot y sus vendedores pendientes disponibles
+            cupos_comprador = {}
+            for comprador in self.compradores:
+                if not self._verificar_disponibilidad_horaria(comprador, slot, es_vendedor=False):
+                    continue
+                indice_cita = self.ocupacion_compradores[slot].get(comprador)
+                ocupados = len(self.agenda[slot][indice_cita][1]) if indice_cita is not None else 0
+                if ocupados < self.vendedores_por_cita:
+                    cupos_comprador[comprador] = self.vendedores_por_cita - ocupados
+
+            pares = []
+            for comprador in cupos_comprador:
+                disponibilidad_comprador = self.disponibilidad_comprador.get(comprador, self.mascara_slots_habiles)
+                for vendedor in self._solicitantes_disponibles(comprador, slot):
+                    if (self.encuentros_realizados.contiene(comprador, vendedor) or
+                            (comprador, vendedor) in self.pares_prohibidos):
+                        continue
+                    disponibilidad_vendedor = self.disponibilidad_vendedor.get(vendedor, self.mascara_slots_habiles)
+                    slots_restantes = ((disponibilidad_comprador & disponibilidad_vendedor) >> (slot + 1)).bit_count()
+                    pares.append((vendedor, comprador, 1 + slots_restantes))
+
+            if not pares:
+                continue
+
+            # Numeración de nodos: 0 fuente, 1 sumidero, luego vendedores y compradores
+            nodos = {}
+            for vendedor, comprador, _ in pares:
+                nodos.setdefault(("v", vendedor), len(nodos) + 2)
+                nodos.setdefault(("c", comprador), len(nodos) + 2)
+
+            red = RedFlujoCostoMinimo(len(nodos) + 2)
+            for (rol, nombre), nodo in nodos.items():
+                if rol == "v":
+                    red.agregar_arista(0, nodo, 1, 0)
+                else:
+                    red.agregar_arista(nodo, 1, cupos_comprador[nombre], 0)
+            aristas_pares = [
+                (red.agregar_arista(nodos[("v", vendedor)], nodos[("c", comprador)], 1, costo), vendedor, comprador)
+                for vendedor, comprador, costo in pares
+            ]
+            flujo, _ = red.resolver(0, 1)
+
+            # Agrupar el emparejamiento por comprador, en el orden de los pares
+            grupos = {}
+            for arista, vendedor, comprador in aristas_pares:
+                if red.flujo_en(arista):
+                    grupos.setdefault(comprador, []).append(vendedor)
+
+            for comprador, vendedores in grupos.items():
+                indice_cita = self.ocupacion_compradores[slot].get(comprador)
+                if indice_cita is None:
+                    self._registrar_cita(slot, comprador, vendedores)
+                else:
+                    for vendedor in vendedores:
+                        self._agregar_vendedor_a_cita(slot, indice_cita, vendedor)
+                for vendedor in vendedores:
+                    self.citas_preferencia_asignadas.add((vendedor, comprador))
+
+            logger.debug("   ⏰ %s: %s encuentros en %s citas", self.horarios[slot], flujo, len(grupos))
+
+    def _asignar_citas_coloreo_global(self):
+        """Asigna todas las preferencias a la vez como un coloreo de aristas bipartito
+
+        Cada preferencia (vendedor, comprador) es una arista y cada slot un color. Un vendedor
+        usa cada color a lo sumo una vez, un comprador hasta vendedores_por_cita veces (una
+        cita grupal) y las ventanas de disponibilidad y descansos eliminan colores. Las aristas
+        se colorean de la más restringida a la menos restringida con operaciones de bits; las
+        que no caben se intentan reparar moviendo la arista que bloquea al vendedor. Las aristas
+        que siguen sin color quedan en self.aristas_sin_color.
+        """
+        logger.info("Motor de coloreo global: coloreando el multigrafo de preferencias...")
+
+        # Las citas fijas se colorean antes que el resto
+        self._procesar_citas_criticas()
+        fijas = {(vendedor, comprador) for vendedor, comprador, _ in self.citas_fijas}
+
+        def colores_permitidos(vendedor, comprador):
+            return (self.disponibilidad_vendedor.get(vendedor, self.mascara_slots_habiles) &
+                    self.disponibilidad_comprador.get(comprador, self.mascara_slots_habiles))
+
+        def colores_con_cupo(comprador):
+            # Slots donde el comprador ya tiene cita con lugar, o puede abrir una nueva
+            mascara = 0
+            libres = self.slots_libres_comprador.get(comprador, self.mascara_todos_slots)
+            for slot in range(self.num_slots):
+                indice_cita = self.ocupacion_compradores[slot].get(comprador)
+                if indice_cita is not None:
+                    if len(self.agenda[slot][indice_cita][1]) < self.vendedores_por_cita:
+                        mascara |= 1 << slot
+                elif (libres >> slot) & 1:
+                    mascara |= 1 << slot
+            return mascara
+
+        def colorear(vendedor, comprador, slot):
+            indice_cita = self.ocupacion_compradores[slot].get(comprador)
+            if indice_cita is None:
+                self._registrar_cita(slot, comprador, [vendedor])
+            else:
+                self._agregar_vendedor_a_cita(slot, indice_cita, vendedor)
+            self.citas_preferencia_asignadas.add((vendedor, comprador))
+
+        def elegir_color(mascara, comprador):
+            # Preferir slots donde el comprador ya tiene cita (agrupa vendedores), luego el más temprano
+            con_cita = mascara & ~self.slots_libres_comprador.get(comprador, self.mascara_todos_slots)
+            elegidos = con_cita or mascara
+            return (elegidos & -elegidos).bit_length() - 1
+
+        # Aristas pendientes, de la más restringida (menos colores posibles) a la menos restringida
+        aristas = []
+        for vendedor, compradores_pref in self.preferencias_citas.items():
+            for comprador in compradores_pref:
+                if ((vendedor, comprador) in self.pares_prohibidos or
+                        self.encuentros_realizados.contiene(comprador, vendedor)):
+                    continue
+                aristas.append((colores_permitidos(vendedor, comprador).bit_count(), vendedor, comprador))
+        aristas.sort(key=lambda arista: arista[0])
+
+        sin_color = []
+        for _, vendedor, comprador in aristas:
+            if self.citas_por_vendedor[vendedor] >= self.max_citas_vendedor:
+                sin_color.append((vendedor, comprador))
+                continue
+            mascara = (colores_permitidos(vendedor, comprador) &
+                       self.slots_libres_vendedor.get(vendedor, self.mascara_todos_slots) &
+                       colores_con_cupo(comprador))
+            if not mascara:
+                sin_color.append((vendedor, comprador))
+                continue
+            slot = elegir_color(mascara, comprador)
+            colorear(vendedor, comprador, slot)
+
+        # Reparación: liberar un color para (v, c) moviendo la arista (v, c2) que lo ocupa
+        self.aristas_sin_color = []
+        for vendedor, comprador in sin_color:
+            reparada = False
+            if self.citas_por_vendedor[vendedor] < self.max_citas_vendedor:
+                bloqueados = (colores_permitidos(vendedor, comprador) & colores_con_cupo(comprador) &
+                              ~self.slots_libres_vendedor.get(vendedor, self.mascara_todos_slots))
+                while bloqueados and not reparada:
+                    bit = bloqueados & -bloqueados
+                    bloqueados ^= bit
+                    slot_a = bit.bit_length() - 1
+                    otro_comprador = self.ocupacion_vendedores[slot_a][vendedor]
+                    if (vendedor, otro_comprador) in fijas:
+                        continue
+                    alternativos = (colores_permitidos(vendedor, otro_comprador) &
+                                    self.slots_libres_vendedor.get(vendedor, self.mascara_todos_slots) &
+                                    colores_con_cupo(otro_comprador))
+                    if not alternativos:
+                        continue
+                    self._retirar_vendedor_de_cita(slot_a, vendedor)
+                    colorear(vendedor, otro_comprador, elegir_color(alternativos, otro_comprador))
+                    colorear(vendedor, comprador, slot_a)
+                    reparada = True
+            if not reparada:
+                self.aristas_sin_color.append({"vendedor": vendedor, "comprador": comprador})
+
+        coloreadas = len(aristas) - len(self.aristas_sin_color)
+        logger.info("   ✅ Aristas coloreadas: %s/%s", coloreadas, len(aristas))
+        for arista in self.aristas_sin_color:
+            logger.warning("   ❌ Sin color: %s → %s", arista['vendedor'], arista['comprador'])
+
+    def _recalcular_estado_desde_agenda(self):
+        """Recalcula contadores, encuentros e índices a partir de self.agenda"""
+        self.citas_por_vendedor = {v: 0 for v in self.vendedores}
+        self.citas_por_comprador = {c: 0 for c in self.compradores}
+        self.encuentros_realizados = MatrizEncuentros(self.ids_vendedor, self.compradores)
+        for citas in self.agenda.values():
+            for comprador, vendedores in citas:
+                self.citas_por_comprador[comprador] += 1
+                for vendedor in vendedores:
+                    self.citas_por_vendedor[vendedor] += 1
+                    self.encuentros_realizados.agregar(comprador, vendedor)
+        self._reconstruir_indice_ocupacion()
+
+    def _copiar_estado_agenda(self) -> Tuple[Dict, Set]:
+        """Copia de la agenda y de las preferencias cumplidas (para guardar la mejor solución)"""
+        agenda = {slot: [(comprador, list(vendedores)) for comprador, vendedores in citas]
+                  for slot, citas in self.agenda.items()}
+        return agenda, set(self.citas_preferencia_asignadas)
+
+    def _restaurar_estado_agenda(self, estado: Tuple[Dict, Set]):
+        """Restaura una copia hecha con _copiar_estado_agenda"""
+        agenda, preferencias_asignadas = estado
+        self.agenda = {slot: [Cita(comprador, vendedores) for comprador, vendedores in citas]
+                       for slot, citas in agenda.items()}
+        self.citas_preferencia_asignadas = set(preferencias_asignadas)
+        self._recalcular_estado_desde_agenda()
+
+    def mejorar_agenda(self, tiempo_limite: float = 5.0, callback_progreso=None, cancelar=None,
+                       semilla: Optional[int] = None) -> Dict:
+        """Fase opcional de mejora por búsqueda local sobre self.agenda
+
+        Intenta cumplir preferencias pendientes con vecindarios de inserción directa, movimiento
+        (reubicar la cita que bloquea al vendedor) y reagrupación (reubicar un vendedor de la cita
+        llena del comprador). Si ninguno aplica, hace un intercambio neutro aceptado con
+        probabilidad decreciente (recocido simulado) para diversificar. Se detiene al agotar
+        tiempo_limite (segundos) o cuando cancelar.is_set() es verdadero, y siempre deja en la
+        agenda la mejor solución encontrada.
+
+        callback_progreso recibe un dict con iteraciones, segundos y preferencias cumplidas.
+        """
+        rng = random.Random(semilla) if semilla is not None else self.rng
+        inicio = time.perf_counter()
+        fijas = {(vendedor, comprador) for vendedor, comprador, _ in self.citas_fijas}
+
+        def cumplidas():
+            return len(self.citas_preferencia_asignadas)
+
+        def ventana(vendedor, comprador):
+            return (self.disponibilidad_vendedor.get(vendedor, self.mascara_slots_habiles) &
+                    self.disponibilidad_comprador.get(comprador, self.mascara_slots_habiles))
+
+        def libres_vendedor(vendedor):
+            return self.slots_libres_vendedor.get(vendedor, self.mascara_todos_slots)
+
+        def con_cupo(comprador):
+            # Slots donde el comprador puede recibir un vendedor más
+            mascara = self.slots_libres_comprador.get(comprador, self.mascara_todos_slots)
+            for slot, indice_cita in ((s, o.get(comprador)) for s, o in self.ocupacion_compradores.items()):
+                if indice_cita is not None and len(self.agenda[slot][indice_cita][1]) < self.vendedores_por_cita:
+                    mascara |= 1 << slot
+            return mascara
+
+        def slot_aleatorio(mascara):
+            slots = [slot for slot in range(self.num_slots) if (mascara >> slot) & 1]
+            return rng.choice(slots) if slots else None
+
+        def colocar(vendedor, comprador, slot):
+            indice_cita = self.ocupacion_compradores[slot].get(comprador)
+            if indice_cita is None:
+                self._registrar_cita(slot, comprador, [vendedor])
+            else:
+                self._agregar_vendedor_a_cita(slot, indice_cita, vendedor)
+            if comprador in self.preferencias_citas.get(vendedor, []):
+                self.citas_preferencia_asignadas.add((vendedor, comprador))
+
+        def reubicar(vendedor, comprador, slot_origen, prohibido):
+            # Mueve la cita (vendedor, comprador) del slot_origen a otro slot válido
+            if (vendedor, comprador) in fijas:
+                return False
+            destinos = (ventana(vendedor, comprador) & libres_vendedor(vendedor) &
+                        con_cupo(comprador) & ~(1 << slot_origen) & ~(1 << prohibido))
+            slot_destino = slot_aleatorio(destinos)
+            if slot_destino is None:
+                return False
+            self._retirar_vendedor_de_cita(slot_origen, vendedor)
+            colocar(vendedor, comprador, slot_destino)
+            return True
+
+        def intentar_cumplir(vendedor, comprador):
+            if self.citas_por_vendedor[vendedor] >= self.max_citas_vendedor:
+                return False
+            permitidos = ventana(vendedor, comprador)
+
+            # Inserción directa
+            slot = slot_aleatorio(permitidos & libres_vendedor(vendedor) & con_cupo(comprador))
+            if slot is not None:
+                colocar(vendedor, comprador, slot)
+                return True
+
+            # Movimiento: el vendedor está ocupado en un slot donde el comprador tiene cupo
+            slot = slot_aleatorio(permitidos & ~libres_vendedor(vendedor) & con_cupo(comprador))
+            if slot is not None:
+                otro_comprador = self.ocupacion_vendedores[slot][vendedor]
+                if reubicar(vendedor, otro_comprador, slot, slot):
+                    colocar(vendedor, comprador, slot)
+                    return True
+
+            # Reagrupación: el vendedor está libre pero la cita del comprador está llena
+            slot = slot_aleatorio(permitidos & libres_vendedor(vendedor) & ~con_cupo(comprador))
+            if slot is not None:
+                indice_cita = self.ocupacion_compradores[slot].get(comprador)
+                if indice_cita is not None:
+                    otro_vendedor = rng.choice(self.agenda[slot][indice_cita][1])
+                    if reubicar(otro_vendedor, comprador, slot, slot):
+                        colocar(vendedor, comprador, slot)
+                        return True
+            return False
+
+        def intercambio_neutro(vendedor, comprador, temperatura):
+            # Expulsa a un vendedor de una cita llena del comprador para dar lugar al pendiente
+            if rng.random() >= temperatura or self.citas_por_vendedor[vendedor] >= self.max_citas_vendedor:
+                return False
+            slot = slot_aleatorio(ventana(vendedor, comprador) & libres_vendedor(vendedor) & ~con_cupo(comprador))
+            if slot is None:
+                return False
+            indice_cita = self.ocupacion_compradores[slot].get(comprador)
+            if indice_cita is None:
+                return False
+            expulsables = [v for v in self.agenda[slot][indice_cita][1] if (v, comprador) not in fijas]
+            if not expulsables:
+                return False
+            self._retirar_vendedor_de_cita(slot, rng.choice(expulsables))
+            colocar(vendedor, comprador, slot)
+            return True
+
+        inicial = cumplidas()
+        mejor = inicial
+        mejor_estado = self._copiar_estado_agenda()
+        iteraciones = 0
+
+        def debe_detenerse():
+            return (time.perf_counter() - inicio >= tiempo_limite or
+                    (cancelar is not None and cancelar.is_set()))
+
+        while not debe_detenerse():
+            transcurrido = time.perf_counter() - inicio
+
+            pendientes = [(v, c) for v, compradores_pref in self.preferencias_citas.items() for c in compradores_pref
+                          if (v, c) not in self.citas_preferencia_asignadas and (c, v) not in self.pares_prohibidos
+                          and not self.encuentros_realizados.contiene(c, v)]
+            if not pendientes:
+                break
+
+            temperatura = max(0.0, 1.0 - transcurrido / tiempo_limite) if tiempo_limite > 0 else 0.0
+            for _ in range(len(pendientes)):
+                vendedor, comprador = rng.choice(pendientes)
+                iteraciones += 1
+                if iteraciones % 256 == 0 and debe_detenerse():
+                    break
+                if self.encuentros_realizados.contiene(comprador, vendedor):
+                    continue  # Ya cumplida en esta ronda
+                if not intentar_cumplir(vendedor, comprador):
+                    intercambio_neutro(vendedor, comprador, temperatura)
+
+            actual = cumplidas()
+            if actual > mejor:
+                mejor = actual
+                mejor_estado = self._copiar_estado_agenda()
+                logger.debug("   ✨ Mejora: %s preferencias cumplidas", mejor)
+            if callback_progreso is not None:
+                callback_progreso({
+                    "iteraciones": iteraciones,
+                    "segundos": time.perf_counter() - inicio,
+                    "preferencias_cumplidas": actual,
+                    "mejor_preferencias_cumplidas": mejor
+                })
+
+        # Siempre dejar la mejor solución encontrada
+        if cumplidas() != mejor or self._copiar_estado_agenda()[0] != mejor_estado[0]:
+            self._restaurar_estado_agenda(mejor_estado)
+
+        return {
+            "preferencias_cumplidas_inicial": inicial,
+            "preferencias_cumplidas_final": mejor,
+            "iteraciones": iteraciones,
+            "segundos": round(time.perf_counter() - inicio, 3),
+            "cancelada": bool(cancelar is not None and cancelar.is_set())
+        }
+
     def _procesar_citas_criticas(self):
         """Procesa citas críticas que DEBEN darse en las primeras horas"""
-        print("🔥 PROCESANDO CITAS CRÍTICAS EN PRIMERAS HORAS...")
-        
-        # Citas críticas que DEBEN darse en slots 0-3 (08:30-09:15)
-        citas_criticas = [
-            ("D'CLEO COFFEE", "BOX BRAND", 0),  # Slot 0: 08:30-08:45
-        ]
+        logger.info("🔥 PROCESANDO CITAS CRÍTICAS EN PRIMERAS HORAS...")
         
-        for vendedor, comprador, slot_preferido in citas_criticas:
+        # Citas críticas fijadas en la configuración del evento (p. ej. D'CLEO COFFEE ↔ BOX BRAND a las 08:30)
+        for vendedor, comprador, slot_preferido in self.citas_fijas:
             if vendedor in self.vendedores and comprador in self.compradores:
                 # Verificar disponibilidad en el slot preferido
                 if (self._verificar_disponibilidad_horaria(vendedor, slot_preferido, es_vendedor=True) and
                     self._verificar_disponibilidad_horaria(comprador, slot_preferido, es_vendedor=False)):
                     
                     # Buscar si ya existe una cita para este comprador en este slot
-                    cita_existente = None
-                    for i, (comp_existente, vendedores_existentes) in enumerate(self.agenda[slot_preferido]):
-                        if comp_existente == comprador:
-                            cita_existente = i
-                            break
+                    cita_existente = self.ocupacion_compradores[slot_preferido].get(comprador)
                     
                     if cita_existente is not None:
                         # Agregar vendedor a cita existente si hay espacio
                         vendedores_actuales = self.agenda[slot_preferido][cita_existente][1]
-                        if len(vendedores_actuales) < 3 and vendedor not in vendedores_actuales:
-                            vendedores_actuales.append(vendedor)
-                            # Actualizar contadores
-                            self.citas_por_vendedor[vendedor] += 1
+                        if len(vendedores_actuales) < self.vendedores_por_cita and vendedor not in vendedores_actuales:
+                            self._agregar_vendedor_a_cita(slot_preferido, cita_existente, vendedor)
                             self.citas_preferencia_asignadas.add((vendedor, comprador))
-                            if comprador not in self.encuentros_realizados:
-                                self.encuentros_realizados[comprador] = set()
-                            self.encuentros_realizados[comprador].add(vendedor)
-                            print(f"   ✅ CRÍTICA: {vendedor} agregado a cita existente con {comprador} en {self.horarios[slot_preferido]}")
+                            logger.debug("   ✅ CRÍTICA: %s agregado a cita existente con %s en %s", vendedor, comprador, self.horarios[slot_preferido])
                         else:
-                            print(f"   ⚠️  CRÍTICA: No se pudo agregar {vendedor} a {comprador} (cita llena)")
+                            logger.warning("   ⚠️  CRÍTICA: No se pudo agregar %s a %s (cita llena)", vendedor, comprador)
                     else:
                         # Crear nueva cita para el comprador crítico
-                        nueva_cita = (comprador, [vendedor])
-                        self.agenda[slot_preferido].append(nueva_cita)
-                        # Actualizar contadores
-                        self.citas_por_vendedor[vendedor] += 1
-                        self.citas_por_comprador[comprador] += 1
+                        self._registrar_cita(slot_preferido, comprador, [vendedor])
                         self.citas_preferencia_asignadas.add((vendedor, comprador))
-                        if comprador not in self.encuentros_realizados:
-                            self.encuentros_realizados[comprador] = set()
-                        self.encuentros_realizados[comprador].add(vendedor)
-                        print(f"   ✅ CRÍTICA: Nueva cita {vendedor} ↔ {comprador} en {self.horarios[slot_preferido]}")
+                        logger.debug("   ✅ CRÍTICA: Nueva cita %s ↔ %s en %s", vendedor, comprador, self.horarios[slot_preferido])
                 else:
-                    print(f"   ❌ CRÍTICA: {vendedor} ↔ {comprador} no disponible en {self.horarios[slot_preferido]}")
+                    logger.warning("   ❌ CRÍTICA: %s ↔ %s no disponible en %s", vendedor, comprador, self.horarios[slot_preferido])
 
     def _garantizar_citas_iniciales_compradores(self):
         """Garantiza distribución estratégica con horario extendido y preferencia por 3 vendedores por cita"""
-        print("🚀 DISTRIBUCIÓN ESTRATÉGICA ACTUALIZADA:")
-        print("🎯 08:30-10:30: Regional SAS disponible - máximo 3 vendedores por cita")
-        print("🎯 10:15-11:15: ENCADENAMIENTOS PRODUCTIVOS como comprador - máximo 3 vendedores por cita")
-        print("🎯 11:15-13:00: Café Origen de la Montaña como vendedor - máximo 3 vendedores por cita")
-        print("⏰ Restricciones horarias:")
-        print("   • REGIONAL S.A.S (08:30-10:30)")
-        print("   • NEIRA YORK COFFEE (10:15-12:00)")
-        print("   • ENCADENAMIENTOS PRODUCTIVOS (10:15-11:15)")
-        print("   • Café Origen de la Montaña como vendedor (11:15-13:00)")
-        print("   • La vuelta (12:00-13:00)")
-        print("   • Café Del Tajo (11:15-13:00)")
-        print("   • Café Tradición Premium (11:15-13:00)")
-        print("🚫 Restricciones específicas:")
-        print("   • ☕ COFFEE BREAK: 10:00-10:15 - Slot inhabilitado para citas")
-        print("   • ENCADENAMIENTOS PRODUCTIVOS no se reúne con Café Del Tajo ni Café Tradición Premium")
-        print("   • Ningún vendedor puede tener citas simultáneas con diferentes compradores")
-        print("   • Máximo 3 vendedores por cita por comprador")
-        print("   • Café Origen de la Montaña: primero como comprador (ENCADENAMIENTOS), luego como vendedor")
-        print("   • 🔥 CRÍTICA: D'CLEO COFFEE ↔ BOX BRAND debe darse en las primeras horas (08:30-09:15)")
+        logger.info("🚀 DISTRIBUCIÓN ESTRATÉGICA ACTUALIZADA:")
+        logger.info("🎯 %s-%s: máximo %s vendedores por cita", self.inicio.strftime('%H:%M'), self.fin.strftime('%H:%M'), self.vendedores_por_cita)
+        logger.info("⏰ Restricciones horarias:")
+        for ventana in self.configuracion_evento.get("disponibilidad", []):
+            desde = ventana.get("desde", self.inicio.strftime("%H:%M"))
+            hasta = ventana.get("hasta", self.fin.strftime("%H:%M"))
+            logger.info("   • %s como %s (%s-%s)", ventana['participante'], ventana.get('rol', 'comprador'), desde, hasta)
+        logger.info("🚫 Restricciones específicas:")
+        for descanso in self.configuracion_evento.get("descansos", []):
+            logger.info("   • ☕ %s: %s-%s - Slot inhabilitado para citas", descanso.get('nombre', 'Descanso').upper(), descanso['inicio'], descanso['fin'])
+        for comprador, vendedor in sorted(self.pares_prohibidos):
+            logger.info("   • %s no se reúne con %s", comprador, vendedor)
+        logger.info("   • Ningún vendedor puede tener citas simultáneas con diferentes compradores")
+        logger.info("   • Máximo %s vendedores por cita por comprador", self.vendedores_por_cita)
+        for vendedor, comprador, slot in self.citas_fijas:
+            logger.info("   • 🔥 CRÍTICA: %s ↔ %s fijada en %s", vendedor, comprador, self.horarios[slot])
         
         # PRIMERA PRIORIDAD: Asegurar citas críticas en los primeros slots
+        marca = self._iniciar_fase("citas_criticas")
         self._procesar_citas_criticas()
+        self._cerrar_fase(marca)
         
         # DISTRIBUCIÓN EQUILIBRADA: Usar TODOS los slots disponibles con máximo 1 slot vacío consecutivo
         compradores_sin_cita = set(self.compradores)
@@ -486,14 +1831,15 @@ class AgendaRuedaNegocios:
         # Tracking de slots vacíos por comprador (máximo 1 consecutivo permitido)
         slots_vacios_consecutivos = {c: 0 for c in self.compradores}
         
-        print(f"📅 DISTRIBUCIÓN COMPLETA: Llenar TODOS los slots disponibles...")
+        logger.info("📅 DISTRIBUCIÓN COMPLETA: Llenar TODOS los slots disponibles...")
         
         # FASE 1: Distribución completa por slot (prioridad: llenar slots)
+        marca = self._iniciar_fase("garantia_fase1")
         for slot in range(self.num_slots):
             # Saltar Coffee Break
-            if slot == self.slot_coffee_break:
+            if slot in self.slots_descanso:
                 continue
-            print(f"\n⏰ PROCESANDO SLOT {slot+1} ({self.horarios[slot]})...")
+            logger.debug("\n⏰ PROCESANDO SLOT %s (%s)...", slot+1, self.horarios[slot])
             
             # Determinar meta máxima según el horario
             # Slots 0-3: 10:15-11:15 (4 citas 2v + 6 citas 3v = 26 vendedores)
@@ -509,7 +1855,7 @@ class AgendaRuedaNegocios:
                 total_vendedores_meta = 23
                 periodo = "11:15-13:00"
             
-            print(f"   🎯 Meta MÁXIMA ({periodo}): {target_citas_2v} citas (2v) + {target_citas_3v} citas (3v) = {total_vendedores_meta} vendedores")
+            logger.debug("   🎯 Meta MÁXIMA (%s): %s citas (2v) + %s citas (3v) = %s vendedores", periodo, target_citas_2v, target_citas_3v, total_vendedores_meta)
             
             # TODOS los compradores disponibles (prioridad: llenar slots)
             compradores_disponibles = list(self.compradores)
@@ -517,13 +1863,13 @@ class AgendaRuedaNegocios:
             # Opcional: dar ligera prioridad a compradores con slots vacíos, pero SIN LIMITAR
             compradores_con_slots_vacios = [c for c in self.compradores 
                                           if (slots_vacios_consecutivos[c] >= 1 and 
-                                              not any(comp == c for comp, _ in self.agenda[slot]) and
+                                              not self._comprador_ocupado(c, slot) and
                                       self._verificar_disponibilidad_horaria(c, slot, es_vendedor=False))]
             
             # TODOS los compradores normales disponibles
             compradores_normales = [c for c in self.compradores 
                                   if (c not in compradores_con_slots_vacios and
-                                      not any(comp == c for comp, _ in self.agenda[slot]) and
+                                      not self._comprador_ocupado(c, slot) and
                                       self._verificar_disponibilidad_horaria(c, slot, es_vendedor=False))]
             
             # Dar ligera prioridad a compradores con slots vacíos, pero incluir TODOS
@@ -534,9 +1880,9 @@ class AgendaRuedaNegocios:
             citas_con_2_vendedores = 0
             citas_con_3_vendedores = 0
             
-            print(f"   📋 Compradores con slots vacíos: {len(compradores_con_slots_vacios)}")
-            print(f"   📋 Compradores normales: {len(compradores_normales)}")
-            print(f"   📋 TOTAL disponibles: {len(compradores_ordenados)}")
+            logger.debug("   📋 Compradores con slots vacíos: %s", len(compradores_con_slots_vacios))
+            logger.debug("   📋 Compradores normales: %s", len(compradores_normales))
+            logger.debug("   📋 TOTAL disponibles: %s", len(compradores_ordenados))
             
             # NO LIMITAR - Intentar llenar el slot con TODOS los compradores disponibles
             compradores_para_slot = compradores_ordenados
@@ -544,29 +1890,21 @@ class AgendaRuedaNegocios:
             # Asignar compradores hasta llenar completamente el slot
             for i, comprador in enumerate(compradores_para_slot):
                 # Verificar si ya alcanzamos la meta máxima de vendedores para este slot
-                vendedores_usados_actual = sum(len(vendedores) for _, vendedores in self.agenda[slot])
+                vendedores_usados_actual = self._vendedores_ocupados_en_slot(slot)
                 if vendedores_usados_actual >= total_vendedores_meta:
-                    print(f"   ⚡ Slot {slot+1} LLENO: {vendedores_usados_actual}/{total_vendedores_meta} vendedores usados")
+                    logger.debug("   ⚡ Slot %s LLENO: %s/%s vendedores usados", slot+1, vendedores_usados_actual, total_vendedores_meta)
                     break
-                # Obtener vendedores disponibles para este slot
-                vendedores_disponibles_slot = self._encontrar_vendedores_disponibles(slot)
+                # Vendedores disponibles en este slot que solicitaron a este comprador (índice de candidatos)
+                solicitantes_disponibles = self._solicitantes_disponibles(comprador, slot)
                 
                 # Buscar vendedores con preferencias para este comprador
-                candidatos = []
-                for vendedor, compradores_pref in self.preferencias_citas.items():
-                    if (comprador in compradores_pref and 
-                        vendedor in vendedores_disponibles_slot and
-                        vendedor not in self.encuentros_realizados[comprador]):
-                        candidatos.append(vendedor)
+                encuentros_comprador = self.encuentros_realizados.fila(comprador)
+                ids = self.ids_vendedor.ids
+                candidatos = [v for v in solicitantes_disponibles if not (encuentros_comprador >> ids[v]) & 1]
                 
                 # Si no hay suficientes preferidos, permitir repeticiones SOLO de vendedores que SÍ solicitaron
                 if len(candidatos) < 2:
-                    for vendedor, compradores_pref in self.preferencias_citas.items():
-                        if (comprador in compradores_pref and 
-                            vendedor in vendedores_disponibles_slot and
-                            vendedor not in candidatos and 
-                            self.citas_por_vendedor[vendedor] < self.max_citas_vendedor):
-                            candidatos.append(vendedor)
+                    candidatos.extend(v for v in solicitantes_disponibles if (encuentros_comprador >> ids[v]) & 1)
                 
                 # ESTRATEGIA DE DISTRIBUCIÓN: Alternar entre 2 y 3 vendedores
                 if candidatos:
@@ -596,16 +1934,13 @@ class AgendaRuedaNegocios:
                         
                         # Verificar que se puede agendar
                         if self._puede_agendar_cita_grupo(grupo_vendedores, comprador, slot):
-                            self.agenda[slot].append((comprador, grupo_vendedores))
+                            self._registrar_cita(slot, comprador, grupo_vendedores)
                             
                             # Actualizar contadores
                             for vendedor in grupo_vendedores:
-                                self.citas_por_vendedor[vendedor] += 1
                                 self.citas_preferencia_asignadas.add((vendedor, comprador))
-                                self.encuentros_realizados[comprador].add(vendedor)
                                 vendedores_sin_cita.discard(vendedor)
                             
-                            self.citas_por_comprador[comprador] += 1
                             compradores_sin_cita.discard(comprador)
                             
                             # Actualizar contadores de distribución
@@ -615,18 +1950,19 @@ class AgendaRuedaNegocios:
                                 citas_con_3_vendedores += 1
                             
                             vendedores_usados = len(grupo_vendedores)
-                            print(f"   ✅ {comprador} ↔ [{', '.join(grupo_vendedores)}] ({num_vendedores} vendedores - {tipo_cita})")
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug("   ✅ %s ↔ [%s] (%s vendedores - %s)", comprador, ', '.join(grupo_vendedores), num_vendedores, tipo_cita)
             
             # Reporte del slot
-            total_vendedores_usados = sum(len(vendedores) for _, vendedores in self.agenda[slot])
-            print(f"   📊 Slot {slot+1} completado:")
-            print(f"      • Citas con 2 vendedores: {citas_con_2_vendedores}/{target_citas_2v}")
-            print(f"      • Citas con 3 vendedores: {citas_con_3_vendedores}/{target_citas_3v}")
-            print(f"      • Total vendedores usados: {total_vendedores_usados}/{total_vendedores_meta}")
-            print(f"      • Total citas: {len(self.agenda[slot])}/10")
+            total_vendedores_usados = self._vendedores_ocupados_en_slot(slot)
+            logger.debug("   📊 Slot %s completado:", slot+1)
+            logger.debug("      • Citas con 2 vendedores: %s/%s", citas_con_2_vendedores, target_citas_2v)
+            logger.debug("      • Citas con 3 vendedores: %s/%s", citas_con_3_vendedores, target_citas_3v)
+            logger.debug("      • Total vendedores usados: %s/%s", total_vendedores_usados, total_vendedores_meta)
+            logger.debug("      • Total citas: %s/%s", len(self.agenda[slot]), self.max_citas_por_slot)
             
             # ACTUALIZAR CONTADORES DE SLOTS VACÍOS
-            compradores_con_cita_este_slot = {comp for comp, _ in self.agenda[slot]}
+            compradores_con_cita_este_slot = self.ocupacion_compradores[slot]
             
             for comprador in self.compradores:
                 if self._verificar_disponibilidad_horaria(comprador, slot, es_vendedor=False):
@@ -640,16 +1976,20 @@ class AgendaRuedaNegocios:
                         slots_vacios_consecutivos[comprador] += 1
                 # Si el comprador no está disponible por restricciones, no contar como vacío
             
-            print(f"   📊 Slots vacíos consecutivos: {[(c, v) for c, v in slots_vacios_consecutivos.items() if v > 0]}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("   📊 Slots vacíos consecutivos: %s", [(c, v) for c, v in slots_vacios_consecutivos.items() if v > 0])
+        
+        self._cerrar_fase(marca)
         
         # FASE 2: COMPLETAR SLOTS INCOMPLETOS
-        print(f"\n🔧 FASE 2: Completando slots que no alcanzaron la meta máxima...")
+        logger.info("\n🔧 FASE 2: Completando slots que no alcanzaron la meta máxima...")
+        marca = self._iniciar_fase("garantia_fase2")
         for slot in range(self.num_slots):
-            if slot == self.slot_coffee_break:
+            if slot in self.slots_descanso:
                 continue
                 
             # Calcular cuántos vendedores faltan para la meta máxima
-            vendedores_actuales = sum(len(vendedores) for _, vendedores in self.agenda[slot])
+            vendedores_actuales = self._vendedores_ocupados_en_slot(slot)
             if slot <= 3:
                 meta_maxima = 26
             else:
@@ -657,11 +1997,11 @@ class AgendaRuedaNegocios:
                 
             if vendedores_actuales < meta_maxima:
                 vendedores_faltantes = meta_maxima - vendedores_actuales
-                print(f"   🎯 Slot {slot+1}: {vendedores_actuales}/{meta_maxima} vendedores - Faltan {vendedores_faltantes}")
+                logger.debug("   🎯 Slot %s: %s/%s vendedores - Faltan %s", slot+1, vendedores_actuales, meta_maxima, vendedores_faltantes)
                 
                 # Intentar agregar más citas hasta llenar
                 compradores_restantes = [c for c in self.compradores 
-                                       if not any(comp == c for comp, _ in self.agenda[slot]) and
+                                       if not self._comprador_ocupado(c, slot) and
                                           self._verificar_disponibilidad_horaria(c, slot, es_vendedor=False)]
                 
                 for comprador in compradores_restantes:
@@ -669,10 +2009,8 @@ class AgendaRuedaNegocios:
                         break
                         
                     # Buscar vendedores disponibles QUE SÍ SOLICITARON a este comprador
-                    vendedores_disponibles = self._encontrar_vendedores_disponibles(slot)
-                    candidatos = [v for v in vendedores_disponibles 
-                                if (v not in self.encuentros_realizados[comprador] and 
-                                    comprador in self.preferencias_citas.get(v, []))]
+                    candidatos = [v for v in self._solicitantes_disponibles(comprador, slot, orden_vendedores=True)
+                                if not self.encuentros_realizados.contiene(comprador, v)]
                     
                     if len(candidatos) >= 2:
                         # Usar 2-3 vendedores según lo que falte
@@ -681,58 +2019,47 @@ class AgendaRuedaNegocios:
                             grupo_vendedores = candidatos[:num_vendedores]
                             
                             if self._puede_agendar_cita_grupo(grupo_vendedores, comprador, slot):
-                                self.agenda[slot].append((comprador, grupo_vendedores))
-                                
-                                # Actualizar contadores
-                                for vendedor in grupo_vendedores:
-                                    self.citas_por_vendedor[vendedor] += 1
-                                    self.encuentros_realizados[comprador].add(vendedor)
-                                
-                                self.citas_por_comprador[comprador] += 1
+                                self._registrar_cita(slot, comprador, grupo_vendedores)
                                 vendedores_actuales += num_vendedores
-                                print(f"      ✅ COMPLETADO: {comprador} ↔ [{', '.join(grupo_vendedores)}] ({num_vendedores}v)")
+                                if logger.isEnabledFor(logging.DEBUG):
+                                    logger.debug("      ✅ COMPLETADO: %s ↔ [%s] (%sv)", comprador, ', '.join(grupo_vendedores), num_vendedores)
+        
+        self._cerrar_fase(marca)
         
         # VERIFICACIÓN FINAL: Comprobar distribución (objetivo secundario)
+        marca = self._iniciar_fase("garantia_ajuste_final")
         compradores_problematicos = [(c, v) for c, v in slots_vacios_consecutivos.items() if v > 1]
         
         if compradores_problematicos:
-            print(f"\n⚠️  AJUSTE NECESARIO: {len(compradores_problematicos)} compradores con >1 slots vacíos:")
+            logger.warning("\n⚠️  AJUSTE NECESARIO: %s compradores con >1 slots vacíos:", len(compradores_problematicos))
             for comprador, slots_vacios in compradores_problematicos:
-                print(f"   • {comprador}: {slots_vacios} slots vacíos consecutivos")
+                logger.warning("   • %s: %s slots vacíos consecutivos", comprador, slots_vacios)
             
             # Forzar asignación en slots posteriores para balancear
             for comprador, _ in compradores_problematicos:
                 # Buscar el próximo slot disponible donde este comprador pueda tener cita
                 for slot in range(self.num_slots):
                     # Saltar Coffee Break
-                    if slot == self.slot_coffee_break:
+                    if slot in self.slots_descanso:
                         continue
                         
                     # Solo asignar si el comprador no tiene cita ya en este slot y está disponible
-                    comprador_ya_tiene_cita = any(comp == comprador for comp, _ in self.agenda[slot])
+                    comprador_ya_tiene_cita = self._comprador_ocupado(comprador, slot)
                     if (not comprador_ya_tiene_cita and 
                         self._verificar_disponibilidad_horaria(comprador, slot, es_vendedor=False) and
-                        len(self.agenda[slot]) < 10):  # No sobrecargar slots
+                        len(self.agenda[slot]) < self.max_citas_por_slot):  # No sobrecargar slots
                         
-                        # Buscar vendedores disponibles (incluso si solo hay 1)
-                        vendedores_disponibles_slot = self._encontrar_vendedores_disponibles(slot)
+                        # Buscar vendedores disponibles (incluso si solo hay 1) QUE SÍ SOLICITARON a este comprador
+                        solicitantes_disponibles = self._solicitantes_disponibles(comprador, slot, orden_vendedores=True)
                         
-                        # Filtrar vendedores que SÍ SOLICITARON a este comprador y no se hayan reunido
-                        candidatos = []
-                        for v in vendedores_disponibles_slot:
-                            # VERIFICAR QUE EL VENDEDOR SÍ SOLICITÓ A ESTE COMPRADOR
-                            if (v not in self.encuentros_realizados[comprador] and 
-                                comprador in self.preferencias_citas.get(v, [])):
-                                candidatos.append(v)
+                        # Filtrar vendedores que no se hayan reunido con este comprador
+                        candidatos = [v for v in solicitantes_disponibles
+                                      if not self.encuentros_realizados.contiene(comprador, v)]
                         
                         # Si no hay candidatos válidos, NO asignar cita inválida
                         if not candidatos:
                             # Buscar candidatos que solicitaron al comprador (aunque ya se hayan reunido)
-                            candidatos_repetidos = []
-                            for v in vendedores_disponibles_slot:
-                                if comprador in self.preferencias_citas.get(v, []):
-                                    candidatos_repetidos.append(v)
-                            candidatos = candidatos_repetidos
+                            candidatos = solicitantes_disponibles
                         
                         if candidatos:
                             # Usar estrategia balanceada incluso en emergencia según el período
@@ -758,44 +2085,43 @@ class AgendaRuedaNegocios:
                             
                             # Verificar disponibilidad final
                             if self._puede_agendar_cita_grupo(grupo_vendedores, comprador, slot):
-                                self.agenda[slot].append((comprador, grupo_vendedores))
+                                self._registrar_cita(slot, comprador, grupo_vendedores)
                                 
                                 # Actualizar contadores
                                 for vendedor in grupo_vendedores:
-                                    self.citas_por_vendedor[vendedor] += 1
                                     self.citas_preferencia_asignadas.add((vendedor, comprador))
-                                    self.encuentros_realizados[comprador].add(vendedor)
                                     vendedores_sin_cita.discard(vendedor)
                                 
-                                self.citas_por_comprador[comprador] += 1
                                 compradores_sin_cita.discard(comprador)
                                 
-                                print(f"   🆘 EMERGENCIA: {comprador} ↔ [{', '.join(grupo_vendedores)}] (slot {slot+1})")
+                                if logger.isEnabledFor(logging.DEBUG):
+                                    logger.debug("   🆘 EMERGENCIA: %s ↔ [%s] (slot %s)", comprador, ', '.join(grupo_vendedores), slot+1)
                                 break  # Salir del bucle de slots para este comprador
+        self._cerrar_fase(marca)
         
         # Reportes finales
         compradores_con_cita = len(self.compradores) - len(compradores_sin_cita)
         vendedores_con_cita = len(self.vendedores) - len(vendedores_sin_cita)
         
-        print(f"\n📊 REPORTE FINAL DE DISTRIBUCIÓN EQUILIBRADA:")
-        print(f"   👥 Compradores asignados: {compradores_con_cita}/{len(self.compradores)}")
-        print(f"   🏪 Vendedores asignados: {vendedores_con_cita}/{len(self.vendedores)}")
+        logger.info("\n📊 REPORTE FINAL DE DISTRIBUCIÓN EQUILIBRADA:")
+        logger.info("   👥 Compradores asignados: %s/%s", compradores_con_cita, len(self.compradores))
+        logger.info("   🏪 Vendedores asignados: %s/%s", vendedores_con_cita, len(self.vendedores))
         
         # Calcular distribución real por slot (todos los slots con citas)
         slots_con_citas = [(slot, len(self.agenda[slot])) for slot in range(self.num_slots) if self.agenda[slot]]
         
-        print(f"📈 DISTRIBUCIÓN FINAL EN {len(slots_con_citas)} SLOTS:")
+        logger.info("📈 DISTRIBUCIÓN FINAL EN %s SLOTS:", len(slots_con_citas))
         for slot, num_citas in slots_con_citas:
-            print(f"   Slot {slot+1} ({self.horarios[slot]}): {num_citas} citas")
+            logger.debug("   Slot %s (%s): %s citas", slot+1, self.horarios[slot], num_citas)
         
         # Verificar cumplimiento de la regla "máximo 1 slot vacío consecutivo"
         violaciones = [(c, v) for c, v in slots_vacios_consecutivos.items() if v > 1]
         if violaciones:
-            print(f"   ⚠️  VIOLACIONES (>1 slot vacío): {len(violaciones)} compradores")
+            logger.warning("   ⚠️  VIOLACIONES (>1 slot vacío): %s compradores", len(violaciones))
             for comprador, slots_vacios in violaciones[:3]:  # Mostrar solo primeros 3
-                print(f"      • {comprador}: {slots_vacios} slots vacíos consecutivos")
+                logger.warning("      • %s: %s slots vacíos consecutivos", comprador, slots_vacios)
         else:
-            print(f"   ✅ REGLA CUMPLIDA: Ningún comprador tiene >1 slot vacío consecutivo")
+            logger.info("   ✅ REGLA CUMPLIDA: Ningún comprador tiene >1 slot vacío consecutivo")
         
         # Mostrar distribución detallada solo para primeros slots
         for slot in range(min(5, self.num_slots)):
@@ -810,27 +2136,35 @@ class AgendaRuedaNegocios:
                 else:  # 11:15-13:00
                     meta_descripcion = "4 citas (2v) + 5 citas (3v) = 23 vendedores"
                 
-                print(f"   📈 Slot {slot+1}: {citas_2v} citas (2v) + {citas_3v} citas (3v) = {total_vendedores_slot} vendedores (Meta: {meta_descripcion})")
+                logger.debug("   📈 Slot %s: %s citas (2v) + %s citas (3v) = %s vendedores (Meta: %s)", slot+1, citas_2v, citas_3v, total_vendedores_slot, meta_descripcion)
         
         if compradores_sin_cita:
-            print(f"   ⚠️  Compradores pendientes: {list(compradores_sin_cita)}")
+            logger.warning("   ⚠️  Compradores pendientes: %s", list(compradores_sin_cita))
         
         if vendedores_sin_cita:
-            print(f"   ⚠️  Vendedores pendientes: {list(vendedores_sin_cita)}")
+            logger.warning("   ⚠️  Vendedores pendientes: %s", list(vendedores_sin_cita))
             
         if not compradores_sin_cita:
-            print(f"   🎉 ¡ÉXITO! TODOS los compradores asignados con distribución estratégica!")
+            logger.info("   🎉 ¡ÉXITO! TODOS los compradores asignados con distribución estratégica!")
         
         # Ya se mostró la distribución final arriba, no necesitamos duplicar
 
     def _buscar_slot_disponible(self, vendedores: List[str], comprador: str) -> Optional[int]:
         """Busca un slot disponible para el grupo de vendedores y comprador"""
-        for slot in range(self.num_slots):
-            # Saltar Coffee Break (slot 6: 10:00-10:15)
-            if slot == self.slot_coffee_break:
-                continue
+        # Slots libres en común para todo el grupo: un AND de las máscaras de ocupación
+        candidatos = self.slots_libres_comprador.get(comprador, self.mascara_todos_slots)
+        for vendedor in vendedores:
+            candidatos &= self.slots_libres_vendedor.get(vendedor, self.mascara_todos_slots)
+        # Saltar Coffee Break y demás descansos
+        candidatos &= self.mascara_slots_habiles
+
+        # Recorrer los bits encendidos del menor al mayor (slot más temprano primero)
+        while candidatos:
+            bit_menor = candidatos & -candidatos
+            slot = bit_menor.bit_length() - 1
             if self._puede_agendar_cita_grupo(vendedores, comprador, slot):
                 return slot
+            candidatos ^= bit_menor
         return None
 
     def _asignar_vendedores_restantes(self, vendedores_restantes: List[str], comprador_preferido: str):
@@ -840,34 +2174,28 @@ class AgendaRuedaNegocios:
             
             # Intentar agregar a una cita existente del comprador preferido que tenga espacio
             for slot in range(self.num_slots):
-                # Saltar Coffee Break (slot 6: 10:00-10:15)
-                if slot == self.slot_coffee_break:
+                # Saltar Coffee Break y demás descansos
+                if slot in self.slots_descanso:
                     continue
-                for i, (comprador, vendedores_en_cita) in enumerate(self.agenda[slot]):
-                    if (comprador == comprador_preferido and 
-                        len(vendedores_en_cita) < 3 and  # Máximo 3, pero preferir 2
-                        vendedor not in vendedores_en_cita and
-                        vendedor not in self.encuentros_realizados[comprador] and  # Nueva verificación
-                        self.citas_por_vendedor[vendedor] < self.max_citas_vendedor):
+                # Cita del comprador preferido en este slot (a lo sumo una)
+                i = self.ocupacion_compradores[slot].get(comprador_preferido)
+                if i is None:
+                    continue
+                comprador, vendedores_en_cita = self.agenda[slot][i]
+                if (len(vendedores_en_cita) < 3 and  # Máximo 3, pero preferir 2
+                    vendedor not in vendedores_en_cita and
+                    not self.encuentros_realizados.contiene(comprador, vendedor) and  # Nueva verificación
+                    self.citas_por_vendedor[vendedor] < self.max_citas_vendedor):
+                    
+                    # Solo agregar si la cita tiene 1 vendedor (para llegar a 2) o si hay mucha demanda
+                    if len(vendedores_en_cita) == 1 or (len(vendedores_en_cita) == 2 and self.citas_por_vendedor[vendedor] < 2):
                         
-                        # Solo agregar si la cita tiene 1 vendedor (para llegar a 2) o si hay mucha demanda
-                        if len(vendedores_en_cita) == 1 or (len(vendedores_en_cita) == 2 and self.citas_por_vendedor[vendedor] < 2):
-                            
-                            # Verificar que el vendedor no esté ocupado en este slot
-                            vendedor_ocupado_en_slot = any(
-                                vendedor in otros_vendedores 
-                                for _, otros_vendedores in self.agenda[slot]
-                            )
-                            
-                            if not vendedor_ocupado_en_slot:
-                                self.agenda[slot][i] = (comprador, vendedores_en_cita + [vendedor])
-                                self.citas_por_vendedor[vendedor] += 1
-                                self.citas_preferencia_asignadas.add((vendedor, comprador))
-                                # Registrar encuentro realizado
-                                self.encuentros_realizados[comprador].add(vendedor)
-                                print(f"✓ Vendedor agregado a cita existente: {vendedor} → {comprador}")
-                                asignado = True
-                                break
+                        # Verificar que el vendedor no esté ocupado en este slot
+                        if not self._vendedor_ocupado(vendedor, slot):
+                            self._agregar_vendedor_a_cita(slot, i, vendedor)
+                            self.citas_preferencia_asignadas.add((vendedor, comprador))
+                            logger.debug("✓ Vendedor agregado a cita existente: %s → %s", vendedor, comprador)
+                            asignado = True
                 if asignado:
                     break
 
@@ -882,7 +2210,7 @@ class AgendaRuedaNegocios:
         
         for vendedor in self.vendedores:
             if (vendedor not in vendedores_base and
-                vendedor not in self.encuentros_realizados[comprador] and  # Nueva verificación
+                not self.encuentros_realizados.contiene(comprador, vendedor) and  # Nueva verificación
                 self.citas_por_vendedor[vendedor] < self.max_citas_vendedor):
                 candidatos.append(vendedor)
         
@@ -892,44 +2220,141 @@ class AgendaRuedaNegocios:
         
         return candidatos[:necesarios]
 
-    def _validar_agenda_sin_conflictos(self) -> Dict[str, any]:
-        """Valida que la agenda final no tenga conflictos de vendedores con citas simultáneas"""
+    def validar_agenda(self) -> Dict[str, any]:
+        """Valida toda la agenda en una sola pasada con tablas hash
+
+        Detecta todos los TIPOS_VIOLACION: vendedor o comprador en dos citas del mismo slot,
+        participante con doble rol que compra y vende en el mismo slot, citas fuera de la
+        ventana de disponibilidad (o en un descanso), encuentros repetidos, grupos por encima
+        del límite, vendedores sobre su tope y pares prohibidos. Cada conflicto indica tipo,
+        slot, comprador, vendedores y un detalle legible.
+        """
         conflictos_detectados = []
         vendedores_con_conflictos = set()
-        
-        # Revisar cada slot para detectar conflictos
-        for slot in range(self.num_slots):
-            citas_en_slot = self.agenda[slot]
-            
-            # Verificar cada par de citas en el mismo slot
-            for i, (comprador1, vendedores1) in enumerate(citas_en_slot):
-                for j, (comprador2, vendedores2) in enumerate(citas_en_slot):
-                    if i < j:  # Evitar comparar la misma cita dos veces
-                        # Buscar vendedores que aparecen en ambas citas
-                        vendedores_repetidos = set(vendedores1) & set(vendedores2)
-                        if vendedores_repetidos:
-                            conflicto = {
-                                "slot": slot,
-                                "horario": self.horarios[slot],
-                                "vendedores_en_conflicto": list(vendedores_repetidos),
-                                "cita1": {"comprador": comprador1, "vendedores": vendedores1},
-                                "cita2": {"comprador": comprador2, "vendedores": vendedores2}
-                            }
-                            conflictos_detectados.append(conflicto)
-                            vendedores_con_conflictos.update(vendedores_repetidos)
-        
+        habiles = self.mascara_slots_habiles
+        disponibilidad_vendedor = self.disponibilidad_vendedor
+        disponibilidad_comprador = self.disponibilidad_comprador
+        pares_prohibidos = self.pares_prohibidos
+        primer_encuentro = {}  # (comprador, vendedor) -> slot del primer encuentro
+        citas_vendedor = {}
+
+        def registrar(tipo, slot, comprador, vendedores, detalle):
+            conflictos_detectados.append({
+                "tipo": tipo,
+                "slot": slot,
+                "horario": self.horarios[slot],
+                "comprador": comprador,
+                "vendedores": vendedores,
+                "detalle": detalle
+            })
+            vendedores_con_conflictos.update(vendedores)
+
+        for slot, citas in self.agenda.items():
+            bit = 1 << slot
+            comprador_de_vendedor = {}  # vendedor -> comprador con el que ya está en este slot
+            compradores_en_slot = set()
+
+            for cita in citas:
+                comprador, vendedores = cita.comprador, cita.vendedores
+                if comprador in compradores_en_slot:
+                    registrar("comprador_doble", slot, comprador, list(vendedores), "comprador con dos citas en el slot")
+                compradores_en_slot.add(comprador)
+                if not disponibilidad_comprador.get(comprador, habiles) & bit:
+                    registrar("fuera_de_ventana", slot, comprador, list(vendedores), "comprador fuera de su ventana")
+                if len(vendedores) > self.vendedores_por_cita:
+                    registrar("grupo_excedido", slot, comprador, list(vendedores),
+                              f"{len(vendedores)} vendedores (máximo {self.vendedores_por_cita})")
+
+                for vendedor in vendedores:
+                    otro_comprador = comprador_de_vendedor.get(vendedor)
+                    if otro_comprador is not None:
+                        registrar("vendedor_doble", slot, comprador, [vendedor], f"también con {otro_comprador}")
+                    else:
+                        comprador_de_vendedor[vendedor] = comprador
+                    if not disponibilidad_vendedor.get(vendedor, habiles) & bit:
+                        registrar("fuera_de_ventana", slot, comprador, [vendedor], "vendedor fuera de su ventana")
+                    par = (comprador, vendedor)
+                    slot_anterior = primer_encuentro.get(par)
+                    if slot_anterior is not None:
+                        registrar("encuentro_repetido", slot, comprador, [vendedor],
+                                  f"ya se reunieron a las {self.horarios[slot_anterior]}")
+                    else:
+                        primer_encuentro[par] = slot
+                    if par in pares_prohibidos:
+                        registrar("par_prohibido", slot, comprador, [vendedor], "par prohibido por la configuración")
+                    total_vendedor = citas_vendedor.get(vendedor, 0) + 1
+                    citas_vendedor[vendedor] = total_vendedor
+                    if total_vendedor == self.max_citas_vendedor + 1:
+                        registrar("vendedor_sobre_tope", slot, comprador, [vendedor],
+                                  f"supera el máximo de {self.max_citas_vendedor} citas")
+
+            # Participantes con doble rol: el mismo nombre no puede comprar y vender a la vez
+            for participante in sorted(compradores_en_slot.intersection(comprador_de_vendedor)):
+                registrar("participante_doble", slot, participante, [participante],
+                          f"compra y a la vez vende a {comprador_de_vendedor[participante]}")
+
+        por_tipo = {tipo: 0 for tipo in TIPOS_VIOLACION}
+        for conflicto in conflictos_detectados:
+            por_tipo[conflicto["tipo"]] += 1
         return {
             "tiene_conflictos": len(conflictos_detectados) > 0,
             "total_conflictos": len(conflictos_detectados),
+            "por_tipo": por_tipo,
             "conflictos": conflictos_detectados,
-            "vendedores_afectados": list(vendedores_con_conflictos)
+            "vendedores_afectados": sorted(vendedores_con_conflictos)
         }
 
+    def activar_validacion_continua(self, activa: bool = True):
+        """Modo depuración: valida toda la agenda después de cada alta o baja de cita
+
+        Igual que la instrumentación, apagada no tiene costo: los envoltorios de
+        METODOS_MUTACION solo se instalan en la instancia al activarla. Cada violación nueva
+        se registra como error junto con el método que la produjo y queda en
+        self.validacion_continua["violaciones"].
+        """
+        for nombre in METODOS_MUTACION:
+            self.__dict__.pop(nombre, None)
+        if not activa:
+            self.validacion_continua = None
+            return
+
+        self.validacion_continua = {"validaciones": 0, "violaciones": []}
+        estado = self.validacion_continua
+        conocidas = set()
+
+        def validar_despues(nombre, metodo):
+            def envoltorio(*args, **kwargs):
+                resultado = metodo(*args, **kwargs)
+                estado["validaciones"] += 1
+                actuales = set()
+                for conflicto in self.validar_agenda()["conflictos"]:
+                    clave = (conflicto["tipo"], conflicto["slot"], conflicto["comprador"], tuple(conflicto["vendedores"]))
+                    actuales.add(clave)
+                    if clave not in conocidas:
+                        logger.error("🔴 %s%s produjo %s en %s: %s con %s (%s)", nombre, args, conflicto["tipo"],
+                                     conflicto["horario"], conflicto["comprador"], conflicto["vendedores"],
+                                     conflicto["detalle"])
+                        estado["violaciones"].append({"metodo": nombre, **conflicto})
+                conocidas.clear()
+                conocidas.update(actuales)
+                return resultado
+            return envoltorio
+
+        for nombre in METODOS_MUTACION:
+            setattr(self, nombre, validar_despues(nombre, getattr(type(self), nombre).__get__(self)))
+
+    def vista_tensorial(self) -> Optional[VistaTensorial]:
+        """Agenda como arreglos NumPy para validar y resumir de forma vectorizada (None sin NumPy)"""
+        if not NUMPY_DISPONIBLE:
+            logger.warning("⚠️  NumPy no está instalado. Instale con: pip install numpy")
+            return None
+        return VistaTensorial(self)
+
     def _completar_agenda_restante(self):
         """Completa la agenda manteniendo la estrategia: 4 citas (2v) + 6 citas (3v) antes 11:15, 4 citas (2v) + 5 citas (3v) después"""
         for slot in range(self.num_slots):
-            # Saltar Coffee Break (slot 6: 10:00-10:15)
-            if slot == self.slot_coffee_break:
+            # Saltar Coffee Break y demás descansos
+            if slot in self.slots_descanso:
                 continue
             # Para cada slot, intentar agendar citas manteniendo distribución estratégica
             citas_actuales_slot = len(self.agenda[slot])
@@ -944,25 +2369,21 @@ class AgendaRuedaNegocios:
             
             for comprador in self.compradores:
                 # Verificar si este comprador ya tiene una cita en este slot
-                comprador_ocupado = any(comp == comprador for comp, _ in self.agenda[slot])
+                comprador_ocupado = self._comprador_ocupado(comprador, slot)
                 
-                if not comprador_ocupado and citas_actuales_slot < 10:  # Máximo 10 citas por slot
-                    # Encontrar vendedores disponibles para este slot
-                    vendedores_disponibles = self._encontrar_vendedores_disponibles(slot)
+                if not comprador_ocupado and citas_actuales_slot < self.max_citas_por_slot:  # Máximo 10 citas por slot (por defecto)
+                    # Vendedores disponibles en este slot que SÍ SOLICITARON a este comprador
+                    solicitantes_disponibles = self._solicitantes_disponibles(comprador, slot, orden_vendedores=True)
                     
-                    # Filtrar vendedores que SÍ SOLICITARON a este comprador y no se hayan reunido
+                    # Filtrar vendedores que no se hayan reunido con este comprador
                     vendedores_no_repetidos = [
-                        v for v in vendedores_disponibles 
-                        if (v not in self.encuentros_realizados[comprador] and
-                            comprador in self.preferencias_citas.get(v, []))
+                        v for v in solicitantes_disponibles
+                        if not self.encuentros_realizados.contiene(comprador, v)
                     ]
                     
                     # Si no hay candidatos válidos sin repetir, buscar candidatos que solicitaron (aunque repetidos)
                     if not vendedores_no_repetidos:
-                        vendedores_no_repetidos = [
-                            v for v in vendedores_disponibles
-                            if comprador in self.preferencias_citas.get(v, [])
-                        ]
+                        vendedores_no_repetidos = solicitantes_disponibles
                     
                     # Decidir número de vendedores según estrategia de distribución
                     if len(vendedores_no_repetidos) >= 2:
@@ -987,18 +2408,13 @@ class AgendaRuedaNegocios:
                         
                         # Verificar que se puede agendar
                         if self._puede_agendar_cita_grupo(grupo_vendedores, comprador, slot):
-                            self.agenda[slot].append((comprador, grupo_vendedores))
-                            for vendedor in grupo_vendedores:
-                                self.citas_por_vendedor[vendedor] += 1
-                                # Registrar encuentro realizado
-                                self.encuentros_realizados[comprador].add(vendedor)
-                            self.citas_por_comprador[comprador] += 1
+                            self._registrar_cita(slot, comprador, grupo_vendedores)
                             citas_actuales_slot += 1
 
     def _encontrar_comprador_disponible(self, slot: int) -> Optional[str]:
         """Encuentra un comprador disponible para el slot"""
         # Compradores ya ocupados en este slot
-        ocupados = {comprador for comprador, _ in self.agenda[slot]}
+        ocupados = self.ocupacion_compradores[slot]
         
         # Buscar comprador con menos citas asignadas
         comprador_menos_citas = None
@@ -1012,7 +2428,11 @@ class AgendaRuedaNegocios:
         return comprador_menos_citas
 
     def _formatear_resultado(self) -> Dict:
-        """Formatea el resultado de la agenda"""
+        """Formatea el resultado de la agenda
+
+        Los resúmenes por vendedor y por comprador se construyen en una sola pasada sobre la
+        agenda formateada, la primera vez que se leen o al serializar (ver ResultadoAgenda).
+        """
         resultado = {
             "configuracion": {
                 "vendedores": self.num_vendedores,
@@ -1028,9 +2448,6 @@ class AgendaRuedaNegocios:
             },
             "agenda": {},
             "estadisticas": {},
-            "resumen_por_vendedor": {},
-            "resumen_por_comprador": {},
-            "preferencias_cumplidas": {}
         }
         
         # Agenda por horarios
@@ -1042,7 +2459,7 @@ class AgendaRuedaNegocios:
                 for comprador, vendedores in citas:
                     citas_formateadas.append({
                         "comprador": comprador,
-                        "vendedores": vendedores
+                        "vendedores": list(vendedores)
                     })
                     total_encuentros += len(vendedores)  # 3 encuentros por cita
                 resultado["agenda"][self.horarios[slot]] = citas_formateadas
@@ -1059,41 +2476,8 @@ class AgendaRuedaNegocios:
             "total_preferencias": sum(len(compradores) for compradores in self.preferencias_citas.values())
         }
         
-        # Resumen por vendedor
-        for vendedor in self.vendedores:
-            citas_vendedor = []
-            for slot, citas in self.agenda.items():
-                for comprador, vendedores in citas:
-                    if vendedor in vendedores:
-                        citas_vendedor.append({
-                            "horario": self.horarios[slot],
-                            "comprador": comprador,
-                            "otros_vendedores": [v for v in vendedores if v != vendedor]
-                        })
-            
-            resultado["resumen_por_vendedor"][vendedor] = {
-                "total_citas": len(citas_vendedor),
-                "citas": citas_vendedor
-            }
-        
-        # Resumen por comprador
-        for comprador in self.compradores:
-            citas_comprador = []
-            for slot, citas in self.agenda.items():
-                for comp, vendedores in citas:
-                    if comp == comprador:
-                        citas_comprador.append({
-                            "horario": self.horarios[slot],
-                            "vendedores": vendedores
-                        })
-            
-            resultado["resumen_por_comprador"][comprador] = {
-                "total_citas": len(citas_comprador),
-                "citas": citas_comprador
-            }
-        
         # Preferencias cumplidas
-        preferencias_totales = sum(len(compradores) for compradores in self.preferencias_citas.values())
+        preferencias_cumplidas = {}
         for vendedor, compradores_pref in self.preferencias_citas.items():
             vendedor_preferencias = []
             for comprador in compradores_pref:
@@ -1102,95 +2486,86 @@ class AgendaRuedaNegocios:
                     "comprador": comprador,
                     "cumplida": cumplida
                 })
-            resultado["preferencias_cumplidas"][vendedor] = vendedor_preferencias
+            preferencias_cumplidas[vendedor] = vendedor_preferencias
         
+        resultado = ResultadoAgenda(resultado, self.vendedores, self.compradores)
+        resultado["preferencias_cumplidas"] = preferencias_cumplidas
         return resultado
 
     def imprimir_agenda(self, resultado: Dict):
-        """Imprime la agenda de forma legible"""
-        print("\n" + "="*80)
-        print("AGENDA DE RUEDA DE NEGOCIOS")
-        print("="*80)
+        """Muestra la agenda de forma legible (estadísticas y matriz en INFO, detalle en DEBUG)"""
+        # En modo silencioso no se arma ninguna línea
+        if not logger.isEnabledFor(logging.INFO):
+            return
         
-        print(f"\nESTADÍSTICAS:")
+        lineas = ["\n" + "="*80, "AGENDA DE RUEDA DE NEGOCIOS", "="*80]
+        
+        lineas.append("\nESTADÍSTICAS:")
         stats = resultado["estadisticas"]
-        print(f"• Total de citas programadas: {stats['total_citas_programadas']}")
-        print(f"• Total encuentros individuales: {stats['total_encuentros_individuales']}")
-        print(f"• Utilización de slots: {stats['porcentaje_utilizacion_slots']}")
-        print(f"• Promedio citas por vendedor: {stats['citas_promedio_por_vendedor']}")
-        print(f"• Promedio citas por comprador: {stats['citas_promedio_por_comprador']}")
-        print(f"• Preferencias cumplidas: {stats['preferencias_cumplidas']}/{stats['total_preferencias']}")
+        lineas.append(f"• Total de citas programadas: {stats['total_citas_programadas']}")
+        lineas.append(f"• Total encuentros individuales: {stats['total_encuentros_individuales']}")
+        lineas.append(f"• Utilización de slots: {stats['porcentaje_utilizacion_slots']}")
+        lineas.append(f"• Promedio citas por vendedor: {stats['citas_promedio_por_vendedor']}")
+        lineas.append(f"• Promedio citas por comprador: {stats['citas_promedio_por_comprador']}")
+        lineas.append(f"• Preferencias cumplidas: {stats['preferencias_cumplidas']}/{stats['total_preferencias']}")
         
         # Matriz Compradores-Horarios resumida
-        print(f"\nMATRIZ COMPRADORES-HORARIOS:")
-        print("-" * 80)
+        lineas.append("\nMATRIZ COMPRADORES-HORARIOS:")
+        lineas.append("-" * 80)
         
         # Crear matriz resumida para mostrar
         compradores_activos = [c for c in self.compradores if self.citas_por_comprador[c] > 0]
-        horarios_con_citas = []
-        
-        for slot in range(self.num_slots):
-            if len(self.agenda[slot]) > 0:
-                horarios_con_citas.append(self.horarios[slot])
+        slots_con_citas = [slot for slot in range(self.num_slots) if len(self.agenda[slot]) > 0]
         
         # Mostrar solo primeros 6 horarios con citas para el resumen
-        horarios_muestra = horarios_con_citas[:6] if len(horarios_con_citas) > 6 else horarios_con_citas
+        slots_muestra = slots_con_citas[:6]
+        hay_mas_horarios = len(slots_con_citas) > 6
         
         # Encabezado de la matriz
-        print(f"{'COMPRADOR':<25}", end="")
-        for horario in horarios_muestra:
-            print(f"{horario:>15}", end="")
-        if len(horarios_con_citas) > 6:
-            print(f"{'...':>15}", end="")
-        print()
-        print("-" * (25 + len(horarios_muestra) * 15 + (15 if len(horarios_con_citas) > 6 else 0)))
+        encabezado = f"{'COMPRADOR':<25}" + "".join(f"{self.horarios[slot]:>15}" for slot in slots_muestra)
+        if hay_mas_horarios:
+            encabezado += f"{'...':>15}"
+        lineas.append(encabezado)
+        lineas.append("-" * (25 + len(slots_muestra) * 15 + (15 if hay_mas_horarios else 0)))
         
         # Filas de compradores
         for comprador in compradores_activos[:8]:  # Mostrar solo primeros 8 compradores
-            print(f"{comprador[:24]:<25}", end="")
-            
-            for horario in horarios_muestra:
-                # Buscar vendedores para este comprador en este horario
-                vendedores_en_horario = []
-                slot_idx = self.horarios.index(horario) if horario in self.horarios else -1
-                
-                if slot_idx >= 0 and slot_idx < len(self.agenda):
-                    for cita_comprador, cita_vendedores in self.agenda[slot_idx]:
-                        if cita_comprador == comprador:
-                            vendedores_en_horario.extend(cita_vendedores)
+            fila = f"{comprador[:24]:<25}"
+            for slot in slots_muestra:
+                # Vendedores de este comprador en este horario (consulta al índice de ocupación)
+                indice_cita = self.ocupacion_compradores[slot].get(comprador)
+                vendedores_en_horario = self.agenda[slot][indice_cita][1] if indice_cita is not None else []
                 
                 # Mostrar vendedores (máximo 2 para que quepa)
-                if vendedores_en_horario:
-                    vendedores_texto = ", ".join([v[:8] for v in vendedores_en_horario[:2]])
-                    if len(vendedores_en_horario) > 2:
-                        vendedores_texto += "..."
-                    print(f"{vendedores_texto[:14]:>15}", end="")
-                else:
-                    print(f"{'':>15}", end="")
-            
-            if len(horarios_con_citas) > 6:
-                print(f"{'':>15}", end="")
-            print()
+                vendedores_texto = ", ".join([v[:8] for v in vendedores_en_horario[:2]])
+                if len(vendedores_en_horario) > 2:
+                    vendedores_texto += "..."
+                fila += f"{vendedores_texto[:14]:>15}"
+            if hay_mas_horarios:
+                fila += f"{'':>15}"
+            lineas.append(fila)
         
         if len(compradores_activos) > 8:
-            print(f"{'... y ' + str(len(compradores_activos) - 8) + ' más':<25}")
+            lineas.append(f"{'... y ' + str(len(compradores_activos) - 8) + ' más':<25}")
         
-        print(f"\n💡 Matriz completa disponible en: agenda_rueda_negocios.xlsx (Hoja: Matriz Compradores-Horarios)")
+        lineas.append("\n💡 Matriz completa disponible en: agenda_rueda_negocios.xlsx (Hoja: Matriz Compradores-Horarios)")
+        logger.info("%s", "\n".join(lineas))
         
-        print(f"\nAGENDA POR HORARIOS:")
-        print("-"*80)
+        # El detalle cita por cita solo se arma en nivel DEBUG
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         
+        lineas = ["\nAGENDA POR HORARIOS:", "-"*80]
         for horario, citas in resultado["agenda"].items():
-            print(f"\n{horario}")
-            print("-" * 50)
+            lineas.append(f"\n{horario}")
+            lineas.append("-" * 50)
             for i, cita in enumerate(citas, 1):
-                vendedores_str = ", ".join(cita['vendedores'])
-                print(f"  Cita {i}: {cita['comprador']} ↔ [{vendedores_str}]")
+                lineas.append(f"  Cita {i}: {cita['comprador']} ↔ [{', '.join(cita['vendedores'])}]")
         
         # Mostrar preferencias cumplidas
         if resultado.get("preferencias_cumplidas"):
-            print(f"\nPREFERENCIAS DE CITAS:")
-            print("-"*50)
+            lineas.append("\nPREFERENCIAS DE CITAS:")
+            lineas.append("-"*50)
             cumplidas_total = 0
             total_preferencias = 0
             
@@ -1198,15 +2573,22 @@ class AgendaRuedaNegocios:
                 for pref in preferencias_vendedor:
                     total_preferencias += 1
                     estado = "✓" if pref["cumplida"] else "✗"
-                    print(f"  {estado} {vendedor} → {pref['comprador']}")
+                    lineas.append(f"  {estado} {vendedor} → {pref['comprador']}")
                     if pref["cumplida"]:
                         cumplidas_total += 1
             
-            print(f"\nTotal cumplidas: {cumplidas_total}/{total_preferencias}")
+            lineas.append(f"\nTotal cumplidas: {cumplidas_total}/{total_preferencias}")
+        logger.debug("%s", "\n".join(lineas))
+
+    def _ruta_salida(self, nombre_archivo: str) -> str:
+        """Ruta de un archivo exportado: se respeta una ruta absoluta, si no va a la carpeta del proyecto"""
+        if os.path.isabs(nombre_archivo):
+            return nombre_archivo
+        return f"c:\\Users\\angel\\OneDrive\\Escritorio\\escritorio\\Angela\\Programación agenda\\{nombre_archivo}"
 
     def exportar_a_csv(self, resultado: Dict, nombre_archivo: str = "agenda_rueda_negocios.csv"):
         """Exporta la agenda a un archivo CSV"""
-        ruta_archivo = f"c:\\Users\\angel\\OneDrive\\Escritorio\\escritorio\\Angela\\Programación agenda\\{nombre_archivo}"
+        ruta_archivo = self._ruta_salida(nombre_archivo)
         
         with open(ruta_archivo, 'w', newline='', encoding='utf-8') as csvfile:
             writer = csv.writer(csvfile)
@@ -1220,11 +2602,11 @@ class AgendaRuedaNegocios:
                     vendedores = cita['vendedores'] + [''] * (3 - len(cita['vendedores']))  # Asegurar 3 columnas
                     writer.writerow([horario, cita['comprador']] + vendedores[:3])
         
-        print(f"\nAgenda exportada a: {ruta_archivo}")
+        logger.info("\nAgenda exportada a: %s", ruta_archivo)
 
     def exportar_resumen_vendedores(self, resultado: Dict, nombre_archivo: str = "resumen_vendedores.csv"):
         """Exporta el resumen por vendedores a CSV"""
-        ruta_archivo = f"c:\\Users\\angel\\OneDrive\\Escritorio\\escritorio\\Angela\\Programación agenda\\{nombre_archivo}"
+        ruta_archivo = self._ruta_salida(nombre_archivo)
         
         with open(ruta_archivo, 'w', newline='', encoding='utf-8') as csvfile:
             writer = csv.writer(csvfile)
@@ -1253,310 +2635,51 @@ class AgendaRuedaNegocios:
                 else:
                     writer.writerow([vendedor, 0, 'Sin citas', 'Sin citas', preferencia_cumplida])
         
-        print(f"Resumen de vendedores exportado a: {ruta_archivo}")
+        logger.info("Resumen de vendedores exportado a: %s", ruta_archivo)
 
     def generar_excel_completo(self, resultado: Dict, nombre_archivo: str = "agenda_rueda_negocios.xlsx"):
-        """Genera un archivo Excel completo con múltiples hojas basado en agenda_completa.json"""
-        try:
-            import openpyxl
-            from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-            from openpyxl.utils import get_column_letter
-        except ImportError:
-            print("Error: Se requiere instalar openpyxl para generar Excel.")
-            print("Ejecuta: pip install openpyxl")
+        """Genera un archivo Excel completo con múltiples hojas basado en agenda_completa.json
+
+        Las hojas se escriben fila por fila en modo solo escritura (ver excel_agenda.py).
+        """
+        if not OPENPYXL_DISPONIBLE:
+            logger.error("Error: Se requiere instalar openpyxl para generar Excel.")
+            logger.error("Ejecuta: pip install openpyxl")
             return None
         
-        ruta_archivo = f"c:\\Users\\angel\\OneDrive\\Escritorio\\escritorio\\Angela\\Programación agenda\\{nombre_archivo}"
-        
-        # Crear workbook y eliminar hoja por defecto
-        wb = openpyxl.Workbook()
-        wb.remove(wb.active)
-        
-        # Estilos
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="2C3E50", end_color="2C3E50", fill_type="solid")
-        subheader_fill = PatternFill(start_color="3498DB", end_color="3498DB", fill_type="solid")
-        accent_fill = PatternFill(start_color="ECF0F1", end_color="ECF0F1", fill_type="solid")
-        border = Border(left=Side(style='thin'), right=Side(style='thin'), 
-                       top=Side(style='thin'), bottom=Side(style='thin'))
-        center_align = Alignment(horizontal='center', vertical='center')
-        
-        # 1. HOJA: Resumen General
-        ws_resumen = wb.create_sheet("Resumen General")
-        
-        # Título
-        ws_resumen['A1'] = "AGENDA RUEDA DE NEGOCIOS - RESUMEN GENERAL"
-        ws_resumen['A1'].font = Font(bold=True, size=16)
-        ws_resumen.merge_cells('A1:D1')
-        
-        # Configuración
-        config = resultado["configuracion"]
+        ruta_archivo = self._ruta_salida(nombre_archivo)
+        escribir_excel_agenda(resultado, ruta_archivo)
         stats = resultado["estadisticas"]
         
-        ws_resumen['A3'] = "CONFIGURACIÓN"
-        ws_resumen['A3'].font = header_font
-        ws_resumen['A3'].fill = header_fill
-        
-        config_data = [
-            ["Vendedores", config['vendedores']],
-            ["Compradores", config['compradores']],
-            ["Duración total", config['duracion_total']],
-            ["Duración por cita", config['duracion_cita']],
-            ["Horario", f"{config['horario_inicio']} - {config['horario_fin']}"],
-            ["Slots disponibles", config['slots_disponibles']],
-            ["Máx. citas por vendedor", config['max_citas_por_vendedor']],
-            ["Vendedores por cita", config['vendedores_por_cita']],
-            ["Preferencias cargadas", config['preferencias_cargadas']]
-        ]
-        
-        for i, (label, value) in enumerate(config_data, 4):
-            ws_resumen[f'A{i}'] = label
-            ws_resumen[f'B{i}'] = value
-            ws_resumen[f'A{i}'].fill = accent_fill
-        
-        # Estadísticas
-        ws_resumen['A14'] = "ESTADÍSTICAS"
-        ws_resumen['A14'].font = header_font
-        ws_resumen['A14'].fill = header_fill
-        
-        stats_data = [
-            ["Total citas programadas", stats['total_citas_programadas']],
-            ["Total encuentros individuales", stats['total_encuentros_individuales']],
-            ["Utilización de slots", stats['porcentaje_utilizacion_slots']],
-            ["Promedio citas por vendedor", stats['citas_promedio_por_vendedor']],
-            ["Promedio citas por comprador", stats['citas_promedio_por_comprador']],
-            ["Preferencias cumplidas", f"{stats['preferencias_cumplidas']}/{stats['total_preferencias']}"],
-            ["% Cumplimiento preferencias", f"{(stats['preferencias_cumplidas']/stats['total_preferencias']*100):.1f}%"]
-        ]
-        
-        for i, (label, value) in enumerate(stats_data, 15):
-            ws_resumen[f'A{i}'] = label
-            ws_resumen[f'B{i}'] = value
-            ws_resumen[f'A{i}'].fill = accent_fill
-        
-        # 2. HOJA: Agenda por Horarios
-        ws_agenda = wb.create_sheet("Agenda por Horarios")
-        
-        # Encabezados
-        headers = ['Horario', 'Cita #', 'Comprador', 'Vendedor 1', 'Vendedor 2', 'Vendedor 3']
-        for col, header in enumerate(headers, 1):
-            cell = ws_agenda.cell(row=1, column=col, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = center_align
-            cell.border = border
-        
-        row = 2
-        for horario, citas in resultado["agenda"].items():
-            for i, cita in enumerate(citas, 1):
-                ws_agenda.cell(row=row, column=1, value=horario)
-                ws_agenda.cell(row=row, column=2, value=f"Cita {i}")
-                ws_agenda.cell(row=row, column=3, value=cita['comprador'])
-                
-                # Vendedores (máximo 3)
-                for j, vendedor in enumerate(cita['vendedores'][:3], 4):
-                    ws_agenda.cell(row=row, column=j, value=vendedor)
-                
-                # Aplicar estilos
-                for col in range(1, 7):
-                    cell = ws_agenda.cell(row=row, column=col)
-                    cell.border = border
-                    if col == 3:  # Comprador
-                        cell.fill = PatternFill(start_color="E74C3C", end_color="E74C3C", fill_type="solid")
-                        cell.font = Font(color="FFFFFF", bold=True)
-                    elif col >= 4:  # Vendedores
-                        cell.fill = PatternFill(start_color="27AE60", end_color="27AE60", fill_type="solid")
-                        cell.font = Font(color="FFFFFF")
-                
-                row += 1
-        
-        # 3. HOJA: Resumen por Vendedores
-        ws_vendedores = wb.create_sheet("Resumen Vendedores")
-        
-        headers = ['Vendedor', 'Total Citas', 'Preferencias Cumplidas', 'Lista de Compradores', 'Horarios']
-        for col, header in enumerate(headers, 1):
-            cell = ws_vendedores.cell(row=1, column=col, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = center_align
-            cell.border = border
-        
-        row = 2
-        for vendedor, datos in resultado["resumen_por_vendedor"].items():
-            # Calcular preferencias cumplidas
-            preferencias_vendedor = resultado.get("preferencias_cumplidas", {}).get(vendedor, [])
-            cumplidas = sum(1 for pref in preferencias_vendedor if pref.get("cumplida", False))
-            total_pref = len(preferencias_vendedor)
-            
-            ws_vendedores.cell(row=row, column=1, value=vendedor)
-            ws_vendedores.cell(row=row, column=2, value=datos['total_citas'])
-            ws_vendedores.cell(row=row, column=3, value=f"{cumplidas}/{total_pref}")
-            
-            if datos['total_citas'] > 0:
-                compradores = [cita['comprador'] for cita in datos['citas']]
-                horarios = [cita['horario'] for cita in datos['citas']]
-                ws_vendedores.cell(row=row, column=4, value='; '.join(compradores))
-                ws_vendedores.cell(row=row, column=5, value='; '.join(horarios))
-            else:
-                ws_vendedores.cell(row=row, column=4, value="Sin citas")
-                ws_vendedores.cell(row=row, column=5, value="Sin citas")
-            
-            # Aplicar estilos
-            for col in range(1, 6):
-                cell = ws_vendedores.cell(row=row, column=col)
-                cell.border = border
-                if datos['total_citas'] == 0:
-                    cell.fill = PatternFill(start_color="F39C12", end_color="F39C12", fill_type="solid")
-            
-            row += 1
-        
-        # 4. HOJA: Resumen por Compradores
-        ws_compradores = wb.create_sheet("Resumen Compradores")
-        
-        headers = ['Comprador', 'Total Citas', 'Lista de Vendedores', 'Horarios']
-        for col, header in enumerate(headers, 1):
-            cell = ws_compradores.cell(row=1, column=col, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = center_align
-            cell.border = border
-        
-        row = 2
-        for comprador, datos in resultado["resumen_por_comprador"].items():
-            ws_compradores.cell(row=row, column=1, value=comprador)
-            ws_compradores.cell(row=row, column=2, value=datos['total_citas'])
-            
-            if datos['total_citas'] > 0:
-                vendedores = []
-                horarios = [cita['horario'] for cita in datos['citas']]
-                for cita in datos['citas']:
-                    vendedores.extend(cita['vendedores'])
-                
-                ws_compradores.cell(row=row, column=3, value='; '.join(vendedores))
-                ws_compradores.cell(row=row, column=4, value='; '.join(horarios))
-            else:
-                ws_compradores.cell(row=row, column=3, value="Sin citas")
-                ws_compradores.cell(row=row, column=4, value="Sin citas")
-            
-            # Aplicar estilos
-            for col in range(1, 5):
-                cell = ws_compradores.cell(row=row, column=col)
-                cell.border = border
-            
-            row += 1
-        
-        # 5. HOJA: Matriz Compradores-Horarios
-        ws_matriz = wb.create_sheet("Matriz Compradores-Horarios")
-        
-        # Crear lista de todos los compradores únicos
-        compradores_unicos = list(resultado["resumen_por_comprador"].keys())
-        
-        # Crear lista de todos los horarios de la agenda
-        horarios_agenda = [horario for horario in resultado["agenda"].keys()]
-        
-        # Encabezado: primera celda vacía, luego compradores
-        ws_matriz.cell(row=1, column=1, value="FRANJA HORARIA")
-        ws_matriz.cell(row=1, column=1).font = header_font
-        ws_matriz.cell(row=1, column=1).fill = header_fill
-        ws_matriz.cell(row=1, column=1).alignment = center_align
-        ws_matriz.cell(row=1, column=1).border = border
-        
-        # Agregar compradores como encabezados de columnas
-        for col, comprador in enumerate(compradores_unicos, 2):
-            cell = ws_matriz.cell(row=1, column=col, value=comprador)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = center_align
-            cell.border = border
-        
-        # Llenar la matriz
-        for row_idx, horario in enumerate(horarios_agenda, 2):
-            # Primera columna: horario
-            cell_horario = ws_matriz.cell(row=row_idx, column=1, value=horario)
-            cell_horario.font = Font(bold=True)
-            cell_horario.fill = subheader_fill
-            cell_horario.alignment = center_align
-            cell_horario.border = border
-            
-            # Para cada comprador, buscar los vendedores en este horario
-            for col_idx, comprador in enumerate(compradores_unicos, 2):
-                vendedores_en_horario = []
-                
-                # Buscar citas de este comprador en este horario
-                if horario in resultado["agenda"]:
-                    for cita in resultado["agenda"][horario]:
-                        if cita["comprador"] == comprador:
-                            vendedores_en_horario.extend(cita["vendedores"])
-                
-                # Escribir vendedores en la celda (separados por comas si hay múltiples)
-                vendedores_texto = ", ".join(vendedores_en_horario) if vendedores_en_horario else ""
-                cell = ws_matriz.cell(row=row_idx, column=col_idx, value=vendedores_texto)
-                cell.border = border
-                cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-                
-                # Colorear según si hay citas o no
-                if vendedores_en_horario:
-                    cell.fill = PatternFill(start_color="E8F5E8", end_color="E8F5E8", fill_type="solid")
-                    cell.font = Font(bold=True)
-                else:
-                    cell.fill = PatternFill(start_color="F8F8F8", end_color="F8F8F8", fill_type="solid")
-        
-        # 6. HOJA: Preferencias Detalladas
-        ws_preferencias = wb.create_sheet("Preferencias Detalladas")
-        
-        headers = ['Vendedor', 'Comprador Preferido', 'Estado', 'Cumplida']
-        for col, header in enumerate(headers, 1):
-            cell = ws_preferencias.cell(row=1, column=col, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = center_align
-            cell.border = border
-        
-        row = 2
-        for vendedor, preferencias_vendedor in resultado["preferencias_cumplidas"].items():
-            for pref in preferencias_vendedor:
-                ws_preferencias.cell(row=row, column=1, value=vendedor)
-                ws_preferencias.cell(row=row, column=2, value=pref['comprador'])
-                ws_preferencias.cell(row=row, column=3, value="✓ Cumplida" if pref['cumplida'] else "✗ No cumplida")
-                ws_preferencias.cell(row=row, column=4, value="SÍ" if pref['cumplida'] else "NO")
-                
-                # Aplicar estilos
-                for col in range(1, 5):
-                    cell = ws_preferencias.cell(row=row, column=col)
-                    cell.border = border
-                    if pref['cumplida']:
-                        cell.fill = PatternFill(start_color="D5F4E6", end_color="D5F4E6", fill_type="solid")
-                    else:
-                        cell.fill = PatternFill(start_color="FDF2F2", end_color="FDF2F2", fill_type="solid")
-                
-                row += 1
-        
-        # Ajustar ancho de columnas para todas las hojas
-        for ws in wb.worksheets:
-            for column in ws.columns:
-                max_length = 0
-                column_letter = get_column_letter(column[0].column)
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column_letter].width = adjusted_width
-        
-        # Guardar archivo
-        wb.save(ruta_archivo)
-        
-        print(f"\n✓ Archivo Excel generado: {ruta_archivo}")
-        print(f"  - 6 hojas: Resumen General, Agenda por Horarios, Resumen Vendedores, Resumen Compradores, Matriz Compradores-Horarios, Preferencias Detalladas")
-        print(f"  - Formato profesional con colores y estilos")
-        print(f"  - {stats['total_citas_programadas']} citas y {stats['total_encuentros_individuales']} encuentros detallados")
-        print(f"  - {stats['preferencias_cumplidas']}/{stats['total_preferencias']} preferencias analizadas")
-        print(f"\n📊 MATRIZ MAESTRA: Hoja 'Matriz Compradores-Horarios' - Grilla completa con compradores como filas, horarios como columnas y vendedores en cada celda")
+        logger.info("\n✓ Archivo Excel generado: %s", ruta_archivo)
+        logger.info("  - 6 hojas: Resumen General, Agenda por Horarios, Resumen Vendedores, Resumen Compradores, Matriz Compradores-Horarios, Preferencias Detalladas")
+        logger.info("  - Formato profesional con colores y estilos")
+        logger.info("  - %s citas y %s encuentros detallados", stats['total_citas_programadas'], stats['total_encuentros_individuales'])
+        logger.info("  - %s/%s preferencias analizadas", stats['preferencias_cumplidas'], stats['total_preferencias'])
+        logger.info("\n📊 MATRIZ MAESTRA: Hoja 'Matriz Compradores-Horarios' - Grilla completa con compradores como filas, horarios como columnas y vendedores en cada celda")
         
         return ruta_archivo
 
+    def generar_vistas_html(self, resultado: Dict) -> Dict[str, Dict]:
+        """Genera las matrices HTML (compradores y vendedores) directamente desde el resultado en memoria"""
+        carpeta = os.path.dirname(self._ruta_salida("matriz_compradores.html"))
+        vistas = escribir_vistas_html(resultado, carpeta=carpeta)
+        for datos in vistas.values():
+            logger.info("✓ Vista HTML generada: %s (%s filas, %s citas)", datos['archivo'], datos['filas'], datos['citas'])
+        return vistas
+
+    def publicar_sitio_web(self, carpeta: str = "sitio") -> Dict:
+        """Publica las vistas web con CSS/JS compartidos, minificados, con hash y precomprimidos"""
+        carpeta_proyecto = os.path.dirname(self._ruta_salida("index.html"))
+        carpeta_sitio = self._ruta_salida(carpeta)
+        manifiesto = publicar_sitio(PAGINAS_SITIO, carpeta_sitio, origen=carpeta_proyecto,
+                                    adicionales=["agenda_completa.json"])
+        logger.info("✓ Sitio publicado en: %s (%s páginas, %s recursos con hash)", carpeta_sitio,
+                    len(manifiesto["paginas"]), len(manifiesto["recursos"]))
+        if not BROTLI_DISPONIBLE:
+            logger.warning("⚠️  brotli no está instalado: solo se generan variantes .gz (pip install brotli)")
+        return manifiesto
+
     def crear_archivo_ejemplo_preferencias(self, nombre_archivo: str = "ejemplo_preferencias.csv"):
         """Crea un archivo de ejemplo para mostrar el formato de preferencias"""
         ruta_archivo = f"c:\\Users\\angel\\OneDrive\\Escritorio\\escritorio\\Angela\\Programación agenda\\{nombre_archivo}"
@@ -1586,187 +2709,195 @@ class AgendaRuedaNegocios:
             for ejemplo in ejemplos:
                 writer.writerow(ejemplo)
         
-        print(f"Archivo de ejemplo creado: {ruta_archivo}")
-        print("NOTA: Ahora cada vendedor puede tener MÚLTIPLES compradores preferidos.")
-        print("      Simplemente repite el nombre del vendedor en varias filas.")
-        print("      ¡Usa nombres REALES! El programa los detectará automáticamente.")
-        print("Edita este archivo con tus preferencias reales y úsalo con cargar_preferencias_archivo()")
+        logger.info("Archivo de ejemplo creado: %s", ruta_archivo)
+        logger.info("NOTA: Ahora cada vendedor puede tener MÚLTIPLES compradores preferidos.")
+        logger.info("      Simplemente repite el nombre del vendedor en varias filas.")
+        logger.info("      ¡Usa nombres REALES! El programa los detectará automáticamente.")
+        logger.info("Edita este archivo con tus preferencias reales y úsalo con cargar_preferencias_archivo()")
         return ruta_archivo
 
-    def generar_documentos_word_vendedores(self, resultado: Dict):
-        """Genera un documento Word individual para cada vendedor con sus citas"""
-        try:
-            from docx import Document
-            from docx.shared import Inches
-            from docx.enum.text import WD_ALIGN_PARAGRAPH
-            from docx.enum.table import WD_TABLE_ALIGNMENT
-        except ImportError:
-            print("Error: Se requiere instalar python-docx para generar documentos Word.")
-            print("Ejecuta: pip install python-docx")
+    def generar_documentos_word_vendedores(self, resultado: Dict, trabajadores: Optional[int] = None,
+                                           progreso: Optional[Callable[[int, int, str], None]] = None,
+                                           directo: bool = False):
+        """Genera un documento Word individual para cada vendedor con sus citas
+
+        Los documentos se reparten en 'trabajadores' procesos (por defecto, uno por núcleo);
+        progreso recibe (documentos terminados, total, vendedor). Con directo=True se escriben
+        como OOXML sin pasar por python-docx (mismo document.xml, mucho más rápido).
+        """
+        if not DOCX_DISPONIBLE:
+            logger.error("Error: Se requiere instalar python-docx para generar documentos Word.")
+            logger.error("Ejecuta: pip install python-docx")
             return
 
         # Crear carpeta para documentos si no existe
         carpeta_docs = "c:\\Users\\angel\\OneDrive\\Escritorio\\escritorio\\Angela\\Programación agenda\\documentos_vendedores"
-        import os
-        if not os.path.exists(carpeta_docs):
-            os.makedirs(carpeta_docs)
 
-        vendedores_procesados = 0
-        
-        # Generar un documento para cada vendedor
-        for vendedor, datos_vendedor in resultado["resumen_por_vendedor"].items():
-            if datos_vendedor["total_citas"] > 0:  # Solo generar para vendedores con citas
-                doc = Document()
-                
-                # Título principal: nombre del vendedor
-                titulo = doc.add_heading(vendedor, 0)
-                titulo.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                
-                # Agregar espacio
-                doc.add_paragraph("")
-                
-                # Información general
-                info_p = doc.add_paragraph()
-                info_p.add_run("Total de citas programadas: ").bold = True
-                info_p.add_run(str(datos_vendedor["total_citas"]))
-                
-                # Agregar espacio
-                doc.add_paragraph("")
-                
-                # Crear tabla con citas
-                # Encabezados: Franja Horaria | Mesa | Comprador
-                tabla = doc.add_table(rows=1, cols=3)
-                tabla.style = 'Table Grid'
-                tabla.alignment = WD_TABLE_ALIGNMENT.CENTER
-                
-                # Encabezados de la tabla
-                encabezados = tabla.rows[0].cells
-                encabezados[0].text = "FRANJA HORARIA"
-                encabezados[1].text = "MESA"
-                encabezados[2].text = "COMPRADOR"
-                
-                # Formatear encabezados
-                for celda in encabezados:
-                    for parrafo in celda.paragraphs:
-                        parrafo.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                        for run in parrafo.runs:
-                            run.font.bold = True
-                
-                # Agregar las citas del vendedor
-                for cita in datos_vendedor["citas"]:
-                    fila = tabla.add_row().cells
-                    fila[0].text = cita["horario"]
-                    fila[1].text = ""  # Mesa vacía como solicitaste
-                    fila[2].text = cita["comprador"]
-                    
-                    # Centrar el contenido de las celdas
-                    for celda in fila:
-                        for parrafo in celda.paragraphs:
-                            parrafo.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                
-                # Ajustar ancho de columnas
-                for fila in tabla.rows:
-                    fila.cells[0].width = Inches(2.5)  # Franja horaria
-                    fila.cells[1].width = Inches(1.5)  # Mesa
-                    fila.cells[2].width = Inches(3.0)  # Comprador
-                
-                # Agregar espacio al final
-                doc.add_paragraph("")
-                
-                # Nota al pie
-                nota = doc.add_paragraph()
-                nota.add_run("Nota: ").bold = True
-                nota.add_run("Complete la columna 'Mesa' según la asignación del evento.")
-                nota.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                
-                # Guardar el documento
-                # Limpiar caracteres problemáticos del nombre del archivo
-                caracteres_problematicos = ['/', '\\', ':', '*', '?', '"', '<', '>', '|']
-                nombre_limpio = vendedor
-                for char in caracteres_problematicos:
-                    nombre_limpio = nombre_limpio.replace(char, '_')
-                
-                nombre_archivo = f"{nombre_limpio}.docx"
-                ruta_completa = os.path.join(carpeta_docs, nombre_archivo)
-                
-                try:
-                    doc.save(ruta_completa)
-                    vendedores_procesados += 1
-                    print(f"✓ Documento generado: {nombre_archivo}")
-                except Exception as e:
-                    print(f"✗ Error al guardar documento para {vendedor}: {e}")
+        if progreso is None:
+            def progreso(hechos, total, vendedor):
+                logger.debug("✓ Documento generado (%s/%s): %s", hechos, total, vendedor)
+
+        vendedores_procesados, errores = generar_documentos_word(
+            resultado["resumen_por_vendedor"], "vendedor", carpeta_docs, trabajadores=trabajadores, progreso=progreso,
+            directo=directo)
+        for vendedor, error in errores:
+            logger.error("✗ Error al guardar documento para %s: %s", vendedor, error)
         
-        print(f"\n📄 DOCUMENTOS WORD GENERADOS:")
-        print(f"   • Total documentos: {vendedores_procesados}")
-        print(f"   • Carpeta: {carpeta_docs}")
-        print(f"   • Cada documento contiene: Nombre del vendedor, tabla con franja horaria, mesa (vacía) y comprador")
+        logger.info("\n📄 DOCUMENTOS WORD GENERADOS:")
+        logger.info("   • Total documentos: %s", vendedores_procesados)
+        logger.info("   • Carpeta: %s", carpeta_docs)
+        logger.info("   • Cada documento contiene: Nombre del vendedor, tabla con franja horaria, mesa (vacía) y comprador")
         
         return vendedores_procesados
 
 
 def main():
     """Función principal"""
-    print("Iniciando programa de agenda para rueda de negocios...")
-    print("Nuevo formato: 3 vendedores por cita con 1 comprador")
+    import argparse
+    parser = argparse.ArgumentParser(description="Genera la agenda de la rueda de negocios")
+    parser.add_argument("--motor", choices=MOTORES_AGENDA, nargs="+", default=["voraz"],
+                        help="Motor de asignación de citas (por defecto: voraz); con varios se alternan entre arranques")
+    parser.add_argument("--tiempo-mejora", type=float, default=0.0, metavar="SEGUNDOS",
+                        help="Segundos de búsqueda local para cumplir más preferencias (por defecto: 0)")
+    parser.add_argument("--starts", type=int, default=1, metavar="N",
+                        help="Número de arranques con semillas distintas; se conserva el mejor (por defecto: 1)")
+    parser.add_argument("--workers", type=int, default=None, metavar="K",
+                        help="Procesos para el multiarranque y los documentos Word (por defecto: núcleos disponibles)")
+    parser.add_argument("--word-directo", action="store_true",
+                        help="Escribir los documentos Word directamente como OOXML, sin python-docx por documento")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Semilla del primer arranque (por defecto: 0)")
+    parser.add_argument("--sin-cache", action="store_true",
+                        help=f"Resolver siempre, sin consultar ni guardar la caché de resultados ni de instancias ({CARPETA_CACHE})")
+    parser.add_argument("--instrumentar", action="store_true",
+                        help="Medir tiempos por fase, llamadas del camino crítico y motivos de rechazo")
+    parser.add_argument("--validar-cada-paso", action="store_true",
+                        help="Modo depuración: validar toda la agenda después de cada alta o baja de cita")
+    parser.add_argument("-v", "--detallado", action="store_true",
+                        help="Mostrar el detalle cita por cita (nivel DEBUG)")
+    parser.add_argument("--silencioso", action="store_true",
+                        help="No mostrar mensajes (ni formatearlos)")
+    parser.add_argument("--log-json", metavar="ARCHIVO",
+                        help="Escribir además cada mensaje como una línea JSON en ARCHIVO")
+    args = parser.parse_args()
+    configurar_registro(logging.DEBUG if args.detallado else logging.INFO, args.log_json, args.silencioso)
+
+    logger.info("Iniciando programa de agenda para rueda de negocios...")
+    logger.info("Nuevo formato: 3 vendedores por cita con 1 comprador")
     
     # Crear instancia del organizador
-    organizador = AgendaRuedaNegocios()
+    organizador = AgendaRuedaNegocios(semilla=args.seed)
+    if args.instrumentar:
+        organizador.activar_instrumentacion()
+    if args.validar_cada_paso:
+        organizador.activar_validacion_continua()
+    
+    # Cargar la configuración del evento (horario, descansos, ventanas, pares prohibidos, citas fijas)
+    archivo_configuracion = os.path.join(os.path.dirname(os.path.abspath(__file__)), "configuracion_evento.json")
+    if os.path.exists(archivo_configuracion):
+        organizador.cargar_configuracion_evento(archivo_configuracion)
     
     # Crear archivo de ejemplo para preferencias
-    print("\n1. Creando archivo de ejemplo para preferencias...")
+    logger.info("\n1. Creando archivo de ejemplo para preferencias...")
     archivo_ejemplo = organizador.crear_archivo_ejemplo_preferencias()
     
-    # Intentar cargar preferencias si existe un archivo
+    # Intentar cargar preferencias si existe un archivo (a través de la instancia precompilada)
+    cargar_preferencias = (organizador.cargar_preferencias_archivo if args.sin_cache
+                           else organizador.cargar_preferencias_compiladas)
     archivo_preferencias = "c:\\Users\\angel\\OneDrive\\Escritorio\\escritorio\\Angela\\Programación agenda\\preferencias_multiples.csv"
+    archivo_cargado = None
     if os.path.exists(archivo_preferencias):
-        print(f"\n2. Cargando preferencias desde {archivo_preferencias}...")
-        organizador.cargar_preferencias_archivo(archivo_preferencias)
+        logger.info("\n2. Cargando preferencias desde %s...", archivo_preferencias)
+        cargar_preferencias(archivo_preferencias)
+        archivo_cargado = archivo_preferencias
     else:
         archivo_preferencias_alt = "c:\\Users\\angel\\OneDrive\\Escritorio\\escritorio\\Angela\\Programación agenda\\preferencias_citas.csv"
         if os.path.exists(archivo_preferencias_alt):
-            print(f"\n2. Cargando preferencias desde {archivo_preferencias_alt}...")
-            organizador.cargar_preferencias_archivo(archivo_preferencias_alt)
+            logger.info("\n2. Cargando preferencias desde %s...", archivo_preferencias_alt)
+            cargar_preferencias(archivo_preferencias_alt)
+            archivo_cargado = archivo_preferencias_alt
         else:
-            print(f"\n2. No se encontró archivo de preferencias")
-            print("   Puedes crear uno basado en el ejemplo generado.")
+            logger.info("\n2. No se encontró archivo de preferencias")
+            logger.info("   Puedes crear uno basado en el ejemplo generado.")
     
     # Generar la agenda
-    print("\n3. Generando agenda optimizada...")
-    resultado = organizador.generar_agenda_optimizada()
+    logger.info("\n3. Generando agenda optimizada...")
+    # Con más motores que arranques se hace al menos un arranque por motor
+    arranques = max(1, args.starts, len(args.motor))
+    if arranques > 1 and archivo_cargado:
+        def generar():
+            return organizador.generar_agenda_multiarranque(
+                archivo_cargado, arranques, args.workers, tuple(args.motor), args.tiempo_mejora, args.seed,
+                sin_cache=args.sin_cache
+            )
+        motores = list(args.motor)
+    else:
+        if len(args.motor) > 1:
+            logger.warning("⚠️  Sin archivo de preferencias no hay multiarranque: solo se usa el motor %s (se ignoran %s)",
+                           args.motor[0], ', '.join(args.motor[1:]))
+        def generar():
+            return organizador.generar_agenda_optimizada(motor=args.motor[0], tiempo_mejora=args.tiempo_mejora)
+        motores = args.motor[:1]
+        arranques = 1
+    
+    if args.sin_cache:
+        resultado = generar()
+    else:
+        parametros = {"semilla": args.seed, "motores": motores, "tiempo_mejora": args.tiempo_mejora,
+                      "arranques": arranques}
+        resultado = organizador.generar_agenda_con_cache(parametros, generar)
     
     # Mostrar resultados
-    print("\n4. Mostrando resultados...")
+    logger.info("\n4. Mostrando resultados...")
     organizador.imprimir_agenda(resultado)
+    if "instrumentacion" in resultado:
+        instrumentacion = resultado["instrumentacion"]
+        logger.info("\n⏱️  TIEMPOS POR FASE:")
+        for nombre, fase in instrumentacion["fases"].items():
+            logger.info("   • %s: %.4fs (CPU %.4fs)", nombre, fase['segundos'], fase['segundos_cpu'])
+        logger.info("🔢 Llamadas: %s", ", ".join(f"{nombre} {veces}" for nombre, veces in instrumentacion["llamadas"].items()))
+        logger.info("🚫 Rechazos: %s", ", ".join(f"{motivo} {veces}" for motivo, veces in instrumentacion["rechazos"].items()))
     
     # Exportar archivos
-    print("\n5. Exportando archivos...")
+    logger.info("\n5. Exportando archivos...")
     organizador.exportar_a_csv(resultado)
     organizador.exportar_resumen_vendedores(resultado)
     
     # Generar archivo Excel completo
-    print("\n6. Generando archivo Excel...")
+    logger.info("\n6. Generando archivo Excel...")
     organizador.generar_excel_completo(resultado)
     
     # Generar documentos Word para vendedores
-    print("\n7. Generando documentos Word individuales para vendedores...")
-    organizador.generar_documentos_word_vendedores(resultado)
+    logger.info("\n7. Generando documentos Word individuales para vendedores...")
+    organizador.generar_documentos_word_vendedores(resultado, trabajadores=args.workers,
+                                                   directo=args.word_directo)
+    
+    # Generar matrices HTML sin releer agenda_completa.json
+    logger.info("\n8. Generando vistas HTML...")
+    organizador.generar_vistas_html(resultado)
+    
+    # Guardar resultado completo en JSON (sección por sección)
+    escribir_resultado(resultado, "c:\\Users\\angel\\OneDrive\\Escritorio\\escritorio\\Angela\\Programación agenda\\agenda_completa.json")
+    
+    # Y en formato compacto v2 (tabla de participantes + citas codificadas con enteros, gzip)
+    escribir_agenda_compacta(resultado, "c:\\Users\\angel\\OneDrive\\Escritorio\\escritorio\\Angela\\Programación agenda\\agenda_compacta.json.gz")
     
-    # Guardar resultado completo en JSON
-    with open("c:\\Users\\angel\\OneDrive\\Escritorio\\escritorio\\Angela\\Programación agenda\\agenda_completa.json", 'w', encoding='utf-8') as f:
-        json.dump(resultado, f, indent=2, ensure_ascii=False)
+    logger.info("\nResultado completo guardado en: agenda_completa.json (compacto: agenda_compacta.json.gz)")
     
-    print(f"\nResultado completo guardado en: agenda_completa.json")
-    print("\nPrograma finalizado exitosamente!")
-    print("\nPARA USAR TUS PROPIAS PREFERENCIAS:")
-    print("1. Edita el archivo 'ejemplo_preferencias.csv' con tus datos reales")
-    print("2. Cada vendedor puede aparecer en MÚLTIPLES filas con diferentes compradores")
-    print("3. ¡USA NOMBRES REALES! El programa detectará automáticamente todos los participantes")
-    print("4. Guárdalo como 'preferencias_multiples.csv' o 'preferencias_citas.csv'")
-    print("5. Ejecuta el programa nuevamente")
-    print("\nEjemplo del nuevo formato:")
-    print("Café Del Tajo,BOX BRAND")
-    print("Café Del Tajo,PROCOLOMBIA  <- Mismo vendedor, otro comprador")
-    print("Mujeres cafeteras ALMA VERDE,CAFÉ MOLINA  <- Vendedor diferente")
+    # Publicar el sitio con recursos estáticos cacheables (después de guardar agenda_completa.json)
+    logger.info("\n9. Publicando sitio web...")
+    organizador.publicar_sitio_web()
+    logger.info("\nPrograma finalizado exitosamente!")
+    logger.info("\nPARA USAR TUS PROPIAS PREFERENCIAS:")
+    logger.info("1. Edita el archivo 'ejemplo_preferencias.csv' con tus datos reales")
+    logger.info("2. Cada vendedor puede aparecer en MÚLTIPLES filas con diferentes compradores")
+    logger.info("3. ¡USA NOMBRES REALES! El programa detectará automáticamente todos los participantes")
+    logger.info("4. Guárdalo como 'preferencias_multiples.csv' o 'preferencias_citas.csv'")
+    logger.info("5. Ejecuta el programa nuevamente")
+    logger.info("\nEjemplo del nuevo formato:")
+    logger.info("Café Del Tajo,BOX BRAND")
+    logger.info("Café Del Tajo,PROCOLOMBIA  <- Mismo vendedor, otro comprador")
+    logger.info("Mujeres cafeteras ALMA VERDE,CAFÉ MOLINA  <- Vendedor diferente")
 
 
 if __name__ == "__main__":
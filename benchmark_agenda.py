@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BENCHMARK DEL ORGANIZADOR DE AGENDA
+===================================
+
+Mide, para varios tamaños de instancia sintética y cada motor, el tiempo de:
+carga de preferencias, resolución (generar_agenda_optimizada), validación (también
+la vectorizada si NumPy está instalado) y exportación (CSV, resumen por vendedor,
+JSON y Excel si openpyxl está instalado).
+
+Los resultados se guardan en JSON para compararlos entre commits:
+
+    python benchmark_agenda.py --tamanos 25x10 250x100 1000x100 --motores voraz coloreo \\
+        --salida benchmark_resultados.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Dict, List
+
+from agenda_rueda_negocios import AgendaRuedaNegocios, MOTORES_AGENDA, configurar_registro
+from generar_instancia_sintetica import generar_instancia, guardar_instancia
+from json_agenda import escribir_resultado
+from vista_tensorial import NUMPY_DISPONIBLE
+
+
+def _commit_actual() -> str:
+    """Hash del commit del repositorio (vacío si no es un repositorio git)"""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def medir_ejecucion(ruta_preferencias: str, configuracion: Dict, motor: str, carpeta: str,
+                    semilla: int = 0) -> Dict:
+    """Ejecuta carga, resolución, validación y exportación y devuelve los tiempos en segundos"""
+    tiempos = {}
+    inicio = time.perf_counter()
+    organizador = AgendaRuedaNegocios(configuracion=configuracion, semilla=semilla)
+    organizador.cargar_preferencias_archivo(ruta_preferencias)
+    tiempos["carga"] = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    resultado = organizador.generar_agenda_optimizada(motor=motor)
+    tiempos["resolucion"] = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    validacion = organizador.validar_agenda()
+    tiempos["validacion"] = time.perf_counter() - inicio
+
+    if NUMPY_DISPONIBLE:
+        inicio = time.perf_counter()
+        vista = organizador.vista_tensorial()
+        vista.validar()
+        vista.estadisticas()
+        tiempos["validacion_vectorizada"] = time.perf_counter() - inicio
+    else:
+        tiempos["validacion_vectorizada"] = None
+
+    inicio = time.perf_counter()
+    organizador.exportar_a_csv(resultado, os.path.join(carpeta, f"agenda_{motor}.csv"))
+    organizador.exportar_resumen_vendedores(resultado, os.path.join(carpeta, f"resumen_{motor}.csv"))
+    escribir_resultado(resultado, os.path.join(carpeta, f"agenda_{motor}.json"))
+    tiempos["exportacion"] = time.perf_counter() - inicio
+
+    try:
+        import openpyxl  # noqa: F401
+        inicio = time.perf_counter()
+        organizador.generar_excel_completo(resultado, os.path.join(carpeta, f"agenda_{motor}.xlsx"))
+        tiempos["excel"] = time.perf_counter() - inicio
+    except ImportError:
+        tiempos["excel"] = None
+
+    estadisticas = resultado["estadisticas"]
+    return {
+        "tiempos": {fase: (round(t, 4) if t is not None else None) for fase, t in tiempos.items()},
+        "preferencias_cumplidas": estadisticas["preferencias_cumplidas"],
+        "total_preferencias": estadisticas["total_preferencias"],
+        "total_citas": estadisticas["total_citas_programadas"],
+        "conflictos": len(validacion["conflictos"]),
+    }
+
+
+def ejecutar_benchmark(tamanos: List[str], motores: List[str], repeticiones: int = 1,
+                       min_preferencias: int = 3, max_preferencias: int = 8, semilla: int = 0) -> Dict:
+    """Genera cada instancia una vez y la resuelve con cada motor; conserva el mejor tiempo por fase"""
+    ejecuciones = []
+    with tempfile.TemporaryDirectory() as carpeta:
+        for tamano in tamanos:
+            num_vendedores, num_compradores = (int(x) for x in tamano.lower().split("x"))
+            filas, configuracion = generar_instancia(num_vendedores, num_compradores, min_preferencias,
+                                                     max_preferencias, semilla=semilla)
+            ruta_preferencias = os.path.join(carpeta, f"preferencias_{tamano}.csv")
+            guardar_instancia(filas, configuracion, ruta_preferencias, os.path.join(carpeta, f"configuracion_{tamano}.json"))
+
+            for motor in motores:
+                medidas = [medir_ejecucion(ruta_preferencias, configuracion, motor, carpeta, semilla)
+                           for _ in range(repeticiones)]
+                mejor = medidas[0]
+                for fase in mejor["tiempos"]:
+                    valores = [m["tiempos"][fase] for m in medidas if m["tiempos"][fase] is not None]
+                    mejor["tiempos"][fase] = min(valores) if valores else None
+                ejecucion = {"tamano": tamano, "vendedores": num_vendedores, "compradores": num_compradores,
+                             "preferencias": len(filas), "motor": motor, **mejor}
+                ejecuciones.append(ejecucion)
+                tiempos = ejecucion["tiempos"]
+                print(f"📊 {tamano:>10} {motor:>8}: carga {tiempos['carga']:.3f}s | "
+                      f"resolución {tiempos['resolucion']:.3f}s | validación {tiempos['validacion']:.3f}s | "
+                      f"exportación {tiempos['exportacion']:.3f}s | "
+                      f"{ejecucion['preferencias_cumplidas']}/{ejecucion['total_preferencias']} preferencias, "
+                      f"{ejecucion['conflictos']} conflictos")
+
+    return {
+        "commit": _commit_actual(),
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "plataforma": platform.platform(),
+        "repeticiones": repeticiones,
+        "semilla": semilla,
+        "ejecuciones": ejecuciones,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de generar_agenda_optimizada")
+    parser.add_argument("--tamanos", nargs="+", default=["25x10", "250x100", "1000x100"],
+                        metavar="VxC", help="Tamaños como vendedores x compradores (por defecto: 25x10 250x100 1000x100)")
+    parser.add_argument("--motores", nargs="+", choices=MOTORES_AGENDA, default=list(MOTORES_AGENDA))
+    parser.add_argument("--repeticiones", type=int, default=1,
+                        help="Ejecuciones por caso; se guarda el mejor tiempo de cada fase")
+    parser.add_argument("--min-preferencias", type=int, default=3)
+    parser.add_argument("--max-preferencias", type=int, default=8)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--salida", default="benchmark_resultados.json")
+    args = parser.parse_args()
+
+    # Los mensajes del organizador no se formatean durante las mediciones
+    configurar_registro(silencioso=True)
+    informe = ejecutar_benchmark(args.tamanos, args.motores, max(1, args.repeticiones),
+                                 args.min_preferencias, args.max_preferencias, args.semilla)
+    with open(args.salida, 'w', encoding='utf-8') as f:
+        json.dump(informe, f, indent=2, ensure_ascii=False)
+    print(f"\n✅ Resultados guardados en: {args.salida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Documentos Word por participante
+
+Un único renderizador por lotes para los documentos de vendedores y de compradores: cada
+documento (título, total de citas, tabla FRANJA HORARIA | MESA | <contraparte> y nota al pie)
+se arma y se guarda en un proceso de un ProcessPoolExecutor, así que cientos de documentos
+usan todos los núcleos en lugar de uno.
+
+    generados, errores = generar_documentos_word(resumen_por_vendedor, "vendedor", "documentos_vendedores",
+                                                 trabajadores=4, progreso=lambda hechos, total, nombre: ...)
+
+Con directo=True cada documento se escribe sin python-docx: el paquete fijo (estilos, tema,
+relaciones...) se arma una sola vez por proceso y word/document.xml se vuelca al zip con
+fragmentos XML precompilados. El document.xml resultante es idéntico byte a byte al de python-docx.
+
+python-docx es necesario solo para generar: sin él DOCX_DISPONIBLE es False.
+"""
+
+import io
+import os
+import re
+import zipfile
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+try:
+    from docx import Document
+    from docx.shared import Inches
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.enum.table import WD_TABLE_ALIGNMENT
+    DOCX_DISPONIBLE = True
+except ImportError:
+    DOCX_DISPONIBLE = False
+
+# Por tipo de participante: encabezado y ancho (pulgadas) de la tercera columna y nota al pie
+TIPOS_DOCUMENTO = {
+    "vendedor": {
+        "columna": "COMPRADOR",
+        "ancho": 3.0,
+        "nota": "Complete la columna 'Mesa' según la asignación del evento.",
+    },
+    "comprador": {
+        "columna": "VENDEDORES",
+        "ancho": 4.0,
+        "nota": ("Complete la columna 'Mesa' según la asignación del evento. "
+                 "Los vendedores están separados por '|' cuando hay múltiples."),
+    },
+}
+
+# Por debajo de este número de documentos no compensa arrancar procesos
+MINIMO_PARA_PROCESOS = 8
+
+CARACTERES_PROBLEMATICOS = ['/', '\\', ':', '*', '?', '"', '<', '>', '|']
+
+PARTE_DOCUMENTO = "word/document.xml"
+EMU_POR_PULGADA = 914400
+EMU_POR_TWIP = 635
+
+# Fragmentos del cuerpo tal como los serializa python-docx
+_PROPIEDADES_TABLA = (
+    '<w:tblPr><w:tblStyle w:val="TableGrid"/><w:tblW w:type="auto" w:w="0"/><w:jc w:val="center"/>'
+    '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" w:noHBand="0" '
+    'w:noVBand="1" w:val="04A0"/></w:tblPr>'
+)
+_INICIO_CELDA = ('<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{}"/></w:tcPr>'
+                 '<w:p><w:pPr><w:jc w:val="center"/></w:pPr>')
+_FIN_CELDA = '</w:p></w:tc>'
+_SEPARADORES_RUN = re.compile(r'([\t\r\n])')
+# Caracteres fuera de XML 1.0: python-docx los rechaza y Word no abre un documento que los contenga
+_CARACTERES_NO_XML = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]')
+_ERROR_NO_XML = "All strings must be XML compatible: Unicode or ASCII, no NULL bytes or control characters"
+
+# Paquete sin word/document.xml, inicio y fin del documento y ancho de columna (uno por proceso)
+_paquete_base = None
+
+
+def nombre_archivo_docx(participante: str) -> str:
+    """Nombre del archivo .docx del participante, sin caracteres problemáticos"""
+    nombre_limpio = participante
+    for char in CARACTERES_PROBLEMATICOS:
+        nombre_limpio = nombre_limpio.replace(char, '_')
+    return f"{nombre_limpio}.docx"
+
+
+def contraparte_cita(tipo: str, cita: Dict) -> str:
+    """Texto de la tercera columna: el comprador (vendedor) o los vendedores unidos por '|' (comprador)"""
+    if tipo == "vendedor":
+        return cita["comprador"]
+    return " | ".join(cita["vendedores"])
+
+
+def _twips(pulgadas: float) -> int:
+    """Pulgadas a twips con el mismo redondeo que python-docx (Inches → Emu → twips)"""
+    return int(round(int(pulgadas * EMU_POR_PULGADA) / EMU_POR_TWIP))
+
+
+def _contenido_run(texto: str) -> str:
+    """Contenido de un w:r: tabuladores y saltos de línea como w:tab y w:br, el resto en w:t"""
+    piezas = []
+    for trozo in _SEPARADORES_RUN.split(texto):
+        if not trozo:
+            continue
+        if trozo == "\t":
+            piezas.append("<w:tab/>")
+        elif trozo in "\r\n":
+            piezas.append("<w:br/>")
+        else:
+            if _CARACTERES_NO_XML.search(trozo):
+                raise ValueError(_ERROR_NO_XML)
+            espacio = ' xml:space="preserve"' if len(trozo.strip()) < len(trozo) else ''
+            piezas.append(f'<w:t{espacio}>{escape(trozo)}</w:t>')
+    return "".join(piezas)
+
+
+def _run(texto: str, negrita: bool = False) -> str:
+    contenido = ('<w:rPr><w:b/></w:rPr>' if negrita else '') + _contenido_run(texto)
+    return f'<w:r>{contenido}</w:r>' if contenido else '<w:r/>'
+
+
+def _obtener_paquete_base() -> Tuple[bytes, str, str, int]:
+    """Paquete .docx de python-docx sin word/document.xml, armado una vez por proceso"""
+    global _paquete_base
+    if _paquete_base is None:
+        original = io.BytesIO()
+        Document().save(original)
+        base = io.BytesIO()
+        with zipfile.ZipFile(original) as plantilla, zipfile.ZipFile(base, 'w', zipfile.ZIP_DEFLATED) as paquete:
+            for info in plantilla.infolist():
+                if info.filename != PARTE_DOCUMENTO:
+                    paquete.writestr(info, plantilla.read(info.filename))
+            documento = plantilla.read(PARTE_DOCUMENTO).decode('utf-8')
+
+        # El cuerpo vacío solo tiene w:sectPr: lo anterior y lo siguiente se reutilizan tal cual
+        inicio = documento[:documento.index('<w:body>') + len('<w:body>')]
+        fin = documento[documento.index('<w:sectPr'):]
+        # Ancho de columna de add_table: ancho útil de la página repartido en 3 columnas
+        pagina = int(re.search(r'<w:pgSz w:w="(\d+)"', fin).group(1))
+        margen_derecho = int(re.search(r'w:right="(\d+)"', fin).group(1))
+        margen_izquierdo = int(re.search(r'w:left="(\d+)"', fin).group(1))
+        ancho_util = (pagina - margen_izquierdo - margen_derecho) * EMU_POR_TWIP
+        ancho_columna = int(round((ancho_util // 3) / EMU_POR_TWIP))
+        _paquete_base = (base.getvalue(), inicio, fin, ancho_columna)
+    return _paquete_base
+
+
+def escribir_docx_directo(ruta: str, tipo: str, participante: str, datos: Dict):
+    """Escribe el documento del participante sin python-docx, directamente como OOXML"""
+    base, inicio, fin, ancho_columna = _obtener_paquete_base()
+    formato = TIPOS_DOCUMENTO[tipo]
+    celdas = [_INICIO_CELDA.format(_twips(ancho)) for ancho in (2.5, 1.5, formato["ancho"])]
+    celda_mesa = celdas[1] + '<w:r/>' + _FIN_CELDA
+
+    titulo = _run(participante) if participante else ''
+    cabecera = "".join((
+        inicio,
+        f'<w:p><w:pPr><w:pStyle w:val="Title"/><w:jc w:val="center"/></w:pPr>{titulo}</w:p><w:p/>',
+        '<w:p>', _run("Total de citas programadas: ", True), _run(str(datos["total_citas"])), '</w:p><w:p/>',
+        '<w:tbl>', _PROPIEDADES_TABLA, '<w:tblGrid>', f'<w:gridCol w:w="{ancho_columna}"/>' * 3, '</w:tblGrid>',
+        '<w:tr>',
+        "".join(celda + _run(texto, True) + _FIN_CELDA
+                for celda, texto in zip(celdas, ("FRANJA HORARIA", "MESA", formato["columna"]))),
+        '</w:tr>',
+    ))
+    pie = "".join((
+        '</w:tbl><w:p/><w:p><w:pPr><w:jc w:val="center"/></w:pPr>',
+        _run("Nota: ", True), _run(formato["nota"]), '</w:p>',
+        fin,
+    ))
+
+    try:
+        with open(ruta, 'w+b') as archivo:
+            archivo.write(base)
+            # Modo 'a': se agrega word/document.xml al paquete base y se reescribe el directorio central
+            with zipfile.ZipFile(archivo, 'a', zipfile.ZIP_DEFLATED) as paquete:
+                with paquete.open(PARTE_DOCUMENTO, 'w') as parte:
+                    parte.write(cabecera.encode('utf-8'))
+                    for cita in datos["citas"]:
+                        fila = "".join(('<w:tr>', celdas[0], _run(cita["horario"]), _FIN_CELDA, celda_mesa,
+                                        celdas[2], _run(contraparte_cita(tipo, cita)), _FIN_CELDA, '</w:tr>'))
+                        parte.write(fila.encode('utf-8'))
+                    parte.write(pie.encode('utf-8'))
+    except BaseException:
+        # Un error a mitad de la escritura (p. ej. un carácter no válido en XML) no deja un .docx roto
+        if os.path.exists(ruta):
+            os.remove(ruta)
+        raise
+
+
+def escribir_docx_python_docx(ruta: str, tipo: str, participante: str, datos: Dict):
+    """Escribe el documento del participante con python-docx"""
+    formato = TIPOS_DOCUMENTO[tipo]
+    doc = Document()
+
+    # Título principal: nombre del participante
+    titulo = doc.add_heading(participante, 0)
+    titulo.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    doc.add_paragraph("")
+
+    # Información general
+    info_p = doc.add_paragraph()
+    info_p.add_run("Total de citas programadas: ").bold = True
+    info_p.add_run(str(datos["total_citas"]))
+    doc.add_paragraph("")
+
+    # Tabla con citas: Franja Horaria | Mesa | Comprador (o Vendedores)
+    tabla = doc.add_table(rows=1, cols=3)
+    tabla.style = 'Table Grid'
+    tabla.alignment = WD_TABLE_ALIGNMENT.CENTER
+
+    encabezados = tabla.rows[0].cells
+    encabezados[0].text = "FRANJA HORARIA"
+    encabezados[1].text = "MESA"
+    encabezados[2].text = formato["columna"]
+    for celda in encabezados:
+        for parrafo in celda.paragraphs:
+            parrafo.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            for run in parrafo.runs:
+                run.font.bold = True
+
+    for cita in datos["citas"]:
+        fila = tabla.add_row().cells
+        fila[0].text = cita["horario"]
+        fila[1].text = ""  # Mesa vacía para completar manualmente
+        fila[2].text = contraparte_cita(tipo, cita)
+        for celda in fila:
+            for parrafo in celda.paragraphs:
+                parrafo.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+    # Ajustar ancho de columnas
+    for fila in tabla.rows:
+        fila.cells[0].width = Inches(2.5)  # Franja horaria
+        fila.cells[1].width = Inches(1.5)  # Mesa
+        fila.cells[2].width = Inches(formato["ancho"])
+
+    doc.add_paragraph("")
+
+    # Nota al pie
+    nota = doc.add_paragraph()
+    nota.add_run("Nota: ").bold = True
+    nota.add_run(formato["nota"])
+    nota.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+    doc.save(ruta)
+
+
+def _renderizar_documento(tarea: Tuple[str, str, Dict, str, bool]) -> Tuple[str, str, Optional[str]]:
+    """Arma y guarda el documento de un participante; devuelve (participante, archivo, error)"""
+    tipo, participante, datos, carpeta, directo = tarea
+    nombre_archivo = nombre_archivo_docx(participante)
+    escribir = escribir_docx_directo if directo else escribir_docx_python_docx
+    try:
+        escribir(os.path.join(carpeta, nombre_archivo), tipo, participante, datos)
+    except Exception as e:
+        return participante, nombre_archivo, str(e)
+    return participante, nombre_archivo, None
+
+
+def generar_documentos_word(resumen: Iterable[Tuple[str, Dict]], tipo: str, carpeta: str,
+                            trabajadores: Optional[int] = None,
+                            progreso: Optional[Callable[[int, int, str], None]] = None,
+                            directo: bool = False) -> Tuple[int, List[Tuple[str, str]]]:
+    """Genera un documento por participante con citas, repartidos en 'trabajadores' procesos
+
+    resumen son pares (participante, {"total_citas", "citas"}) como los de resumen_por_vendedor o
+    resumen_por_comprador (un dict con .items() o LectorJsonAgenda.iterar_seccion). progreso, si se
+    indica, se llama en este proceso con (documentos terminados, total, participante) después de
+    cada documento. Con directo=True se usa escribir_docx_directo en lugar de python-docx.
+    Devuelve (documentos generados, [(participante, error), ...]).
+    """
+    if not DOCX_DISPONIBLE:
+        raise ImportError("Se requiere instalar python-docx para generar documentos Word (pip install python-docx)")
+    if tipo not in TIPOS_DOCUMENTO:
+        raise ValueError(f"Tipo de documento desconocido: {tipo}. Opciones: {', '.join(TIPOS_DOCUMENTO)}")
+    if hasattr(resumen, "items"):
+        resumen = resumen.items()
+
+    os.makedirs(carpeta, exist_ok=True)
+    # Solo participantes con citas; a cada proceso viaja solo el resumen de su participante
+    tareas = [(tipo, participante, datos, carpeta, directo)
+              for participante, datos in resumen if datos["total_citas"] > 0]
+    total = len(tareas)
+    trabajadores = trabajadores or os.cpu_count() or 1
+
+    if trabajadores == 1 or total < MINIMO_PARA_PROCESOS:
+        resultados = map(_renderizar_documento, tareas)
+        return _recoger(resultados, total, progreso)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Lotes de varios documentos por envío para no pagar la comunicación documento a documento
+    tam_lote = max(1, total // (trabajadores * 4))
+    with ProcessPoolExecutor(max_workers=min(trabajadores, total)) as executor:
+        return _recoger(executor.map(_renderizar_documento, tareas, chunksize=tam_lote), total, progreso)
+
+
+def _recoger(resultados, total: int, progreso) -> Tuple[int, List[Tuple[str, str]]]:
+    generados = 0
+    errores = []
+    for hechos, (participante, _, error) in enumerate(resultados, start=1):
+        if error is None:
+            generados += 1
+        else:
+            errores.append((participante, error))
+        if progreso is not None:
+            progreso(hechos, total, participante)
+    return generados, errores
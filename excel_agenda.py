@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Exportación de la agenda a Excel (openpyxl en modo solo escritura)
+
+Las seis hojas de agenda_rueda_negocios.xlsx se escriben fila por fila con hojas
+write-only, así que el libro no se arma en memoria celda por celda:
+- los estilos se registran una sola vez como estilos con nombre (ESTILOS_EXCEL) y cada
+  celda solo guarda el nombre del suyo;
+- la matriz compradores × horarios se llena desde un índice horario → comprador →
+  vendedores armado en una pasada sobre la agenda;
+- el ancho de cada columna se mide mientras se generan los valores de la hoja.
+
+Una hoja write-only escribe sus anchos de columna antes de la primera fila, por eso cada
+hoja se recorre dos veces: una solo con los valores (para medir) y otra para escribir.
+
+    escribir_excel_agenda(resultado, "agenda_rueda_negocios.xlsx")
+"""
+
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import openpyxl
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import DEFAULT_FONT, Alignment, Border, Font, NamedStyle, PatternFill, Side
+    from openpyxl.utils import get_column_letter
+    OPENPYXL_DISPONIBLE = True
+except ImportError:
+    OPENPYXL_DISPONIBLE = False
+
+ANCHO_MAXIMO_COLUMNA = 50
+
+# Una fila es una lista de (valor, nombre del estilo); (None, None) ocupa la celda sin escribirla
+Fila = List[Tuple[object, Optional[str]]]
+
+
+def _relleno(color: str):
+    return PatternFill(start_color=color, end_color=color, fill_type="solid")
+
+
+def _estilos_excel() -> Dict[str, Dict]:
+    """Atributos de cada estilo con nombre del libro"""
+    borde = Border(left=Side(style='thin'), right=Side(style='thin'),
+                   top=Side(style='thin'), bottom=Side(style='thin'))
+    centrado = Alignment(horizontal='center', vertical='center')
+    centrado_ajustado = Alignment(horizontal='center', vertical='center', wrap_text=True)
+    fuente_encabezado = Font(bold=True, color="FFFFFF")
+    relleno_encabezado = _relleno("2C3E50")
+    return {
+        "titulo": {"font": Font(bold=True, size=16)},
+        "seccion": {"font": fuente_encabezado, "fill": relleno_encabezado},
+        "etiqueta": {"fill": _relleno("ECF0F1")},
+        "encabezado": {"font": fuente_encabezado, "fill": relleno_encabezado, "alignment": centrado,
+                       "border": borde},
+        "borde": {"border": borde},
+        "comprador_cita": {"font": Font(color="FFFFFF", bold=True), "fill": _relleno("E74C3C"), "border": borde},
+        "vendedor_cita": {"font": Font(color="FFFFFF"), "fill": _relleno("27AE60"), "border": borde},
+        "sin_citas": {"fill": _relleno("F39C12"), "border": borde},
+        "horario_matriz": {"font": Font(bold=True), "fill": _relleno("3498DB"), "alignment": centrado,
+                           "border": borde},
+        "matriz_con_cita": {"font": Font(bold=True), "fill": _relleno("E8F5E8"), "alignment": centrado_ajustado,
+                            "border": borde},
+        "matriz_libre": {"fill": _relleno("F8F8F8"), "alignment": centrado_ajustado, "border": borde},
+        "cumplida": {"fill": _relleno("D5F4E6"), "border": borde},
+        "no_cumplida": {"fill": _relleno("FDF2F2"), "border": borde},
+    }
+
+
+def _registrar_estilos(libro):
+    for nombre, atributos in _estilos_excel().items():
+        # Sin fuente propia, la celda conserva la fuente por defecto del libro (no la vacía de NamedStyle)
+        atributos.setdefault("font", DEFAULT_FONT)
+        libro.add_named_style(NamedStyle(name=nombre, **atributos))
+
+
+def _encabezados(titulos: List[str]) -> Fila:
+    return [(titulo, "encabezado") for titulo in titulos]
+
+
+def _filas_resumen(resultado: Dict) -> Iterator[Fila]:
+    config = resultado["configuracion"]
+    stats = resultado["estadisticas"]
+    # A1:D1 se combina: las tres celdas vacías cuentan para la medida como en el libro normal
+    yield [("AGENDA RUEDA DE NEGOCIOS - RESUMEN GENERAL", "titulo")] + [(None, None)] * 3
+    yield []
+    yield [("CONFIGURACIÓN", "seccion")]
+    config_data = [
+        ["Vendedores", config['vendedores']],
+        ["Compradores", config['compradores']],
+        ["Duración total", config['duracion_total']],
+        ["Duración por cita", config['duracion_cita']],
+        ["Horario", f"{config['horario_inicio']} - {config['horario_fin']}"],
+        ["Slots disponibles", config['slots_disponibles']],
+        ["Máx. citas por vendedor", config['max_citas_por_vendedor']],
+        ["Vendedores por cita", config['vendedores_por_cita']],
+        ["Preferencias cargadas", config['preferencias_cargadas']]
+    ]
+    for etiqueta, valor in config_data:
+        yield [(etiqueta, "etiqueta"), (valor, None)]
+    yield []
+    yield [("ESTADÍSTICAS", "seccion")]
+    stats_data = [
+        ["Total citas programadas", stats['total_citas_programadas']],
+        ["Total encuentros individuales", stats['total_encuentros_individuales']],
+        ["Utilización de slots", stats['porcentaje_utilizacion_slots']],
+        ["Promedio citas por vendedor", stats['citas_promedio_por_vendedor']],
+        ["Promedio citas por comprador", stats['citas_promedio_por_comprador']],
+        ["Preferencias cumplidas", f"{stats['preferencias_cumplidas']}/{stats['total_preferencias']}"],
+        ["% Cumplimiento preferencias", f"{(stats['preferencias_cumplidas']/stats['total_preferencias']*100):.1f}%"]
+    ]
+    for etiqueta, valor in stats_data:
+        yield [(etiqueta, "etiqueta"), (valor, None)]
+
+
+def _filas_agenda(resultado: Dict) -> Iterator[Fila]:
+    yield _encabezados(['Horario', 'Cita #', 'Comprador', 'Vendedor 1', 'Vendedor 2', 'Vendedor 3'])
+    for horario, citas in resultado["agenda"].items():
+        for i, cita in enumerate(citas, 1):
+            vendedores = cita['vendedores'][:3]
+            fila = [(horario, "borde"), (f"Cita {i}", "borde"), (cita['comprador'], "comprador_cita")]
+            fila.extend((vendedor, "vendedor_cita") for vendedor in vendedores)
+            # Las columnas de vendedor vacías también llevan el estilo
+            fila.extend((None, "vendedor_cita") for _ in range(3 - len(vendedores)))
+            yield fila
+
+
+def _filas_vendedores(resultado: Dict) -> Iterator[Fila]:
+    yield _encabezados(['Vendedor', 'Total Citas', 'Preferencias Cumplidas', 'Lista de Compradores', 'Horarios'])
+    preferencias = resultado.get("preferencias_cumplidas", {})
+    for vendedor, datos in resultado["resumen_por_vendedor"].items():
+        preferencias_vendedor = preferencias.get(vendedor, [])
+        cumplidas = sum(1 for pref in preferencias_vendedor if pref.get("cumplida", False))
+        if datos['total_citas'] > 0:
+            compradores = '; '.join(cita['comprador'] for cita in datos['citas'])
+            horarios = '; '.join(cita['horario'] for cita in datos['citas'])
+            estilo = "borde"
+        else:
+            compradores = horarios = "Sin citas"
+            estilo = "sin_citas"
+        valores = (vendedor, datos['total_citas'], f"{cumplidas}/{len(preferencias_vendedor)}", compradores, horarios)
+        yield [(valor, estilo) for valor in valores]
+
+
+def _filas_compradores(resultado: Dict) -> Iterator[Fila]:
+    yield _encabezados(['Comprador', 'Total Citas', 'Lista de Vendedores', 'Horarios'])
+    for comprador, datos in resultado["resumen_por_comprador"].items():
+        if datos['total_citas'] > 0:
+            vendedores = '; '.join(v for cita in datos['citas'] for v in cita['vendedores'])
+            horarios = '; '.join(cita['horario'] for cita in datos['citas'])
+        else:
+            vendedores = horarios = "Sin citas"
+        yield [(valor, "borde") for valor in (comprador, datos['total_citas'], vendedores, horarios)]
+
+
+def indice_matriz(agenda: Dict[str, List[Dict]]) -> Dict[str, Dict[str, List[str]]]:
+    """horario → comprador → vendedores (de todas sus citas en el horario), en una pasada"""
+    indice = {}
+    for horario, citas in agenda.items():
+        por_comprador = indice[horario] = {}
+        for cita in citas:
+            por_comprador.setdefault(cita["comprador"], []).extend(cita["vendedores"])
+    return indice
+
+
+def _filas_matriz(resultado: Dict, indice: Dict[str, Dict[str, List[str]]]) -> Iterator[Fila]:
+    compradores = list(resultado["resumen_por_comprador"])
+    yield [("FRANJA HORARIA", "encabezado")] + [(comprador, "encabezado") for comprador in compradores]
+    for horario in resultado["agenda"]:
+        por_comprador = indice.get(horario, {})
+        fila = [(horario, "horario_matriz")]
+        for comprador in compradores:
+            vendedores = por_comprador.get(comprador)
+            if vendedores:
+                fila.append((", ".join(vendedores), "matriz_con_cita"))
+            else:
+                fila.append(("", "matriz_libre"))
+        yield fila
+
+
+def _filas_preferencias(resultado: Dict) -> Iterator[Fila]:
+    yield _encabezados(['Vendedor', 'Comprador Preferido', 'Estado', 'Cumplida'])
+    for vendedor, preferencias_vendedor in resultado["preferencias_cumplidas"].items():
+        for pref in preferencias_vendedor:
+            if pref['cumplida']:
+                valores, estilo = (vendedor, pref['comprador'], "✓ Cumplida", "SÍ"), "cumplida"
+            else:
+                valores, estilo = (vendedor, pref['comprador'], "✗ No cumplida", "NO"), "no_cumplida"
+            yield [(valor, estilo) for valor in valores]
+
+
+def _anchos_columnas(filas: Iterator[Fila]) -> List[int]:
+    """Ancho de cada columna (texto más largo + 2, hasta ANCHO_MAXIMO_COLUMNA)
+
+    Igual que el ajuste del libro normal, una celda vacía cuenta como len("None").
+    """
+    maximos: List[int] = []
+    fila_mas_corta = None
+    for fila in filas:
+        for columna, (valor, _) in enumerate(fila):
+            largo = len(str(valor))
+            if columna == len(maximos):
+                maximos.append(largo)
+            elif largo > maximos[columna]:
+                maximos[columna] = largo
+        if fila_mas_corta is None or len(fila) < fila_mas_corta:
+            fila_mas_corta = len(fila)
+    # Las columnas a la derecha de una fila más corta tienen celdas vacías
+    for columna in range(fila_mas_corta or 0, len(maximos)):
+        maximos[columna] = max(maximos[columna], len("None"))
+    return [min(maximo + 2, ANCHO_MAXIMO_COLUMNA) for maximo in maximos]
+
+
+def _escribir_hoja(libro, titulo: str, generar_filas, combinadas: Tuple[str, ...] = ()):
+    hoja = libro.create_sheet(titulo)
+    for columna, ancho in enumerate(_anchos_columnas(generar_filas()), 1):
+        hoja.column_dimensions[get_column_letter(columna)].width = ancho
+    for rango in combinadas:
+        hoja.merged_cells.add(rango)
+
+    for fila in generar_filas():
+        celdas = []
+        for valor, estilo in fila:
+            if estilo is None:
+                celdas.append(valor)
+                continue
+            celda = WriteOnlyCell(hoja, value=valor)
+            celda.style = estilo
+            celdas.append(celda)
+        hoja.append(celdas)
+
+
+def escribir_excel_agenda(resultado: Dict, ruta: str) -> str:
+    """Escribe las seis hojas de la agenda en 'ruta' con un libro write-only"""
+    if not OPENPYXL_DISPONIBLE:
+        raise ImportError("Se requiere instalar openpyxl para generar Excel (pip install openpyxl)")
+    libro = openpyxl.Workbook(write_only=True)
+    _registrar_estilos(libro)
+    indice = indice_matriz(resultado["agenda"])
+
+    _escribir_hoja(libro, "Resumen General", lambda: _filas_resumen(resultado), combinadas=("A1:D1",))
+    _escribir_hoja(libro, "Agenda por Horarios", lambda: _filas_agenda(resultado))
+    _escribir_hoja(libro, "Resumen Vendedores", lambda: _filas_vendedores(resultado))
+    _escribir_hoja(libro, "Resumen Compradores", lambda: _filas_compradores(resultado))
+    _escribir_hoja(libro, "Matriz Compradores-Horarios", lambda: _filas_matriz(resultado, indice))
+    _escribir_hoja(libro, "Preferencias Detalladas", lambda: _filas_preferencias(resultado))
+
+    libro.save(ruta)
+    return ruta
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Flujo de costo mínimo (caminos más cortos sucesivos con potenciales)
+
+Red genérica usada por el motor "flujo" de AgendaRuedaNegocios para resolver,
+slot por slot, el emparejamiento vendedor → comprador como un flujo máximo de
+costo mínimo. Los costos deben ser no negativos.
+"""
+
+import heapq
+from typing import List, Tuple
+
+
+class RedFlujoCostoMinimo:
+    def __init__(self, num_nodos: int):
+        self.num_nodos = num_nodos
+        # Aristas en listas paralelas: destino, capacidad residual, costo; la inversa de e es e ^ 1
+        self.destino = []
+        self.capacidad = []
+        self.costo = []
+        self.adyacencia = [[] for _ in range(num_nodos)]
+
+    def agregar_arista(self, origen: int, destino: int, capacidad: int, costo: int) -> int:
+        """Agrega una arista dirigida y su inversa residual; devuelve el índice de la arista"""
+        indice = len(self.destino)
+        self.destino.append(destino)
+        self.capacidad.append(capacidad)
+        self.costo.append(costo)
+        self.adyacencia[origen].append(indice)
+
+        self.destino.append(origen)
+        self.capacidad.append(0)
+        self.costo.append(-costo)
+        self.adyacencia[destino].append(indice + 1)
+        return indice
+
+    def flujo_en(self, indice_arista: int) -> int:
+        """Flujo que circula por la arista (capacidad de su inversa residual)"""
+        return self.capacidad[indice_arista ^ 1]
+
+    def resolver(self, fuente: int, sumidero: int) -> Tuple[int, int]:
+        """Calcula el flujo máximo de costo mínimo; devuelve (flujo, costo)"""
+        flujo_total = 0
+        costo_total = 0
+        potencial = [0] * self.num_nodos
+        infinito = float('inf')
+
+        while True:
+            # Dijkstra con costos reducidos (no negativos gracias a los potenciales)
+            distancia = [infinito] * self.num_nodos
+            arista_previa = [-1] * self.num_nodos
+            distancia[fuente] = 0
+            pendientes = [(0, fuente)]
+            while pendientes:
+                d, nodo = heapq.heappop(pendientes)
+                if d > distancia[nodo]:
+                    continue
+                for e in self.adyacencia[nodo]:
+                    if self.capacidad[e] <= 0:
+                        continue
+                    siguiente = self.destino[e]
+                    nueva = d + self.costo[e] + potencial[nodo] - potencial[siguiente]
+                    if nueva < distancia[siguiente]:
+                        distancia[siguiente] = nueva
+                        arista_previa[siguiente] = e
+                        heapq.heappush(pendientes, (nueva, siguiente))
+
+            if distancia[sumidero] == infinito:
+                break
+
+            for nodo in range(self.num_nodos):
+                if distancia[nodo] < infinito:
+                    potencial[nodo] += distancia[nodo]
+
+            # Capacidad del camino aumentante
+            camino: List[int] = []
+            nodo = sumidero
+            aumento = infinito
+            while nodo != fuente:
+                e = arista_previa[nodo]
+                camino.append(e)
+                aumento = min(aumento, self.capacidad[e])
+                nodo = self.destino[e ^ 1]
+
+            for e in camino:
+                self.capacidad[e] -= aumento
+                self.capacidad[e ^ 1] += aumento
+                costo_total += aumento * self.costo[e]
+            flujo_total += aumento
+
+        return flujo_total, costo_total
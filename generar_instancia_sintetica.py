@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+GENERADOR DE INSTANCIAS SINTÉTICAS
+==================================
+
+Genera archivos de preferencias (mismo formato que preferencias_multiples.csv)
+y su configuración de evento para probar el organizador a mayor escala:
+
+- Popularidad de compradores sesgada (ley de Zipf): unos pocos compradores
+  concentran la mayoría de solicitudes, como en la rueda real.
+- Ventanas de disponibilidad estrechas para una fracción de participantes.
+- Participantes con doble rol (vendedor y comprador a la vez), como
+  CAFÉ ORIGEN DE LA MONTAÑA.
+- Cantidades de vendedores, compradores y preferencias configurables.
+
+Uso:
+    python generar_instancia_sintetica.py --vendedores 250 --compradores 100 \\
+        --salida preferencias_sinteticas.csv --configuracion configuracion_sintetica.json
+"""
+
+import argparse
+import copy
+import csv
+import json
+import random
+from typing import Dict, List, Tuple
+
+from agenda_rueda_negocios import CONFIGURACION_EVENTO_POR_DEFECTO
+
+PREFIJOS_VENDEDOR = ["Café", "Finca", "Tostadora", "Asociación", "Cooperativa", "Mujeres cafeteras"]
+REGIONES = ["Del Tajo", "Aroma Andino", "La Montaña", "Agua Viva", "El Eje", "Sierra Nevada",
+            "Alto Huila", "Tolima", "Nariño", "Quindío", "Cauca", "Santander"]
+PREFIJOS_COMPRADOR = ["IMPORTADORA", "TIENDA", "DISTRIBUIDORA", "BOUTIQUE", "COMERCIALIZADORA", "BRAND"]
+
+
+def _nombres_unicos(prefijos: List[str], cantidad: int, rng: random.Random, mayusculas: bool) -> List[str]:
+    """Nombres legibles y únicos (prefijo + región + número)"""
+    nombres = []
+    for i in range(cantidad):
+        nombre = f"{rng.choice(prefijos)} {rng.choice(REGIONES)} {i + 1:04d}"
+        nombres.append(nombre.upper() if mayusculas else nombre)
+    return nombres
+
+
+def _minutos(hora: str) -> int:
+    horas, minutos = hora.split(":")
+    return int(horas) * 60 + int(minutos)
+
+
+def _hora(minutos: int) -> str:
+    return f"{minutos // 60:02d}:{minutos % 60:02d}"
+
+
+def generar_instancia(num_vendedores: int, num_compradores: int, min_preferencias: int = 3,
+                      max_preferencias: int = 8, sesgo: float = 1.1, fraccion_ventanas: float = 0.15,
+                      duracion_ventana: Tuple[int, int] = (60, 120), num_duales: int = 2,
+                      fraccion_prohibidos: float = 0.002, semilla: int = 0) -> Tuple[List[Tuple[str, str]], Dict]:
+    """Genera (filas de preferencias, configuración del evento)
+
+    Cada vendedor pide entre min_preferencias y max_preferencias compradores distintos,
+    elegidos con peso 1 / rango^sesgo. Los num_duales primeros compradores también
+    participan como vendedores: como el organizador trata cada rol por separado, reciben
+    ventanas disjuntas (compran hasta un corte y venden desde él), igual que CAFÉ ORIGEN
+    DE LA MONTAÑA en configuracion_evento.json. Una fracción de los demás participantes
+    recibe una ventana de disponibilidad de duracion_ventana minutos (alineada a la
+    duración de las citas).
+    """
+    rng = random.Random(semilla)
+    compradores = _nombres_unicos(PREFIJOS_COMPRADOR, num_compradores, rng, mayusculas=True)
+    vendedores = _nombres_unicos(PREFIJOS_VENDEDOR, max(num_vendedores - num_duales, 0), rng, mayusculas=False)
+
+    # Participantes con doble rol: venden y además reciben vendedores como compradores
+    duales = compradores[:min(num_duales, num_compradores)]
+    vendedores = duales + vendedores
+    rng.shuffle(vendedores)
+
+    # Popularidad tipo Zipf sobre un orden aleatorio de compradores
+    ranking = compradores[:]
+    rng.shuffle(ranking)
+    pesos = [1.0 / (rango + 1) ** sesgo for rango in range(len(ranking))]
+
+    filas = []
+    for vendedor in vendedores:
+        candidatos = [c for c in ranking if c != vendedor]
+        pesos_candidatos = [p for c, p in zip(ranking, pesos) if c != vendedor]
+        objetivo = min(rng.randint(min_preferencias, max_preferencias), len(candidatos))
+        elegidos = {}
+        while len(elegidos) < objetivo:
+            for comprador in rng.choices(candidatos, weights=pesos_candidatos, k=objetivo - len(elegidos)):
+                elegidos[comprador] = None
+        filas.extend((vendedor, comprador) for comprador in elegidos)
+
+    # Configuración: mismo horario y límites que el evento real, con ventanas estrechas
+    configuracion = copy.deepcopy(CONFIGURACION_EVENTO_POR_DEFECTO)
+    horario = configuracion["horario"]
+    inicio, fin, paso = _minutos(horario["inicio"]), _minutos(horario["fin"]), horario["duracion_cita"]
+    configuracion["disponibilidad"] = []
+    for rol, participantes in (("vendedor", vendedores), ("comprador", compradores)):
+        for participante in participantes:
+            if participante in duales or rng.random() >= fraccion_ventanas:
+                continue
+            duracion = rng.randrange(duracion_ventana[0], duracion_ventana[1] + 1, paso)
+            desde = inicio + paso * rng.randrange(max((fin - inicio - duracion) // paso, 0) + 1)
+            configuracion["disponibilidad"].append({
+                "participante": participante, "rol": rol,
+                "desde": _hora(desde), "hasta": _hora(min(desde + duracion, fin))
+            })
+
+    # Doble rol: compra en la primera parte de la jornada y vende en la segunda, sin solaparse
+    franjas = (fin - inicio) // paso
+    for participante in duales:
+        corte = inicio + paso * rng.randrange(franjas // 3, 2 * franjas // 3 + 1)
+        configuracion["disponibilidad"].extend([
+            {"participante": participante, "rol": "comprador", "desde": _hora(inicio), "hasta": _hora(corte)},
+            {"participante": participante, "rol": "vendedor", "desde": _hora(corte), "hasta": _hora(fin)}
+        ])
+
+    # Algunos pares prohibidos entre participantes que no se solicitaron
+    solicitados = set(filas)
+    configuracion["pares_prohibidos"] = []
+    for _ in range(int(len(vendedores) * len(compradores) * fraccion_prohibidos)):
+        vendedor, comprador = rng.choice(vendedores), rng.choice(compradores)
+        if vendedor != comprador and (vendedor, comprador) not in solicitados:
+            configuracion["pares_prohibidos"].append({"comprador": comprador, "vendedor": vendedor})
+    configuracion["citas_fijas"] = []
+
+    return filas, configuracion
+
+
+def guardar_instancia(filas: List[Tuple[str, str]], configuracion: Dict, ruta_preferencias: str,
+                      ruta_configuracion: str):
+    """Escribe el CSV de preferencias y el JSON de configuración"""
+    with open(ruta_preferencias, 'w', newline='', encoding='utf-8') as archivo:
+        writer = csv.writer(archivo)
+        writer.writerow(['Nombre_Vendedor', 'Comprador_Preferido'])
+        writer.writerows(filas)
+    with open(ruta_configuracion, 'w', encoding='utf-8') as archivo:
+        json.dump(configuracion, archivo, indent=2, ensure_ascii=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Genera una instancia sintética de preferencias")
+    parser.add_argument("--vendedores", type=int, default=250)
+    parser.add_argument("--compradores", type=int, default=100)
+    parser.add_argument("--min-preferencias", type=int, default=3)
+    parser.add_argument("--max-preferencias", type=int, default=8)
+    parser.add_argument("--sesgo", type=float, default=1.1,
+                        help="Exponente de Zipf para la popularidad de compradores (0 = uniforme)")
+    parser.add_argument("--fraccion-ventanas", type=float, default=0.15,
+                        help="Fracción de participantes con ventana de disponibilidad estrecha")
+    parser.add_argument("--duales", type=int, default=2,
+                        help="Compradores que además participan como vendedores")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--salida", default="preferencias_sinteticas.csv")
+    parser.add_argument("--configuracion", default="configuracion_sintetica.json")
+    args = parser.parse_args()
+
+    filas, configuracion = generar_instancia(
+        args.vendedores, args.compradores, args.min_preferencias, args.max_preferencias,
+        args.sesgo, args.fraccion_ventanas, num_duales=args.duales, semilla=args.semilla
+    )
+    guardar_instancia(filas, configuracion, args.salida, args.configuracion)
+    print(f"✅ {len(filas)} preferencias de {args.vendedores} vendedores a {args.compradores} compradores")
+    print(f"   Preferencias: {args.salida}")
+    print(f"   Configuración: {args.configuracion} "
+          f"({len(configuracion['disponibilidad'])} ventanas, {len(configuracion['pares_prohibidos'])} pares prohibidos)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,724 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Vistas HTML de la agenda
+
+Genera matriz_compradores_horarios.html y matriz_vendedores_horarios.html desde la agenda
+en memoria (resultado["agenda"]) o desde agenda_completa.json:
+- las plantillas de página se parten en trozos una sola vez, al importar el módulo
+  (campos $nombre; el CSS no necesita escapar llaves);
+- una sola pasada sobre la agenda arma las matrices de ambas vistas;
+- cada página se escribe en un io.StringIO, sin concatenar cadenas.
+
+    escribir_vistas_html(resultado)                     # desde la agenda en memoria
+    escribir_vistas_html("agenda_completa.json")        # o desde el JSON
+"""
+
+import io
+import os
+import re
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Union
+
+from json_agenda import LectorJsonAgenda
+
+_CAMPO = re.compile(r"\$(\w+)")
+
+
+class PlantillaHtml:
+    """Plantilla con campos $nombre, partida en literales y campos una sola vez"""
+
+    def __init__(self, texto: str):
+        partes = _CAMPO.split(texto)
+        self.literales = partes[0::2]
+        self.campos = partes[1::2]
+
+    def escribir(self, salida, valores: Dict):
+        """Escribe la plantilla en 'salida' (cualquier objeto con write) con los valores dados"""
+        escribir = salida.write
+        escribir(self.literales[0])
+        for campo, literal in zip(self.campos, self.literales[1:]):
+            escribir(str(valores[campo]))
+            escribir(literal)
+
+
+# Columna del coffee break: se inserta antes del séptimo horario, como en la agenda impresa
+HORARIO_COFFEE_BREAK = "10:00 - 10:15"
+POSICION_COFFEE_BREAK = 6
+MAXIMO_HORARIOS = 18
+
+_TH_COFFEE = ('\n                        <th style="background: linear-gradient(135deg, #ff9800, #f57c00); '
+              'color: white;">☕ ' + HORARIO_COFFEE_BREAK + '</th>')
+_TH_HORARIO = '\n                        <th>⏰ '
+_FIN_TH = '</th>'
+_INICIO_TBODY = """
+                    </tr>
+                </thead>
+                <tbody>"""
+_INICIO_FILA = '\n                  <tr>\n                    <td class="'
+_FIN_FILA = '\n                  </tr>'
+_FIN_CELDA = '\n                    </td>'
+_PIE = """
+                </tbody>
+            </table>
+        </div>
+    </div>
+</body>
+</html>"""
+
+
+def formatear_nombre_comprador(nombre: str) -> str:
+    """Formatea nombres largos de compradores para mejor visualización"""
+    if "ENCADENAMIENTOS PRODUCTIVOS" in nombre:
+        return nombre.replace(" - ", "<br>")
+    return nombre
+
+
+def abreviar_nombre(nombre: str) -> str:
+    """Abrevia los nombres de más de 20 caracteres para que quepan en la celda"""
+    if len(nombre) > 20:
+        palabras = nombre.split()
+        if len(palabras) > 3:
+            return f"{palabras[0]} {palabras[1]}..."
+        return nombre[:15] + "..."
+    return nombre
+
+
+def horarios_visibles(horarios: List[str]) -> List[str]:
+    """Columnas de la matriz: hasta MAXIMO_HORARIOS horarios con el coffee break intercalado"""
+    columnas = []
+    for i, horario in enumerate(horarios[:MAXIMO_HORARIOS]):
+        if i == POSICION_COFFEE_BREAK:
+            columnas.append(HORARIO_COFFEE_BREAK)
+        columnas.append(horario)
+    return columnas
+
+
+def _agenda_de(fuente: Union[Dict, str]) -> Optional[Dict[str, List[Dict]]]:
+    if isinstance(fuente, str):
+        return LectorJsonAgenda(fuente).leer_seccion('agenda')
+    # Un resultado completo o directamente su agenda
+    return fuente["agenda"] if "agenda" in fuente else fuente
+
+
+def _renderizar_matriz(vista: Dict, filas: List[str], celdas: Dict, horarios: List[str],
+                       columnas: List[str], total_citas: int, fecha: str) -> str:
+    salida = io.StringIO()
+    escribir = salida.write
+    vista["cabecera"].escribir(salida, {"total_citas": total_citas, "total_filas": len(filas),
+                                        "total_horarios": len(horarios), "fecha": fecha})
+
+    for horario in columnas:
+        if horario == HORARIO_COFFEE_BREAK:
+            escribir(_TH_COFFEE)
+        else:
+            escribir(_TH_HORARIO)
+            escribir(horario)
+            escribir(_FIN_TH)
+    escribir(_INICIO_TBODY)
+
+    clase_celda = vista["clase_celda"]
+    td_coffee = (f'\n                    <td class="{clase_celda}" style="background: linear-gradient(135deg, '
+                 '#fff3e0, #ffe0b2); color: #e65100; font-weight: bold; text-align: center;">☕ Coffee break</td>')
+    td_con_citas = f'\n                    <td class="{clase_celda}">'
+    td_vacia = f'\n                    <td class="{clase_celda} empty-cell">-</td>'
+    inicio_nombre = f'\n                      <span class="{vista["clase_nombre"]}">'
+    inicio_fila = _INICIO_FILA + vista["clase_fila"] + '">' + vista["prefijo_fila"]
+    formatear_fila = vista["formatear_fila"]
+    # Fragmento <span> de cada participante, armado la primera vez que aparece
+    fragmentos = {}
+
+    for fila in filas:
+        escribir(inicio_fila)
+        escribir(formatear_fila(fila))
+        escribir('</td>')
+        celdas_fila = celdas.get(fila, {})
+        for horario in columnas:
+            if horario == HORARIO_COFFEE_BREAK:
+                escribir(td_coffee)
+                continue
+            nombres = celdas_fila.get(horario)
+            if not nombres:
+                escribir(td_vacia)
+                continue
+            escribir(td_con_citas)
+            for nombre in nombres:
+                fragmento = fragmentos.get(nombre)
+                if fragmento is None:
+                    fragmento = fragmentos[nombre] = inicio_nombre + abreviar_nombre(nombre) + '</span>'
+                escribir(fragmento)
+            escribir(_FIN_CELDA)
+        escribir(_FIN_FILA)
+
+    escribir(_PIE)
+    return salida.getvalue()
+
+
+def renderizar_vistas_html(fuente: Union[Dict, str], vistas: Iterable[str] = None,
+                           fecha: Optional[str] = None) -> Dict[str, Dict]:
+    """Renderiza las vistas pedidas (todas por defecto) con una sola pasada sobre la agenda
+
+    fuente es el resultado (o solo su agenda) o la ruta de agenda_completa.json. Devuelve
+    {nombre_vista: {"archivo", "html", "filas", "citas"}}.
+    """
+    agenda = _agenda_de(fuente)
+    if not agenda:
+        return {}
+    vistas = list(vistas or VISTAS_HTML)
+    horarios = list(agenda)
+
+    # Una pasada: comprador → horario → vendedores y vendedor → horario → compradores
+    por_comprador: Dict[str, Dict[str, List[str]]] = {}
+    por_vendedor: Dict[str, Dict[str, List[str]]] = {}
+    total_citas = 0
+    for horario, citas in agenda.items():
+        total_citas += len(citas)
+        for cita in citas:
+            comprador = cita['comprador']
+            por_comprador.setdefault(comprador, {}).setdefault(horario, []).extend(cita['vendedores'])
+            for vendedor in cita['vendedores']:
+                por_vendedor.setdefault(vendedor, {}).setdefault(horario, []).append(comprador)
+    celdas_por_vista = {"compradores": por_comprador, "vendedores": por_vendedor}
+
+    columnas = horarios_visibles(horarios)
+    fecha = fecha or datetime.now().strftime('%d/%m/%Y')
+    renderizadas = {}
+    for nombre in vistas:
+        vista = VISTAS_HTML[nombre]
+        celdas = celdas_por_vista[nombre]
+        filas = sorted(celdas)
+        renderizadas[nombre] = {
+            "archivo": vista["archivo"],
+            "html": _renderizar_matriz(vista, filas, celdas, horarios, columnas, total_citas, fecha),
+            "filas": len(filas),
+            "citas": total_citas,
+        }
+    return renderizadas
+
+
+def escribir_vistas_html(fuente: Union[Dict, str], carpeta: str = ".", vistas: Iterable[str] = None) -> Dict[str, Dict]:
+    """Renderiza y guarda las vistas en 'carpeta'; devuelve lo mismo que renderizar_vistas_html (sin el html)"""
+    renderizadas = renderizar_vistas_html(fuente, vistas)
+    for vista in renderizadas.values():
+        with open(os.path.join(carpeta, vista["archivo"]), 'w', encoding='utf-8') as f:
+            f.write(vista.pop("html"))
+    return renderizadas
+
+
+CABECERA_COMPRADORES = PlantillaHtml("""<!DOCTYPE html>
+<html lang="es">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>📊 Matriz Compradores-Horarios | Rueda de Negocios</title>
+    <!-- SheetJS CDN para generar Excel -->
+    <script src="https://cdnjs.cloudflare.com/ajax/libs/xlsx/0.18.5/xlsx.full.min.js"></script>
+    <style>
+        * {
+            box-sizing: border-box;
+            margin: 0;
+            padding: 0;
+        }
+
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            line-height: 1.6;
+            color: #333;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            min-height: 100vh;
+        }
+
+        .header {
+            background: rgba(255, 255, 255, 0.1);
+            backdrop-filter: blur(10px);
+            padding: 15px 25px;
+
+
+
+            border-bottom: 1px solid rgba(255, 255, 255, 0.2);
+        }
+
+        .home-button {
+            position: absolute;
+            top: 25px;
+            left: 25px;
+            background: rgba(255, 255, 255, 0.2);
+            backdrop-filter: blur(8px);
+            border: 1px solid rgba(255, 255, 255, 0.3);
+            padding: 8px 16px;
+            border-radius: 20px;
+            text-decoration: none;
+            color: white;
+            font-size: 18px;
+            font-weight: 600;
+            transition: all 0.3s ease;
+            box-shadow: 0 4px 15px rgba(0, 0, 0, 0.1);
+        }
+
+        .home-button:hover {
+            background: rgba(255, 255, 255, 0.3);
+            transform: translateY(-2px);
+            box-shadow: 0 6px 20px rgba(0, 0, 0, 0.15);
+        }
+
+        .header-content {
+            text-align: center;
+            padding-left: 60px;
+        }
+
+        .header h1 {
+            color: white;
+            font-size: 2.2em;
+            margin-bottom: 8px;
+            text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.3);
+        }
+
+        .header p {
+            color: rgba(255, 255, 255, 0.9);
+            font-size: 1.1em;
+            margin-bottom: 15px;
+        }
+
+        .stats {
+            display: flex;
+            justify-content: center;
+            gap: 30px;
+            flex-wrap: wrap;
+        }
+
+        .stat-item {
+            background: rgba(255, 255, 255, 0.15);
+            padding: 8px 16px;
+            border-radius: 15px;
+            backdrop-filter: blur(5px);
+            border: 1px solid rgba(255, 255, 255, 0.2);
+        }
+
+        .stat-number {
+            display: block;
+            font-size: 1.4em;
+            font-weight: bold;
+            color: #FFD700;
+        }
+
+        .stat-label {
+            font-size: 0.9em;
+            color: rgba(255, 255, 255, 0.8);
+        }
+
+        .container {
+            padding: 30px;
+            max-width: 100%;
+            margin: 0 auto;
+        }
+
+        .table-container {
+            background: white;
+            border-radius: 20px;
+            padding: 25px;
+            box-shadow: 0 20px 60px rgba(0, 0, 0, 0.1);
+            overflow-x: auto;
+            border: 1px solid #e0e6ed;
+        }
+
+        .matrix-table {
+            width: 100%;
+            border-collapse: collapse;
+            font-size: 0.85em;
+            min-width: 1200px;
+        }
+
+        .matrix-table th {
+            background: linear-gradient(135deg, #4CAF50, #45a049);
+            color: white;
+            padding: 12px 8px;
+            text-align: center;
+            font-weight: 600;
+            border: 1px solid #45a049;
+            white-space: nowrap;
+            font-size: 0.8em;
+        }
+
+        .matrix-table th:first-child {
+            background: linear-gradient(135deg, #2196F3, #1976D2);
+            border-color: #1976D2;
+            z-index: 11;
+            min-width: 200px;
+        }
+
+        .buyer-name {
+            background: linear-gradient(135deg, #f8f9fa, #e9ecef);
+            font-weight: 600;
+            padding: 12px;
+            border: 1px solid #dee2e6;
+            text-align: left;
+            color: #2196F3;
+            white-space: normal;
+            min-width: 200px;
+            line-height: 1.3;
+            vertical-align: top;
+        }
+
+        .vendor-cell {
+            padding: 8px;
+            border: 1px solid #dee2e6;
+            text-align: center;
+            vertical-align: top;
+            background-color: #fafafa;
+            min-width: 100px;
+        }
+
+        .vendor-name {
+            display: inline-block;
+            background: linear-gradient(135deg, #FF6B6B, #FF5252);
+            color: white;
+            padding: 4px 8px;
+            border-radius: 12px;
+            margin: 2px;
+            font-size: 0.75em;
+            font-weight: 500;
+            box-shadow: 0 2px 4px rgba(255, 107, 107, 0.3);
+            white-space: nowrap;
+        }
+
+        .empty-cell {
+            color: #999;
+            font-style: italic;
+            padding: 12px;
+        }
+
+        @media (max-width: 768px) {
+            .container {
+                padding: 15px;
+            }
+
+            .header h1 {
+                font-size: 1.8em;
+            }
+
+            .stats {
+                gap: 15px;
+            }
+
+            .matrix-table {
+                font-size: 0.75em;
+            }
+
+            .home-button {
+                font-size: 16px;
+                padding: 6px 12px;
+                top: 20px;
+                left: 20px;
+            }
+
+            .header-content {
+                padding-left: 50px;
+            }
+        }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <a href="index.html" class="home-button">🏠 Inicio</a>
+        <div class="header-content">
+            <h1>📊 Matriz Compradores-Horarios</h1>
+            <p>Vista completa de la agenda - Compradores como filas, horarios como columnas</p>
+            <div class="stats">
+                <div class="stat-item">
+                    <span class="stat-number">$total_citas</span>
+                    <span class="stat-label">Citas Programadas</span>
+                </div>
+                <div class="stat-item">
+                    <span class="stat-number">$total_filas</span>
+                    <span class="stat-label">Compradores</span>
+                </div>
+                <div class="stat-item">
+                    <span class="stat-number">$total_horarios</span>
+                    <span class="stat-label">Franjas Horarias</span>
+                </div>
+                <div class="stat-item">
+                    <span class="stat-number">$fecha</span>
+                    <span class="stat-label">Última Actualización</span>
+                </div>
+            </div>
+        </div>
+    </div>
+
+    <div class="container">
+        <div class="table-container">
+            <table class="matrix-table">
+                <thead>
+                    <tr>
+                        <th>🏢 COMPRADOR</th>""")
+
+CABECERA_VENDEDORES = PlantillaHtml("""<!DOCTYPE html>
+<html lang="es">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>🏪 Matriz Vendedores-Horarios | Rueda de Negocios</title>
+    <style>
+        * {
+            box-sizing: border-box;
+            margin: 0;
+            padding: 0;
+        }
+
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            line-height: 1.6;
+            color: #333;
+            background: linear-gradient(135deg, #ff6b6b 0%, #ee5a24 100%);
+            min-height: 100vh;
+        }
+
+        .header {
+            background: rgba(255, 255, 255, 0.1);
+            backdrop-filter: blur(10px);
+            padding: 15px 25px;
+
+
+
+            border-bottom: 1px solid rgba(255, 255, 255, 0.2);
+        }
+
+        .home-button {
+            position: absolute;
+            top: 25px;
+            left: 25px;
+            background: rgba(255, 255, 255, 0.2);
+            backdrop-filter: blur(8px);
+            border: 1px solid rgba(255, 255, 255, 0.3);
+            padding: 8px 16px;
+            border-radius: 20px;
+            text-decoration: none;
+            color: white;
+            font-size: 18px;
+            font-weight: 600;
+            transition: all 0.3s ease;
+            box-shadow: 0 4px 15px rgba(0, 0, 0, 0.1);
+        }
+
+        .home-button:hover {
+            background: rgba(255, 255, 255, 0.3);
+            transform: translateY(-2px);
+            box-shadow: 0 6px 20px rgba(0, 0, 0, 0.15);
+        }
+
+        .header-content {
+            text-align: center;
+            padding-left: 60px;
+        }
+
+        .header h1 {
+            color: white;
+            font-size: 2.2em;
+            margin-bottom: 8px;
+            text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.3);
+        }
+
+        .header p {
+            color: rgba(255, 255, 255, 0.9);
+            font-size: 1.1em;
+            margin-bottom: 15px;
+        }
+
+        .stats {
+            display: flex;
+            justify-content: center;
+            gap: 30px;
+            flex-wrap: wrap;
+        }
+
+        .stat-item {
+            background: rgba(255, 255, 255, 0.15);
+            padding: 8px 16px;
+            border-radius: 15px;
+            backdrop-filter: blur(5px);
+            border: 1px solid rgba(255, 255, 255, 0.2);
+        }
+
+        .stat-number {
+            display: block;
+            font-size: 1.4em;
+            font-weight: bold;
+            color: #FFD700;
+        }
+
+        .stat-label {
+            font-size: 0.9em;
+            color: rgba(255, 255, 255, 0.8);
+        }
+
+        .container {
+            padding: 30px;
+            max-width: 100%;
+            margin: 0 auto;
+        }
+
+        .table-container {
+            background: white;
+            border-radius: 20px;
+            padding: 25px;
+            box-shadow: 0 20px 60px rgba(0, 0, 0, 0.1);
+            overflow-x: auto;
+            border: 1px solid #e0e6ed;
+        }
+
+        .matrix-table {
+            width: 100%;
+            border-collapse: collapse;
+            font-size: 0.85em;
+            min-width: 1200px;
+        }
+
+        .matrix-table th {
+            background: linear-gradient(135deg, #e74c3c, #c0392b);
+            color: white;
+            padding: 12px 8px;
+            text-align: center;
+            font-weight: 600;
+            border: 1px solid #c0392b;
+
+
+
+            white-space: nowrap;
+            font-size: 0.8em;
+        }
+
+        .matrix-table th:first-child {
+            background: linear-gradient(135deg, #d32f2f, #b71c1c);
+            border-color: #b71c1c;
+
+
+            z-index: 11;
+            min-width: 200px;
+        }
+
+        .vendor-name {
+            background: linear-gradient(135deg, #f8f9fa, #e9ecef);
+            font-weight: 600;
+            padding: 12px;
+            border: 1px solid #dee2e6;
+            text-align: left;
+            color: #d32f2f;
+
+
+
+            white-space: nowrap;
+            min-width: 200px;
+        }
+
+        .buyer-cell {
+            padding: 8px;
+            border: 1px solid #dee2e6;
+            text-align: center;
+            vertical-align: top;
+            background-color: #fafafa;
+            min-width: 100px;
+        }
+
+        .buyer-name {
+            display: inline-block;
+            background: linear-gradient(135deg, #2196F3, #1976D2);
+            color: white;
+            padding: 4px 8px;
+            border-radius: 12px;
+            margin: 2px;
+            font-size: 0.75em;
+            font-weight: 500;
+            box-shadow: 0 2px 4px rgba(33, 150, 243, 0.3);
+            white-space: nowrap;
+        }
+
+        .empty-cell {
+            color: #999;
+            font-style: italic;
+            padding: 12px;
+        }
+
+        @media (max-width: 768px) {
+            .container {
+                padding: 15px;
+            }
+
+            .header h1 {
+                font-size: 1.8em;
+            }
+
+            .stats {
+                gap: 15px;
+            }
+
+            .matrix-table {
+                font-size: 0.75em;
+            }
+
+            .home-button {
+                font-size: 16px;
+                padding: 6px 12px;
+                top: 20px;
+                left: 20px;
+            }
+
+            .header-content {
+                padding-left: 50px;
+            }
+        }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <a href="index.html" class="home-button">🏠 Inicio</a>
+        <div class="header-content">
+            <h1>🏪 Matriz Vendedores-Horarios</h1>
+            <p>Vista complementaria - Vendedores como filas, horarios como columnas</p>
+            <div class="stats">
+                <div class="stat-item">
+                    <span class="stat-number">$total_citas</span>
+                    <span class="stat-label">Citas Programadas</span>
+                </div>
+                <div class="stat-item">
+                    <span class="stat-number">$total_filas</span>
+                    <span class="stat-label">Vendedores</span>
+                </div>
+                <div class="stat-item">
+                    <span class="stat-number">$total_horarios</span>
+                    <span class="stat-label">Franjas Horarias</span>
+                </div>
+                <div class="stat-item">
+                    <span class="stat-number">$fecha</span>
+                    <span class="stat-label">Última Actualización</span>
+                </div>
+            </div>
+        </div>
+    </div>
+
+    <div class="container">
+        <div class="table-container">
+            <table class="matrix-table">
+                <thead>
+                    <tr>
+                        <th>☕ VENDEDOR</th>""")
+
+# Cada vista: archivo, plantilla de cabecera y clases/prefijos de filas y celdas
+VISTAS_HTML = {
+    "compradores": {
+        "archivo": "matriz_compradores_horarios.html",
+        "cabecera": CABECERA_COMPRADORES,
+        "clase_fila": "buyer-name",
+        "prefijo_fila": "🏢 ",
+        "formatear_fila": formatear_nombre_comprador,
+        "clase_celda": "vendor-cell",
+        "clase_nombre": "vendor-name",
+    },
+    "vendedores": {
+        "archivo": "matriz_vendedores_horarios.html",
+        "cabecera": CABECERA_VENDEDORES,
+        "clase_fila": "vendor-name",
+        "prefijo_fila": "☕ ",
+        "formatear_fila": str,
+        "clase_celda": "buyer-cell",
+        "clase_nombre": "buyer-name",
+    },
+}
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Instancias precompiladas
+
+Convierte un CSV de preferencias (más la configuración del evento) en un archivo binario
+versionado que se vuelve a cargar en milisegundos, sin releer ni depurar el CSV:
+
+    cabecera   MAGIA, versión, SHA-256 del origen y tamaños (struct, little-endian)
+    indptr     uint32 × (vendedores + 1)   adyacencia CSR vendedor → compradores solicitados
+    indices    uint32 × preferencias       identificadores de comprador, en orden del CSV
+    offsets    uint32 × (nombres + 1)      posiciones de cada nombre en el bloque de texto
+    nombres    UTF-8                       vendedores y luego compradores, en orden de aparición
+    config     UTF-8                       configuración del evento en JSON
+
+Los arreglos se leen con mmap sin copiarlos (memoryview) o como arreglos NumPy si está
+instalado. El hash cubre el CSV y la configuración: si cualquiera cambia, el archivo deja
+de ser válido y AgendaRuedaNegocios.cargar_preferencias_compiladas lo vuelve a generar. Ambos
+usan ruta_instancia(): .cache_agenda/instancias/<nombre del CSV>.instancia.
+
+    python instancia_compilada.py preferencias_multiples.csv --configuracion configuracion_evento.json
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Dict, List, Optional
+
+MAGIA_INSTANCIA = b"AGENDA-INST\0"
+VERSION_INSTANCIA = 1
+_CABECERA = struct.Struct("<12sI32sIIIII")
+
+# Carpeta por defecto de la caché de resultados y de instancias
+CARPETA_CACHE = ".cache_agenda"
+
+
+def ruta_instancia(ruta_preferencias: str, carpeta_cache: str = CARPETA_CACHE) -> str:
+    """Ruta de la instancia compilada de un CSV: carpeta_cache/instancias/<nombre>.instancia"""
+    nombre = os.path.splitext(os.path.basename(ruta_preferencias))[0]
+    return os.path.join(carpeta_cache, "instancias", f"{nombre}.instancia")
+
+
+def hash_origen(ruta_preferencias: str, configuracion: Optional[Dict]) -> bytes:
+    """SHA-256 del CSV de preferencias y de la configuración del evento"""
+    resumen = hashlib.sha256()
+    with open(ruta_preferencias, 'rb') as archivo:
+        for bloque in iter(lambda: archivo.read(1 << 20), b""):
+            resumen.update(bloque)
+    resumen.update(json.dumps(configuracion, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+    return resumen.digest()
+
+
+def _uint32(valores) -> bytes:
+    arreglo = array('I', valores)
+    if sys.byteorder != "little":
+        arreglo.byteswap()
+    return arreglo.tobytes()
+
+
+def guardar_instancia_compilada(ruta: str, hash_fuente: bytes, vendedores: List[str], compradores: List[str],
+                                preferencias: Dict[str, List[str]], configuracion: Optional[Dict]):
+    """Escribe la instancia (vendedores y compradores en orden de aparición, preferencias como CSR)"""
+    id_comprador = {comprador: i for i, comprador in enumerate(compradores)}
+    indptr, indices = [0], []
+    for vendedor in vendedores:
+        indices.extend(id_comprador[comprador] for comprador in preferencias.get(vendedor, ()))
+        indptr.append(len(indices))
+
+    nombres = [nombre.encode('utf-8') for nombre in vendedores + compradores]
+    offsets = [0]
+    for nombre in nombres:
+        offsets.append(offsets[-1] + len(nombre))
+    bloque_nombres = b"".join(nombres)
+    bloque_config = json.dumps(configuracion, ensure_ascii=False).encode('utf-8')
+
+    os.makedirs(os.path.dirname(os.path.abspath(ruta)), exist_ok=True)
+    # Temporal propio de cada proceso: los arranques en paralelo pueden compilar la misma instancia
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    with open(temporal, 'wb') as archivo:
+        archivo.write(_CABECERA.pack(MAGIA_INSTANCIA, VERSION_INSTANCIA, hash_fuente, len(vendedores),
+                                     len(compradores), len(indices), len(bloque_nombres), len(bloque_config)))
+        archivo.write(_uint32(indptr))
+        archivo.write(_uint32(indices))
+        archivo.write(_uint32(offsets))
+        archivo.write(bloque_nombres)
+        archivo.write(bloque_config)
+    # Reemplazo atómico: un proceso que lea a la vez nunca ve un archivo a medio escribir
+    os.replace(temporal, ruta)
+
+
+class InstanciaCompilada:
+    """Instancia abierta con mmap; indptr e indices son vistas sin copia del archivo"""
+
+    def __init__(self, ruta: str):
+        self.ruta = ruta
+        with open(ruta, 'rb') as archivo:
+            self._mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            (magia, self.version, self.hash_fuente, self.num_vendedores, self.num_compradores,
+             self.num_preferencias, largo_nombres, largo_config) = _CABECERA.unpack_from(self._mapa, 0)
+        except struct.error:
+            self._mapa.close()
+            raise ValueError(f"{ruta} no es una instancia compilada")
+        if magia != MAGIA_INSTANCIA or self.version != VERSION_INSTANCIA:
+            self._mapa.close()
+            raise ValueError(f"{ruta} no es una instancia compilada v{VERSION_INSTANCIA}")
+
+        num_nombres = self.num_vendedores + self.num_compradores
+        posicion = _CABECERA.size
+        self._inicio_indptr = posicion
+        posicion += 4 * (self.num_vendedores + 1)
+        self._inicio_indices = posicion
+        posicion += 4 * self.num_preferencias
+        self._inicio_offsets = posicion
+        posicion += 4 * (num_nombres + 1)
+        self._inicio_nombres = posicion
+        posicion += largo_nombres
+        self._inicio_config = posicion
+        self._fin = posicion + largo_config
+        if self._fin > len(self._mapa):
+            self._mapa.close()
+            raise ValueError(f"{ruta} está truncado")
+
+        self._vista = memoryview(self._mapa)
+        self.indptr = self._enteros(self._inicio_indptr, self.num_vendedores + 1)
+        self.indices = self._enteros(self._inicio_indices, self.num_preferencias)
+
+    def _enteros(self, inicio: int, cantidad: int):
+        vista = self._vista[inicio:inicio + 4 * cantidad]
+        if sys.byteorder == "little":
+            return vista.cast('I')
+        arreglo = array('I', vista)
+        arreglo.byteswap()
+        return arreglo
+
+    def nombres(self) -> List[str]:
+        """Vendedores y luego compradores (decodificados una sola vez)"""
+        offsets = self._enteros(self._inicio_offsets, self.num_vendedores + self.num_compradores + 1)
+        texto = bytes(self._vista[self._inicio_nombres:self._inicio_config])
+        resultado = [texto[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(len(offsets) - 1)]
+        if isinstance(offsets, memoryview):
+            offsets.release()
+        return resultado
+
+    def configuracion(self) -> Optional[Dict]:
+        return json.loads(bytes(self._vista[self._inicio_config:self._fin]).decode('utf-8'))
+
+    def arreglos_numpy(self):
+        """(indptr, indices) como arreglos NumPy sobre el mismo mapa de memoria (None sin NumPy)"""
+        try:
+            import numpy as np
+        except ImportError:
+            return None
+        tipo = np.dtype('<u4')
+        return (np.frombuffer(self._mapa, dtype=tipo, count=self.num_vendedores + 1, offset=self._inicio_indptr),
+                np.frombuffer(self._mapa, dtype=tipo, count=self.num_preferencias, offset=self._inicio_indices))
+
+    def cerrar(self):
+        for vista in (self.indptr, self.indices, self._vista):
+            if isinstance(vista, memoryview):
+                vista.release()
+        try:
+            self._mapa.close()
+        except BufferError:
+            # Siguen vivos arreglos NumPy sobre el mapa; se libera cuando ellos desaparezcan
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        self.cerrar()
+        return False
+
+
+def leer_instancia_compilada(ruta: str, hash_esperado: Optional[bytes] = None) -> Optional[Dict]:
+    """Vendedores, compradores y preferencias de la instancia, o None si falta, es de otra
+    versión o su hash no coincide con hash_esperado"""
+    if not os.path.exists(ruta):
+        return None
+    try:
+        with InstanciaCompilada(ruta) as instancia:
+            if hash_esperado is not None and instancia.hash_fuente != hash_esperado:
+                return None
+            nombres = instancia.nombres()
+            vendedores = nombres[:instancia.num_vendedores]
+            compradores = nombres[instancia.num_vendedores:]
+            indptr, indices = instancia.indptr.tolist(), instancia.indices.tolist()
+            preferencias = {
+                vendedor: [compradores[j] for j in indices[indptr[i]:indptr[i + 1]]]
+                for i, vendedor in enumerate(vendedores)
+            }
+            return {"vendedores": vendedores, "compradores": compradores, "preferencias": preferencias,
+                    "configuracion": instancia.configuracion()}
+    except (OSError, ValueError, UnicodeDecodeError):
+        return None
+
+
+# La misma configuración que carga agenda_rueda_negocios.main()
+CONFIGURACION_POR_DEFECTO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "configuracion_evento.json")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compila un CSV de preferencias en una instancia binaria")
+    parser.add_argument("preferencias", help="CSV de preferencias (Nombre_Vendedor, Comprador_Preferido)")
+    configuracion_por_defecto = CONFIGURACION_POR_DEFECTO if os.path.exists(CONFIGURACION_POR_DEFECTO) else None
+    parser.add_argument("--configuracion", default=configuracion_por_defecto,
+                        help="Configuración del evento (JSON/TOML); debe ser la misma con la que se generará "
+                             "la agenda (por defecto: configuracion_evento.json junto al programa, si existe)")
+    parser.add_argument("--salida", help=f"Archivo de salida (por defecto: {ruta_instancia('<csv>')})")
+    args = parser.parse_args()
+
+    from agenda_rueda_negocios import AgendaRuedaNegocios, cargar_configuracion_evento, configurar_registro
+
+    configurar_registro(silencioso=True)
+    if not os.path.exists(args.preferencias):
+        print(f"❌ No se pudo leer {args.preferencias}")
+        sys.exit(1)
+    configuracion = cargar_configuracion_evento(args.configuracion) if args.configuracion else None
+    organizador = AgendaRuedaNegocios(configuracion=configuracion)
+    vendedores, compradores, preferencias = organizador._leer_csv_preferencias(args.preferencias)
+    salida = args.salida or ruta_instancia(args.preferencias)
+    guardar_instancia_compilada(salida, hash_origen(args.preferencias, organizador.configuracion_evento),
+                                vendedores, compradores, preferencias, organizador.configuracion_evento)
+    print(f"✅ Instancia compilada: {salida} ({len(vendedores)} vendedores, {len(compradores)} compradores, "
+          f"{sum(len(p) for p in preferencias.values())} preferencias)")
+
+
+if __name__ == "__main__":
+    main()
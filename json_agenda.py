@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Lectura y escritura incremental de agenda_completa.json
+
+- EscritorJsonAgenda / escribir_resultado: escriben el resultado sección por sección
+  (y las secciones grandes entrada por entrada) con el mismo formato que
+  json.dump(indent=2, ensure_ascii=False), sin armar el documento completo en memoria.
+- LectorJsonAgenda: recorre el archivo por bloques y entrega solo lo que se pide
+  (una sección, las citas una a una o el resumen de un participante); las demás
+  secciones se saltan sin decodificarlas, así que la memoria no crece con el evento.
+
+Solo usa la biblioteca estándar; el archivo sigue siendo JSON normal, legible con json.load.
+"""
+
+import json
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Secciones del resultado que se escriben entrada por entrada
+SECCIONES_POR_PARTES = ("agenda", "resumen_por_vendedor", "resumen_por_comprador", "preferencias_cumplidas")
+
+_ESPACIOS = " \t\n\r"
+_ESTRUCTURA = re.compile(r'["\[\]{}]')
+_RESTO_CADENA = re.compile(r'(?:[^"\\]|\\.)*"', re.S)
+# Caracteres con los que un número puede seguir en el bloque siguiente ("12|.5", "1|e5")
+_CONTINUACION_NUMERO = re.compile(r"[0-9.eE+-]*")
+_decodificador = json.JSONDecoder()
+
+
+class EscritorJsonAgenda:
+    """Escribe un objeto JSON de primer nivel sección por sección
+
+    Uso:
+        with EscritorJsonAgenda("agenda_completa.json") as escritor:
+            escritor.escribir_seccion("configuracion", configuracion)
+            escritor.escribir_seccion_por_partes("agenda", citas_por_horario)
+    """
+
+    def __init__(self, ruta: str, sangria: int = 2):
+        self.ruta = ruta
+        self.sangria = sangria
+        self._archivo = None
+        self._vacio = True
+
+    def __enter__(self):
+        self._archivo = open(self.ruta, 'w', encoding='utf-8')
+        self._archivo.write("{")
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        self._archivo.write("}" if self._vacio else "\n}")
+        self._archivo.close()
+        return False
+
+    def _codificar(self, valor: Any, nivel: int) -> str:
+        texto = json.dumps(valor, indent=self.sangria, ensure_ascii=False)
+        # json.dumps escapa los saltos de línea de las cadenas: cada \n es de formato
+        return texto.replace("\n", "\n" + " " * (self.sangria * nivel))
+
+    @staticmethod
+    def _clave(clave) -> str:
+        return json.dumps(clave if isinstance(clave, str) else str(clave), ensure_ascii=False)
+
+    def _nueva_seccion(self, nombre: str):
+        self._archivo.write(("\n" if self._vacio else ",\n") + " " * self.sangria + self._clave(nombre) + ": ")
+        self._vacio = False
+
+    def escribir_seccion(self, nombre: str, valor: Any):
+        """Escribe una sección completa"""
+        self._nueva_seccion(nombre)
+        self._archivo.write(self._codificar(valor, 1))
+
+    def escribir_seccion_por_partes(self, nombre: str, pares: Iterable[Tuple[str, Any]]):
+        """Escribe una sección objeto consumiendo (clave, valor) a medida que se producen"""
+        self._nueva_seccion(nombre)
+        sangria = " " * (self.sangria * 2)
+        vacia = True
+        for clave, valor in pares:
+            self._archivo.write(("{\n" if vacia else ",\n") + sangria + self._clave(clave) + ": " + self._codificar(valor, 2))
+            vacia = False
+        self._archivo.write("{}" if vacia else "\n" + " " * self.sangria + "}")
+
+
+def escribir_resultado(resultado: Dict, ruta: str):
+    """Guarda el resultado completo en JSON, escribiendo las secciones grandes entrada por entrada"""
+    with EscritorJsonAgenda(ruta) as escritor:
+        for nombre in resultado:
+            valor = resultado[nombre]
+            if nombre in SECCIONES_POR_PARTES and isinstance(valor, dict):
+                escritor.escribir_seccion_por_partes(nombre, valor.items())
+            else:
+                escritor.escribir_seccion(nombre, valor)
+
+
+class _Cursor:
+    """Posición dentro de un archivo JSON leído por bloques"""
+
+    def __init__(self, archivo, tam_bloque: int):
+        self.archivo = archivo
+        self.tam_bloque = tam_bloque
+        self.buffer = ""
+        self.pos = 0
+        self.fin = False
+
+    def _cargar(self) -> bool:
+        """Lee otro bloque (descartando lo ya consumido); False al llegar al final del archivo"""
+        if self.fin:
+            return False
+        bloque = self.archivo.read(max(self.tam_bloque, len(self.buffer) - self.pos))
+        if not bloque:
+            self.fin = True
+            return False
+        self.buffer = self.buffer[self.pos:] + bloque
+        self.pos = 0
+        return True
+
+    def caracter(self) -> str:
+        """Siguiente carácter significativo sin consumirlo ('' al final)"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _ESPACIOS:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._cargar():
+                return ""
+
+    def consumir(self, esperado: str):
+        encontrado = self.caracter()
+        if encontrado != esperado:
+            raise ValueError(f"JSON inválido: se esperaba {esperado!r} y se encontró {encontrado!r}")
+        self.pos += 1
+
+    def valor(self) -> Any:
+        """Decodifica el valor que empieza en la posición actual"""
+        self.caracter()
+        while True:
+            try:
+                valor, fin = _decodificador.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._cargar():
+                    raise
+                continue
+            # raw_decode acepta el prefijo de un número cortado por el bloque ("12" de "12.5"):
+            # si tras él solo quedan caracteres de número, se lee otro bloque y se decodifica de nuevo
+            if type(valor) in (int, float) and _CONTINUACION_NUMERO.fullmatch(self.buffer, fin) and self._cargar():
+                continue
+            self.pos = fin
+            return valor
+
+    def saltar_valor(self):
+        """Avanza sobre el valor actual sin construirlo"""
+        if self.caracter() not in "{[":
+            self.valor()
+            return
+        profundidad = 0
+        while True:
+            coincidencia = _ESTRUCTURA.search(self.buffer, self.pos)
+            if coincidencia is None:
+                self.pos = len(self.buffer)
+                if not self._cargar():
+                    raise ValueError("JSON inválido: el archivo termina dentro de un valor")
+                continue
+            simbolo = coincidencia.group()
+            if simbolo == '"':
+                resto = _RESTO_CADENA.match(self.buffer, coincidencia.end())
+                if resto is None:
+                    self.pos = coincidencia.start()
+                    if not self._cargar():
+                        raise ValueError("JSON inválido: cadena sin cerrar")
+                    continue
+                self.pos = resto.end()
+                continue
+            self.pos = coincidencia.end()
+            profundidad += 1 if simbolo in "{[" else -1
+            if profundidad == 0:
+                return
+
+    def miembros(self) -> Iterator[str]:
+        """Recorre un objeto: entrega cada clave con el cursor al inicio de su valor
+
+        Quien consume debe leer o saltar el valor antes de pedir la siguiente clave.
+        """
+        self.consumir("{")
+        if self.caracter() == "}":
+            self.pos += 1
+            return
+        while True:
+            clave = self.valor()
+            self.consumir(":")
+            yield clave
+            separador = self.caracter()
+            self.pos += 1
+            if separador == "}":
+                return
+            if separador != ",":
+                raise ValueError(f"JSON inválido: se esperaba ',' o '}}' y se encontró {separador!r}")
+
+    def elementos(self) -> Iterator[None]:
+        """Recorre un arreglo: se detiene al inicio de cada elemento (mismo contrato que miembros)"""
+        self.consumir("[")
+        if self.caracter() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield None
+            separador = self.caracter()
+            self.pos += 1
+            if separador == "]":
+                return
+            if separador != ",":
+                raise ValueError(f"JSON inválido: se esperaba ',' o ']' y se encontró {separador!r}")
+
+
+class LectorJsonAgenda:
+    """Consultas sobre agenda_completa.json sin cargar el documento completo"""
+
+    def __init__(self, ruta: str, tam_bloque: int = 1 << 16):
+        self.ruta = ruta
+        self.tam_bloque = tam_bloque
+
+    def _recorrer_hasta(self, archivo, nombre: str) -> Optional[_Cursor]:
+        """Cursor posicionado al inicio de la sección pedida (None si no existe)"""
+        cursor = _Cursor(archivo, self.tam_bloque)
+        for clave in cursor.miembros():
+            if clave == nombre:
+                return cursor
+            cursor.saltar_valor()
+        return None
+
+    def secciones(self) -> List[str]:
+        """Nombres de las secciones de primer nivel"""
+        with open(self.ruta, 'r', encoding='utf-8') as archivo:
+            cursor = _Cursor(archivo, self.tam_bloque)
+            nombres = []
+            for clave in cursor.miembros():
+                nombres.append(clave)
+                cursor.saltar_valor()
+            return nombres
+
+    def leer_seccion(self, nombre: str, por_defecto: Any = None) -> Any:
+        """Decodifica solo la sección pedida"""
+        with open(self.ruta, 'r', encoding='utf-8') as archivo:
+            cursor = self._recorrer_hasta(archivo, nombre)
+            return cursor.valor() if cursor is not None else por_defecto
+
+    def iterar_seccion(self, nombre: str) -> Iterator[Tuple[str, Any]]:
+        """Entrega (clave, valor) de una sección objeto, una entrada a la vez"""
+        with open(self.ruta, 'r', encoding='utf-8') as archivo:
+            cursor = self._recorrer_hasta(archivo, nombre)
+            if cursor is None:
+                return
+            for clave in cursor.miembros():
+                yield clave, cursor.valor()
+
+    def iterar_citas(self) -> Iterator[Tuple[str, Dict]]:
+        """Entrega (horario, cita) de la agenda, una cita a la vez"""
+        with open(self.ruta, 'r', encoding='utf-8') as archivo:
+            cursor = self._recorrer_hasta(archivo, "agenda")
+            if cursor is None:
+                return
+            for horario in cursor.miembros():
+                for _ in cursor.elementos():
+                    yield horario, cursor.valor()
+
+    def resumen(self, seccion: str, participante: str) -> Optional[Dict]:
+        """Resumen de un participante ("resumen_por_vendedor" o "resumen_por_comprador")"""
+        with open(self.ruta, 'r', encoding='utf-8') as archivo:
+            cursor = self._recorrer_hasta(archivo, seccion)
+            if cursor is None:
+                return None
+            for clave in cursor.miembros():
+                if clave == participante:
+                    return cursor.valor()
+                cursor.saltar_valor()
+        return None
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Modelo compacto de la agenda
+
+Estructuras usadas por AgendaRuedaNegocios para ferias grandes:
+- TablaIdentificadores: interna los nombres de participantes y les asigna
+  identificadores enteros estables (no se reutilizan al dar de baja a alguien).
+- Cita: registro de una cita con __slots__; los vendedores se agregan en el
+  lugar en vez de reconstruir la tupla.
+- MatrizEncuentros: encuentros comprador×vendedor como matriz de bits (una
+  fila entera por comprador, un bit por identificador de vendedor).
+- ResultadoAgenda: dict del resultado cuyos resúmenes por vendedor y por
+  comprador se calculan en una sola pasada al primer acceso (o al serializar).
+"""
+
+import sys
+from typing import Dict, Iterator, List, Tuple
+
+
+class TablaIdentificadores:
+    """Nombres internados ↔ identificadores enteros consecutivos"""
+    __slots__ = ("ids", "nombres")
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.nombres: List[str] = []
+
+    def identificador(self, nombre: str) -> int:
+        """Identificador del nombre, asignando uno nuevo la primera vez"""
+        ident = self.ids.get(nombre)
+        if ident is None:
+            ident = len(self.nombres)
+            nombre = sys.intern(nombre)
+            self.ids[nombre] = ident
+            self.nombres.append(nombre)
+        return ident
+
+    def internar(self, nombre: str) -> str:
+        """Devuelve la instancia única del nombre (las comparaciones pasan a ser por identidad)"""
+        return self.nombres[self.identificador(nombre)]
+
+    def __len__(self) -> int:
+        return len(self.nombres)
+
+
+class Cita:
+    """Cita de un comprador con sus vendedores en un slot
+
+    Se puede desempaquetar como la tupla (comprador, vendedores) que usaba la agenda.
+    """
+    __slots__ = ("comprador", "vendedores")
+
+    def __init__(self, comprador: str, vendedores: List[str]):
+        self.comprador = comprador
+        self.vendedores = list(vendedores)
+
+    def __iter__(self) -> Iterator:
+        return iter((self.comprador, self.vendedores))
+
+    def __getitem__(self, indice: int):
+        return (self.comprador, self.vendedores)[indice]
+
+    def __eq__(self, otra) -> bool:
+        return tuple(self) == tuple(otra)
+
+    def __repr__(self) -> str:
+        return f"Cita({self.comprador!r}, {self.vendedores!r})"
+
+
+class MatrizEncuentros:
+    """Encuentros ya realizados como matriz de bits comprador × vendedor
+
+    Cada fila es un entero: el bit i está encendido si el comprador ya se reunió con
+    el vendedor de identificador i. Los nombres solo se recuperan al exportar.
+    """
+    __slots__ = ("ids_vendedor", "filas")
+
+    def __init__(self, ids_vendedor: TablaIdentificadores, compradores=()):
+        self.ids_vendedor = ids_vendedor
+        self.filas: Dict[str, int] = {comprador: 0 for comprador in compradores}
+
+    def fila(self, comprador: str) -> int:
+        """Máscara de vendedores con los que el comprador ya se reunió"""
+        return self.filas.get(comprador, 0)
+
+    def contiene(self, comprador: str, vendedor: str) -> bool:
+        ident = self.ids_vendedor.ids.get(vendedor)
+        return ident is not None and bool((self.filas.get(comprador, 0) >> ident) & 1)
+
+    def agregar(self, comprador: str, vendedor: str):
+        self.filas[comprador] = self.filas.get(comprador, 0) | (1 << self.ids_vendedor.identificador(vendedor))
+
+    def quitar(self, comprador: str, vendedor: str):
+        ident = self.ids_vendedor.ids.get(vendedor)
+        if ident is not None and comprador in self.filas:
+            self.filas[comprador] &= ~(1 << ident)
+
+    def agregar_comprador(self, comprador: str):
+        self.filas.setdefault(comprador, 0)
+
+    def eliminar_comprador(self, comprador: str):
+        self.filas.pop(comprador, None)
+
+    def eliminar_vendedor(self, vendedor: str):
+        """Apaga la columna del vendedor en todas las filas"""
+        ident = self.ids_vendedor.ids.get(vendedor)
+        if ident is None:
+            return
+        mascara = ~(1 << ident)
+        for comprador in self.filas:
+            self.filas[comprador] &= mascara
+
+    def __eq__(self, otra) -> bool:
+        """Dos matrices son iguales si registran los mismos encuentros (las filas vacías no cuentan)"""
+        if not isinstance(otra, MatrizEncuentros):
+            return NotImplemented
+        return ({c: f for c, f in self.filas.items() if f} == {c: f for c, f in otra.filas.items() if f} and
+                self.ids_vendedor.ids == otra.ids_vendedor.ids)
+
+    def vendedores(self, comprador: str) -> List[str]:
+        """Nombres de los vendedores con los que el comprador ya se reunió (para exportar)"""
+        fila = self.filas.get(comprador, 0)
+        nombres = self.ids_vendedor.nombres
+        resultado = []
+        while fila:
+            bit_menor = fila & -fila
+            resultado.append(nombres[bit_menor.bit_length() - 1])
+            fila ^= bit_menor
+        return resultado
+
+
+# Marca de una vista de ResultadoAgenda que todavía no se calculó
+_DIFERIDA = object()
+
+
+class ResultadoAgenda(dict):
+    """Resultado de generar_agenda_optimizada con vistas calculadas al primer acceso
+
+    Se usa como el dict de siempre. resumen_por_vendedor y resumen_por_comprador ocupan
+    su lugar en el orden de las claves pero solo se construyen (los dos juntos, en una
+    sola pasada sobre la agenda formateada) cuando alguien los lee, los recorre o
+    serializa el resultado con json o pickle. Un exportador que solo lee "agenda" nunca
+    paga por ellos.
+    """
+    __slots__ = ("_participantes",)
+
+    VISTAS_DIFERIDAS = ("resumen_por_vendedor", "resumen_por_comprador")
+
+    def __init__(self, datos: Dict, vendedores: List[str], compradores: List[str]):
+        super().__init__(datos)
+        for clave in self.VISTAS_DIFERIDAS:
+            dict.__setitem__(self, clave, _DIFERIDA)
+        self._participantes = (list(vendedores), list(compradores))
+
+    def _materializar(self):
+        if self._participantes is None:
+            return
+        vendedores, compradores = self._participantes
+        self._participantes = None
+        por_vendedor, por_comprador = resumir_por_participante(dict.get(self, "agenda", {}), vendedores, compradores)
+        for clave, vista in zip(self.VISTAS_DIFERIDAS, (por_vendedor, por_comprador)):
+            if dict.get(self, clave) is _DIFERIDA:
+                dict.__setitem__(self, clave, vista)
+
+    def __getitem__(self, clave):
+        valor = dict.__getitem__(self, clave)
+        if valor is _DIFERIDA:
+            self._materializar()
+            valor = dict.__getitem__(self, clave)
+        return valor
+
+    def get(self, clave, por_defecto=None):
+        return self[clave] if clave in self else por_defecto
+
+    def pop(self, clave, *por_defecto):
+        if dict.get(self, clave) is _DIFERIDA:
+            self._materializar()
+        return dict.pop(self, clave, *por_defecto)
+
+    def setdefault(self, clave, por_defecto=None):
+        if dict.get(self, clave) is _DIFERIDA:
+            self._materializar()
+        return dict.setdefault(self, clave, por_defecto)
+
+    def popitem(self):
+        self._materializar()
+        return dict.popitem(self)
+
+    def __iter__(self) -> Iterator:
+        # Redefinido para que dict(resultado) y {**resultado} pasen por __getitem__
+        return dict.__iter__(self)
+
+    def items(self):
+        self._materializar()
+        return dict.items(self)
+
+    def values(self):
+        self._materializar()
+        return dict.values(self)
+
+    def copy(self) -> Dict:
+        return dict(self.items())
+
+    def __eq__(self, otro) -> bool:
+        self._materializar()
+        if isinstance(otro, ResultadoAgenda):
+            otro._materializar()
+        return dict.__eq__(self, otro)
+
+    def __ne__(self, otro) -> bool:
+        igual = self.__eq__(otro)
+        return igual if igual is NotImplemented else not igual
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        self._materializar()
+        return dict.__repr__(self)
+
+
+def resumir_por_participante(agenda: Dict[str, List[Dict]], vendedores: List[str],
+                             compradores: List[str]) -> Tuple[Dict, Dict]:
+    """Resúmenes por vendedor y por comprador en una sola pasada sobre la agenda formateada
+
+    Solo incluye a los participantes indicados, en ese orden, con sus citas en orden de horario.
+    """
+    citas_vendedor = {vendedor: [] for vendedor in vendedores}
+    citas_comprador = {comprador: [] for comprador in compradores}
+    for horario, citas in agenda.items():
+        for cita in citas:
+            comprador, vendedores_cita = cita["comprador"], cita["vendedores"]
+            for vendedor in vendedores_cita:
+                lista = citas_vendedor.get(vendedor)
+                if lista is not None:
+                    lista.append({
+                        "horario": horario,
+                        "comprador": comprador,
+                        "otros_vendedores": [v for v in vendedores_cita if v != vendedor]
+                    })
+            lista = citas_comprador.get(comprador)
+            if lista is not None:
+                lista.append({"horario": horario, "vendedores": list(vendedores_cita)})
+    por_vendedor = {vendedor: {"total_citas": len(citas), "citas": citas} for vendedor, citas in citas_vendedor.items()}
+    por_comprador = {comprador: {"total_citas": len(citas), "citas": citas} for comprador, citas in citas_comprador.items()}
+    return por_vendedor, por_comprador
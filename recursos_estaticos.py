@@ -0,0 +1,556 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Recursos estáticos de las vistas web
+
+Publica las páginas (index.html, matrices, agenda web y visualizador) en una carpeta aparte con
+el CSS y el JS en línea extraídos a archivos externos:
+- el CSS se parte en reglas; las reglas que repiten las páginas de una misma familia van a una
+  hoja común (comun-N.css) y el resto a la hoja propia de cada página;
+- CSS y JS se minifican y se nombran con el hash de su contenido (index.1a2b3c4d5e.css), así
+  pueden servirse con caché indefinida (Cache-Control: max-age=31536000, immutable);
+- cada archivo publicado lleva sus variantes .gz y .br precomprimidas (.br solo con brotli);
+- recursos/manifest.json relaciona nombres lógicos, archivos con hash y recursos de cada página.
+
+Las páginas originales no se modifican.
+
+    publicar_sitio(PAGINAS_SITIO, "sitio", adicionales=["agenda_completa.json"])
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import brotli
+    BROTLI_DISPONIBLE = True
+except ImportError:
+    BROTLI_DISPONIBLE = False
+
+# Páginas que forman el sitio, en el orden en que se agrupan
+PAGINAS_SITIO = (
+    "index.html",
+    "matriz_compradores_horarios.html",
+    "matriz_vendedores_horarios.html",
+    "agenda_web_completa.html",
+    "agenda_web_estatica.html",
+    "visualizar_agenda.html",
+)
+
+CARPETA_RECURSOS = "recursos"
+ARCHIVO_MANIFIESTO = "manifest.json"
+LONGITUD_HASH = 10
+
+# Calidad brotli: máxima para los recursos con hash (se comprimen una vez y son pequeños) y
+# menor para páginas y JSON, que cambian en cada ejecución y pueden pesar megabytes
+CALIDAD_BROTLI_RECURSOS = 11
+CALIDAD_BROTLI_PAGINAS = 9
+
+# Por debajo de estos bytes comunes una hoja compartida no compensa la petición extra
+MINIMO_HOJA_COMUN = 512
+
+# Propiedades abreviadas que también fijan propiedades de otra familia
+_FAMILIAS_ABARCADAS = {
+    "font": {"line"},
+    "gap": {"row", "column"},
+    "grid": {"row", "column", "gap"},
+    "columns": {"column"},
+    "inset": {"top", "right", "bottom", "left"},
+    "place": {"align", "justify"},
+}
+
+_ESTILO = re.compile(r"([ \t]*)<style(\s[^>]*)?>(.*?)</style>[ \t]*\n?", re.S | re.I)
+_SCRIPT = re.compile(r"<script(\s[^>]*)?>(.*?)</script>", re.S | re.I)
+_TIPOS_JS = ("", "text/javascript", "application/javascript", "module")
+
+
+# ---------------------------------------------------------------- CSS
+
+def _partes_css(texto: str) -> List[Tuple[str, str]]:
+    """Parte el texto en ("codigo" | "cadena", trozo) y descarta los comentarios"""
+    partes, codigo, i, n = [], [], 0, len(texto)
+    while i < n:
+        caracter = texto[i]
+        if caracter == "/" and texto.startswith("/*", i):
+            fin = texto.find("*/", i + 2)
+            i = n if fin < 0 else fin + 2
+            codigo.append(" ")
+        elif caracter in "\"'":
+            fin = i + 1
+            while fin < n and texto[fin] != caracter:
+                fin += 2 if texto[fin] == "\\" else 1
+            if codigo:
+                partes.append(("codigo", "".join(codigo)))
+                codigo = []
+            partes.append(("cadena", texto[i:fin + 1]))
+            i = fin + 1
+        else:
+            codigo.append(caracter)
+            i += 1
+    if codigo:
+        partes.append(("codigo", "".join(codigo)))
+    return partes
+
+
+def _compactar(texto: str, patron: re.Pattern) -> str:
+    """Colapsa espacios y quita los que rodean a los signos de 'patron', sin tocar las cadenas"""
+    trozos = []
+    for tipo, trozo in _partes_css(texto):
+        if tipo == "codigo":
+            trozo = patron.sub(r"\1", re.sub(r"\s+", " ", trozo))
+        trozos.append(trozo)
+    return "".join(trozos).strip()
+
+
+_SIGNOS_SELECTOR = re.compile(r" ?([,>+~]) ?")
+_SIGNOS_VALOR = re.compile(r" ?([,]) ?")
+_SIGNOS_MEDIA = re.compile(r" ?([:,]) ?")
+
+
+def _dividir(texto: str, separador: str) -> List[str]:
+    """Divide por 'separador' fuera de cadenas y paréntesis (url(data:...;base64,...))"""
+    piezas, actual, profundidad = [], [], 0
+    for tipo, trozo in _partes_css(texto):
+        if tipo == "cadena":
+            actual.append(trozo)
+            continue
+        for caracter in trozo:
+            if caracter == "(":
+                profundidad += 1
+            elif caracter == ")":
+                profundidad -= 1
+            elif caracter == separador and profundidad == 0:
+                piezas.append("".join(actual))
+                actual = []
+                continue
+            actual.append(caracter)
+    piezas.append("".join(actual))
+    return piezas
+
+
+def _declaraciones(cuerpo: str) -> Tuple[str, Set[str]]:
+    """Minifica las declaraciones de una regla y devuelve (texto, familias de propiedades)"""
+    minificadas, familias = [], set()
+    for declaracion in _dividir(cuerpo, ";"):
+        propiedad, dos_puntos, valor = declaracion.partition(":")
+        propiedad = propiedad.strip()
+        if not dos_puntos or not propiedad:
+            continue
+        valor = _compactar(valor, _SIGNOS_VALOR).replace("! important", "!important")
+        minificadas.append(f"{propiedad}:{valor}")
+        nombre = propiedad.lower()
+        if nombre.startswith("--"):
+            familias.add(nombre)
+            continue
+        familia = re.sub(r"^-\w+-", "", nombre).split("-")[0]
+        familias.add("*" if familia == "all" else familia)
+        familias.update(_FAMILIAS_ABARCADAS.get(familia, ()))
+    return ";".join(minificadas), familias
+
+
+def _bloques_css(css: str) -> List[Tuple[str, Optional[str]]]:
+    """Bloques de primer nivel: (preludio, cuerpo) o (sentencia, None) para @import y similares"""
+    limpio = "".join(trozo for _, trozo in _partes_css(css))
+    bloques, inicio, profundidad, apertura = [], 0, 0, 0
+    i, n, en_cadena = 0, len(limpio), None
+    while i < n:
+        caracter = limpio[i]
+        if en_cadena:
+            if caracter == "\\":
+                i += 1
+            elif caracter == en_cadena:
+                en_cadena = None
+        elif caracter in "\"'":
+            en_cadena = caracter
+        elif caracter == "{":
+            if profundidad == 0:
+                apertura = i
+            profundidad += 1
+        elif caracter == "}":
+            profundidad -= 1
+            if profundidad == 0:
+                bloques.append((limpio[inicio:apertura].strip(), limpio[apertura + 1:i]))
+                inicio = i + 1
+        elif caracter == ";" and profundidad == 0:
+            bloques.append((limpio[inicio:i].strip(), None))
+            inicio = i + 1
+        i += 1
+    return [(preludio, cuerpo) for preludio, cuerpo in bloques if preludio or cuerpo]
+
+
+def _cuerpo_opaco(cuerpo: str) -> str:
+    """Cuerpo minificado de un @-bloque: declaraciones (@font-face) o bloques anidados (@keyframes)"""
+    if "{" not in cuerpo:
+        return _declaraciones(cuerpo)[0]
+    return "".join(f"{_compactar(selector, _SIGNOS_SELECTOR)}{{{_cuerpo_opaco(interior or '')}}}"
+                   for selector, interior in _bloques_css(cuerpo))
+
+
+class ReglaCss:
+    """Regla mínima del CSS: selector y declaraciones, dentro de un @media o no"""
+
+    __slots__ = ("media", "selector", "cuerpo", "familias", "clave")
+
+    def __init__(self, media: Optional[str], selector: str, cuerpo: Optional[str], familias: Set[str]):
+        self.media = media
+        self.selector = selector
+        self.cuerpo = cuerpo
+        self.familias = familias
+        self.clave = (media, selector, cuerpo)
+
+    def choca_con(self, otra: "ReglaCss") -> bool:
+        """Si invertir el orden de ambas reglas puede cambiar el valor de alguna propiedad"""
+        return "*" in self.familias or "*" in otra.familias or not self.familias.isdisjoint(otra.familias)
+
+    def texto(self) -> str:
+        if self.cuerpo is None:
+            return self.selector + ";"
+        return f"{self.selector}{{{self.cuerpo}}}"
+
+
+def reglas_css(css: str) -> List[ReglaCss]:
+    """Parte una hoja en reglas minificadas; los @media se reparten regla por regla"""
+    reglas = []
+    for preludio, cuerpo in _bloques_css(css):
+        if cuerpo is None:
+            reglas.append(ReglaCss(None, _compactar(preludio, _SIGNOS_MEDIA), None, {"*"}))
+        elif preludio.lower().startswith("@media"):
+            media = _compactar(preludio, _SIGNOS_MEDIA)
+            for selector, interior in _bloques_css(cuerpo):
+                texto, familias = _declaraciones(interior or "")
+                reglas.append(ReglaCss(media, _compactar(selector, _SIGNOS_SELECTOR), texto, familias))
+        elif preludio.startswith("@"):
+            # @keyframes, @font-face, @supports...: bloque opaco que no se reordena
+            reglas.append(ReglaCss(None, _compactar(preludio, _SIGNOS_MEDIA), _cuerpo_opaco(cuerpo), {"*"}))
+        else:
+            texto, familias = _declaraciones(cuerpo)
+            reglas.append(ReglaCss(None, _compactar(preludio, _SIGNOS_SELECTOR), texto, familias))
+    return reglas
+
+
+def hoja_css(reglas: Iterable[ReglaCss]) -> str:
+    """Texto minificado de una hoja; las reglas seguidas del mismo @media se vuelven a agrupar"""
+    salida, media_abierta = [], None
+    for regla in reglas:
+        if regla.media != media_abierta:
+            if media_abierta is not None:
+                salida.append("}")
+            if regla.media is not None:
+                salida.append(regla.media + "{")
+            media_abierta = regla.media
+        salida.append(regla.texto())
+    if media_abierta is not None:
+        salida.append("}")
+    return "".join(salida)
+
+
+def _bytes_reglas(claves: Iterable[tuple], indice: Dict[tuple, ReglaCss]) -> int:
+    return sum(len(indice[clave].texto()) for clave in claves)
+
+
+def agrupar_paginas(reglas_por_pagina: Dict[str, List[ReglaCss]]) -> List[List[str]]:
+    """Agrupa las páginas en familias que comparten reglas (uniendo de a pares mientras se ahorre)"""
+    indice = {regla.clave: regla for reglas in reglas_por_pagina.values() for regla in reglas}
+    claves = {pagina: {regla.clave for regla in reglas} for pagina, reglas in reglas_por_pagina.items()}
+
+    def ahorro(grupo: List[str]) -> int:
+        comunes = set.intersection(*(claves[pagina] for pagina in grupo))
+        tamano = _bytes_reglas(comunes, indice)
+        return tamano * (len(grupo) - 1) if tamano >= MINIMO_HOJA_COMUN else 0
+
+    grupos = [[pagina] for pagina in reglas_por_pagina]
+    while True:
+        mejor, union = 0, None
+        for i, primero in enumerate(grupos):
+            for segundo in grupos[i + 1:]:
+                ganancia = ahorro(primero + segundo) - ahorro(primero) - ahorro(segundo)
+                if ganancia > mejor:
+                    mejor, union = ganancia, (primero, segundo)
+        if union is None:
+            return grupos
+        primero, segundo = union
+        primero.extend(segundo)
+        grupos.remove(segundo)
+
+
+def reglas_elevables(reglas: List[ReglaCss], comun: List[ReglaCss]) -> Set[tuple]:
+    """Reglas de la hoja común que la página puede dejar de repetir sin alterar la cascada
+
+    La hoja común se carga antes que la propia, así que una regla elevada pasa delante de las
+    que la precedían. Solo se eleva si no comparte familia de propiedades con ninguna regla cuyo
+    orden relativo cambie; si no, la página la conserva en su sitio (la copia de la hoja común
+    queda tapada por la posterior, idéntica).
+    """
+    posicion, repetidas = {}, set()
+    for i, regla in enumerate(reglas):
+        if regla.clave in posicion:
+            repetidas.add(regla.clave)
+        posicion[regla.clave] = i
+    rango = {regla.clave: i for i, regla in enumerate(comun)}
+    elevadas = {clave for clave in rango if clave in posicion and clave not in repetidas}
+
+    cambio = True
+    while cambio:
+        cambio = False
+        for clave in sorted(elevadas, key=rango.get):
+            regla, mi_posicion = reglas[posicion[clave]], posicion[clave]
+            for anterior in reglas[:mi_posicion]:
+                if anterior.clave in elevadas and rango[anterior.clave] < rango[clave]:
+                    continue
+                if regla.choca_con(anterior):
+                    elevadas.discard(clave)
+                    cambio = True
+                    break
+    return elevadas
+
+
+# ----------------------------------------------------------------- JS
+
+def minificar_js(codigo: str) -> str:
+    """Minificación conservadora: sin comentarios, sangrías, líneas en blanco ni espacios de sobra
+
+    Los saltos de línea se conservan (no cambia la inserción automática de ';') y el contenido
+    de cadenas, plantillas `...` y expresiones regulares queda intacto.
+    """
+    salida, codigo_actual = [], []
+    pila = []  # profundidad de llaves de cada ${ abierto dentro de una plantilla
+    llaves = 0
+    i, n = 0, len(codigo)
+
+    def volcar():
+        if codigo_actual:
+            texto = re.sub(r"[ \t]*\n\s*", "\n", "".join(codigo_actual))
+            texto = re.sub(r"[ \t]+", " ", texto)
+            salida.append(re.sub(r" ?([{}()\[\];,:=]) ?", r"\1", texto))
+            codigo_actual.clear()
+
+    def literal_hasta(fin_literal: int):
+        volcar()
+        salida.append(codigo[i:fin_literal])
+
+    def plantilla(desde: int) -> int:
+        """Avanza dentro de una plantilla hasta su cierre o hasta un ${; devuelve el índice siguiente"""
+        j = desde
+        while j < n:
+            if codigo[j] == "\\":
+                j += 2
+            elif codigo[j] == "`":
+                return j + 1
+            elif codigo.startswith("${", j):
+                pila.append(llaves)
+                return j + 2
+            else:
+                j += 1
+        return n
+
+    while i < n:
+        caracter = codigo[i]
+        if caracter == "/" and codigo.startswith("//", i):
+            fin = codigo.find("\n", i)
+            i = n if fin < 0 else fin
+        elif caracter == "/" and codigo.startswith("/*", i):
+            fin = codigo.find("*/", i + 2)
+            fin = n if fin < 0 else fin + 2
+            codigo_actual.append("\n" if "\n" in codigo[i:fin] else " ")
+            i = fin
+        elif caracter in "\"'":
+            fin = i + 1
+            while fin < n and codigo[fin] != caracter:
+                fin += 2 if codigo[fin] == "\\" else 1
+            literal_hasta(fin + 1)
+            i = fin + 1
+        elif caracter == "`":
+            fin = plantilla(i + 1)
+            literal_hasta(fin)
+            i = fin
+        elif caracter == "/" and re.search(r"(^|[(,=:\[!&|?{};+\-*%<>~^]|\breturn|\btypeof)\s*$",
+                                           "".join(codigo_actual) or "".join(salida[-1:])):
+            # Expresión regular literal
+            fin, en_clase = i + 1, False
+            while fin < n and (codigo[fin] != "/" or en_clase):
+                if codigo[fin] == "\\":
+                    fin += 1
+                elif codigo[fin] == "[":
+                    en_clase = True
+                elif codigo[fin] == "]":
+                    en_clase = False
+                fin += 1
+            fin += 1
+            while fin < n and codigo[fin].isalpha():
+                fin += 1
+            literal_hasta(fin)
+            i = fin
+        elif caracter == "}" and pila and llaves == pila[-1]:
+            # Cierre de un ${...}: se sigue dentro de la plantilla
+            pila.pop()
+            fin = plantilla(i + 1)
+            literal_hasta(fin)
+            i = fin
+        else:
+            if caracter == "{":
+                llaves += 1
+            elif caracter == "}":
+                llaves -= 1
+            codigo_actual.append(caracter)
+            i += 1
+    volcar()
+    return "".join(salida).strip()
+
+
+# ------------------------------------------------------------ Escritura
+
+def _escribir_con_variantes(ruta: str, datos: bytes, calidad_brotli: int = CALIDAD_BROTLI_PAGINAS) -> Dict[str, int]:
+    """Escribe el archivo con sus variantes .gz (y .br si hay brotli); devuelve los tamaños"""
+    tamanos = {"bytes": len(datos)}
+    variantes = [("gz", gzip.compress(datos, compresslevel=9, mtime=0))]
+    if BROTLI_DISPONIBLE:
+        variantes.append(("br", brotli.compress(datos, quality=calidad_brotli)))
+    with open(ruta, "wb") as f:
+        f.write(datos)
+    for extension, comprimido in variantes:
+        with open(f"{ruta}.{extension}", "wb") as f:
+            f.write(comprimido)
+        tamanos[extension] = len(comprimido)
+    return tamanos
+
+
+def nombre_con_hash(nombre_logico: str, datos: bytes) -> str:
+    """index.css -> index.1a2b3c4d5e.css (sha256 del contenido)"""
+    base, extension = os.path.splitext(nombre_logico)
+    return f"{base}.{hashlib.sha256(datos).hexdigest()[:LONGITUD_HASH]}{extension}"
+
+
+def _extraer_scripts(html: str) -> Tuple[str, List[Tuple[str, str]]]:
+    """Cambia los <script> en línea por marcadores; devuelve (html, [(atributos, código), ...])"""
+    scripts = []
+
+    def reemplazar(coincidencia):
+        atributos, codigo = coincidencia.group(1) or "", coincidencia.group(2)
+        tipo = re.search(r'type\s*=\s*["\']?([\w/+-]+)', atributos, re.I)
+        if re.search(r"\bsrc\s*=", atributos, re.I) or not codigo.strip() or \
+                (tipo and tipo.group(1).lower() not in _TIPOS_JS):
+            return coincidencia.group(0)
+        scripts.append((atributos, codigo))
+        return f"\0script{len(scripts) - 1}\0"
+
+    return _SCRIPT.sub(reemplazar, html), scripts
+
+
+def publicar_sitio(paginas: Iterable[str] = PAGINAS_SITIO, carpeta_salida: str = "sitio",
+                   origen: str = ".", adicionales: Iterable[str] = ()) -> Dict:
+    """Publica las páginas en 'carpeta_salida' con CSS/JS externos, minificados y con hash
+
+    'adicionales' son archivos que se copian tal cual junto a las páginas (con .gz/.br), por
+    ejemplo agenda_completa.json que carga visualizar_agenda.html. Las páginas que no existen se
+    omiten. Devuelve el manifiesto escrito en recursos/manifest.json.
+    """
+    carpeta_recursos = os.path.join(carpeta_salida, CARPETA_RECURSOS)
+    os.makedirs(carpeta_recursos, exist_ok=True)
+
+    fuentes, reglas_por_pagina, scripts_por_pagina = {}, {}, {}
+    for pagina in paginas:
+        ruta = os.path.join(origen, pagina)
+        if not os.path.exists(ruta):
+            continue
+        with open(ruta, encoding="utf-8") as f:
+            html = f.read()
+        html, scripts_por_pagina[pagina] = _extraer_scripts(html)
+        css = "".join(c.group(3) for c in _ESTILO.finditer(html) if "media" not in (c.group(2) or ""))
+        fuentes[pagina] = html
+        reglas_por_pagina[pagina] = reglas_css(css)
+
+    manifiesto = {"recursos": {}, "paginas": {}}
+    recursos = manifiesto["recursos"]
+    por_contenido = {}
+
+    def publicar(nombre_logico: str, texto: str) -> str:
+        datos = texto.encode("utf-8")
+        if datos in por_contenido:
+            return por_contenido[datos]
+        archivo = nombre_con_hash(nombre_logico, datos)
+        recursos[nombre_logico] = {"archivo": archivo, **_escribir_con_variantes(
+            os.path.join(carpeta_recursos, archivo), datos, CALIDAD_BROTLI_RECURSOS)}
+        por_contenido[datos] = nombre_logico
+        return nombre_logico
+
+    # Hojas comunes por familia de páginas
+    hojas = {pagina: [] for pagina in fuentes}
+    propias = {pagina: list(reglas) for pagina, reglas in reglas_por_pagina.items()}
+    numero = 0
+    for grupo in agrupar_paginas(reglas_por_pagina):
+        if len(grupo) < 2:
+            continue
+        comunes = set.intersection(*({r.clave for r in reglas_por_pagina[p]} for p in grupo))
+        comun = [regla for regla in reglas_por_pagina[grupo[0]] if regla.clave in comunes]
+        comun = list({regla.clave: regla for regla in comun}.values())
+        numero += 1
+        nombre = publicar(f"comun-{numero}.css", hoja_css(comun))
+        for pagina in grupo:
+            elevadas = reglas_elevables(reglas_por_pagina[pagina], comun)
+            propias[pagina] = [regla for regla in propias[pagina] if regla.clave not in elevadas]
+            hojas[pagina].append(nombre)
+
+    for pagina, html in fuentes.items():
+        base = os.path.splitext(pagina)[0]
+        if propias[pagina]:
+            hojas[pagina].append(publicar(f"{base}.css", hoja_css(propias[pagina])))
+        usados = list(hojas[pagina])
+        enlaces = [f'<link rel="stylesheet" href="{CARPETA_RECURSOS}/{recursos[hoja]["archivo"]}" />'
+                   for hoja in hojas[pagina]]
+
+        def enlazar(coincidencia):
+            # Los enlaces van donde estaba el primer <style>; los demás <style> se quitan
+            nonlocal enlaces
+            if "media" in (coincidencia.group(2) or ""):
+                return coincidencia.group(0)
+            sangria, pendientes, enlaces = coincidencia.group(1), enlaces, []
+            return "".join(f"{sangria}{enlace}\n" for enlace in pendientes)
+
+        html = _ESTILO.sub(enlazar, html)
+        for i, (atributos, codigo) in enumerate(scripts_por_pagina[pagina]):
+            sufijo = f"-{i + 1}" if i else ""
+            nombre = publicar(f"{base}{sufijo}.js", minificar_js(codigo))
+            usados.append(nombre)
+            html = html.replace(f"\0script{i}\0",
+                                f'<script{atributos} src="{CARPETA_RECURSOS}/{recursos[nombre]["archivo"]}"></script>')
+        manifiesto["paginas"][pagina] = usados
+        _escribir_con_variantes(os.path.join(carpeta_salida, pagina), html.encode("utf-8"))
+
+    for adicional in adicionales:
+        ruta = os.path.join(origen, adicional)
+        if os.path.exists(ruta):
+            with open(ruta, "rb") as f:
+                _escribir_con_variantes(os.path.join(carpeta_salida, os.path.basename(adicional)), f.read())
+
+    with open(os.path.join(carpeta_recursos, ARCHIVO_MANIFIESTO), "w", encoding="utf-8") as f:
+        json.dump(manifiesto, f, ensure_ascii=False, indent=2)
+    return manifiesto
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Publica las vistas web con CSS/JS compartidos, minificados y precomprimidos")
+    parser.add_argument("paginas", nargs="*", default=list(PAGINAS_SITIO), help="Páginas a publicar")
+    parser.add_argument("--origen", default=".", help="Carpeta de las páginas originales")
+    parser.add_argument("--salida", default="sitio", help="Carpeta donde se publica el sitio")
+    parser.add_argument("--adicional", action="append", default=None,
+                        help="Archivo extra a copiar junto a las páginas (por defecto agenda_completa.json)")
+    args = parser.parse_args()
+
+    adicionales = args.adicional if args.adicional is not None else ["agenda_completa.json"]
+    manifiesto = publicar_sitio(args.paginas, args.salida, origen=args.origen, adicionales=adicionales)
+    if not BROTLI_DISPONIBLE:
+        print("⚠️  brotli no está instalado: solo se generan variantes .gz (pip install brotli)")
+    for pagina, usados in manifiesto["paginas"].items():
+        print(f"📄 {pagina}: {', '.join(usados)}")
+    for nombre, datos in manifiesto["recursos"].items():
+        comprimido = f", br {datos['br']}" if "br" in datos else ""
+        print(f"   • {datos['archivo']}: {datos['bytes']} bytes (gz {datos['gz']}{comprimido})")
+    print(f"✅ Sitio publicado en: {args.salida}")
+
+
+if __name__ == "__main__":
+    main()
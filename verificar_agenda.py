@@ -11,11 +11,12 @@ Autor: Sistema de Agenda
 Fecha: 2024
 """
 
-import json
 import csv
 from collections import defaultdict
 import sys
 
+from json_agenda import LectorJsonAgenda
+
 def cargar_preferencias_desde_archivo(archivo_csv):
     """
     Carga las preferencias desde el archivo CSV de manera exhaustiva
@@ -65,15 +66,12 @@ def cargar_preferencias_desde_archivo(archivo_csv):
 
 def cargar_agenda_generada(archivo_json):
     """
-    Carga la agenda generada desde el archivo JSON
+    Carga la agenda generada desde el archivo JSON (solo la sección 'agenda')
     """
     print(f"\n📋 Cargando agenda desde: {archivo_json}")
     
     try:
-        with open(archivo_json, 'r', encoding='utf-8') as file:
-            data = json.load(file)
-        
-        agenda = data.get('agenda', {})
+        agenda = LectorJsonAgenda(archivo_json).leer_seccion('agenda', {})
         print(f"✓ Agenda cargada: {len(agenda)} slots de tiempo")
         
         return agenda
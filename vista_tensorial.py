@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Vista tensorial (NumPy) de la agenda
+
+Representa self.agenda como arreglos de enteros para validar y resumir con
+reducciones vectorizadas en lugar de ciclos anidados:
+- encuentros: una fila por vendedor sentado en una cita (slot, comprador, vendedor, cita)
+- ocupacion(): matriz slot × vendedor → identificador del comprador (-1 = libre)
+- tensor(): tensor booleano slot × comprador × vendedor (solo para eventos medianos)
+
+NumPy es opcional: sin él NUMPY_DISPONIBLE es False y el organizador sigue con
+sus validaciones en Python puro.
+"""
+
+from typing import Dict, List
+
+try:
+    import numpy as np
+    NUMPY_DISPONIBLE = True
+except ImportError:
+    np = None
+    NUMPY_DISPONIBLE = False
+
+
+def _matriz_disponibilidad(mascaras: List[int], num_slots: int):
+    """Máscaras de bits por participante → matriz booleana participante × slot"""
+    num_bytes = max(1, (num_slots + 7) // 8)
+    datos = b"".join(mascara.to_bytes(num_bytes, "little") for mascara in mascaras)
+    bytes_por_fila = np.frombuffer(datos, dtype=np.uint8).reshape(-1, num_bytes)
+    return np.unpackbits(bytes_por_fila, axis=1, bitorder="little")[:, :num_slots].astype(bool)
+
+
+def _repetidos(codigos):
+    """Códigos que aparecen más de una vez y cuántas veces"""
+    valores, veces = np.unique(codigos, return_counts=True)
+    return valores[veces > 1], veces[veces > 1]
+
+
+class VistaTensorial:
+    """Agenda de un AgendaRuedaNegocios como arreglos NumPy (se construye en una sola pasada)"""
+
+    def __init__(self, organizador):
+        if not NUMPY_DISPONIBLE:
+            raise ImportError("La vista tensorial requiere NumPy (pip install numpy)")
+        self.organizador = organizador
+        self.num_slots = organizador.num_slots
+        ids_vendedor = organizador.ids_vendedor
+        ids_comprador = organizador.ids_comprador
+
+        slots, compradores, vendedores, citas = [], [], [], []
+        cita_slot, cita_comprador = [], []
+        for slot, citas_slot in organizador.agenda.items():
+            for cita in citas_slot:
+                indice_cita = len(cita_slot)
+                id_comprador = ids_comprador.identificador(cita.comprador)
+                cita_slot.append(slot)
+                cita_comprador.append(id_comprador)
+                for vendedor in cita.vendedores:
+                    slots.append(slot)
+                    compradores.append(id_comprador)
+                    vendedores.append(ids_vendedor.identificador(vendedor))
+                    citas.append(indice_cita)
+
+        # Los nombres se leen después: identificador() puede haber sumado participantes
+        self.nombres_vendedor = ids_vendedor.nombres
+        self.nombres_comprador = ids_comprador.nombres
+        self.num_vendedores_ids = len(ids_vendedor)
+        self.num_compradores_ids = len(ids_comprador)
+
+        # Un elemento por encuentro (vendedor en una cita)
+        self.slot = np.array(slots, dtype=np.int32)
+        self.comprador = np.array(compradores, dtype=np.int32)
+        self.vendedor = np.array(vendedores, dtype=np.int32)
+        self.cita = np.array(citas, dtype=np.int32)
+        # Un elemento por cita
+        self.cita_slot = np.array(cita_slot, dtype=np.int32)
+        self.cita_comprador = np.array(cita_comprador, dtype=np.int32)
+
+    def ocupacion(self):
+        """Matriz slot × vendedor con el comprador atendido (-1 = libre)"""
+        matriz = np.full((self.num_slots, self.num_vendedores_ids), -1, dtype=np.int32)
+        matriz[self.slot, self.vendedor] = self.comprador
+        return matriz
+
+    def tensor(self):
+        """Tensor booleano slot × comprador × vendedor (ocupa slots·compradores·vendedores bytes)"""
+        tensor = np.zeros((self.num_slots, self.num_compradores_ids, self.num_vendedores_ids), dtype=bool)
+        tensor[self.slot, self.comprador, self.vendedor] = True
+        return tensor
+
+    def cargas_vendedor(self):
+        """Citas por identificador de vendedor"""
+        return np.bincount(self.vendedor, minlength=self.num_vendedores_ids)
+
+    def cargas_comprador(self):
+        """Citas por identificador de comprador"""
+        return np.bincount(self.cita_comprador, minlength=self.num_compradores_ids)
+
+    def estadisticas(self) -> Dict:
+        """Totales, citas por slot y carga por participante"""
+        organizador = self.organizador
+        ids_vendedor = organizador.ids_vendedor.ids
+        ids_comprador = organizador.ids_comprador.ids
+        cargas_vendedor = self.cargas_vendedor()
+        cargas_comprador = self.cargas_comprador()
+        # Solo los participantes inscritos (los dados de baja conservan su identificador)
+        activos_vendedor = cargas_vendedor[[ids_vendedor[v] for v in organizador.vendedores]]
+        activos_comprador = cargas_comprador[[ids_comprador[c] for c in organizador.compradores]]
+        return {
+            "total_citas_programadas": int(self.cita_slot.size),
+            "total_encuentros_individuales": int(self.slot.size),
+            "citas_por_slot": np.bincount(self.cita_slot, minlength=self.num_slots).tolist(),
+            "citas_promedio_por_vendedor": float(activos_vendedor.mean()) if activos_vendedor.size else 0.0,
+            "citas_promedio_por_comprador": float(activos_comprador.mean()) if activos_comprador.size else 0.0,
+            "max_citas_de_un_vendedor": int(activos_vendedor.max()) if activos_vendedor.size else 0,
+            "vendedores_sin_citas": int((activos_vendedor == 0).sum()),
+            "compradores_sin_citas": int((activos_comprador == 0).sum()),
+        }
+
+    def validar(self) -> Dict:
+        """Todas las violaciones de la agenda, cada tipo con una reducción vectorizada"""
+        organizador = self.organizador
+        horarios = organizador.horarios
+        num_v, num_c = self.num_vendedores_ids, self.num_compradores_ids
+        nombres_v, nombres_c = self.nombres_vendedor, self.nombres_comprador
+        violaciones = {}
+
+        # Vendedor en dos citas del mismo slot
+        codigos, veces = _repetidos(self.slot.astype(np.int64) * num_v + self.vendedor)
+        violaciones["vendedor_doble"] = [
+            {"horario": horarios[codigo // num_v], "vendedor": nombres_v[codigo % num_v], "citas": int(n)}
+            for codigo, n in zip(codigos.tolist(), veces.tolist())
+        ]
+
+        # Comprador con dos citas en el mismo slot
+        codigos, veces = _repetidos(self.cita_slot.astype(np.int64) * num_c + self.cita_comprador)
+        violaciones["comprador_doble"] = [
+            {"horario": horarios[codigo // num_c], "comprador": nombres_c[codigo % num_c], "citas": int(n)}
+            for codigo, n in zip(codigos.tolist(), veces.tolist())
+        ]
+
+        # Participante con doble rol que compra y vende en el mismo slot
+        ids_c = organizador.ids_comprador.ids
+        como_comprador = np.array([ids_c.get(nombre, -1) for nombre in nombres_v[:num_v]], dtype=np.int64)
+        vende = como_comprador[self.vendedor] >= 0
+        codigos = np.intersect1d(self.slot[vende].astype(np.int64) * num_c + como_comprador[self.vendedor[vende]],
+                                 self.cita_slot.astype(np.int64) * num_c + self.cita_comprador)
+        violaciones["participante_doble"] = [
+            {"horario": horarios[codigo // num_c], "participante": nombres_c[codigo % num_c]}
+            for codigo in codigos.tolist()
+        ]
+
+        # Mismo par comprador-vendedor en más de una cita
+        pares = self.comprador.astype(np.int64) * num_v + self.vendedor
+        codigos, veces = _repetidos(pares)
+        violaciones["encuentro_repetido"] = [
+            {"comprador": nombres_c[codigo // num_v], "vendedor": nombres_v[codigo % num_v], "veces": int(n)}
+            for codigo, n in zip(codigos.tolist(), veces.tolist())
+        ]
+
+        # Citas con más vendedores que el límite
+        tamanos = np.bincount(self.cita, minlength=self.cita_slot.size)
+        excedidas = np.flatnonzero(tamanos > organizador.vendedores_por_cita)
+        violaciones["grupo_excedido"] = [
+            {"horario": horarios[self.cita_slot[i]], "comprador": nombres_c[self.cita_comprador[i]],
+             "vendedores": int(tamanos[i])}
+            for i in excedidas.tolist()
+        ]
+
+        # Vendedores por encima de su máximo de citas
+        cargas = self.cargas_vendedor()
+        violaciones["vendedor_sobre_tope"] = [
+            {"vendedor": nombres_v[i], "citas": int(cargas[i])}
+            for i in np.flatnonzero(cargas > organizador.max_citas_vendedor).tolist()
+        ]
+
+        # Encuentros fuera de la ventana de disponibilidad (o en un descanso)
+        habiles = organizador.mascara_slots_habiles
+        disponible_v = _matriz_disponibilidad(
+            [organizador.disponibilidad_vendedor.get(n, habiles) for n in nombres_v[:num_v]], self.num_slots)
+        disponible_c = _matriz_disponibilidad(
+            [organizador.disponibilidad_comprador.get(n, habiles) for n in nombres_c[:num_c]], self.num_slots)
+        fuera_v = ~disponible_v[self.vendedor, self.slot]
+        fuera_c = ~disponible_c[self.comprador, self.slot]
+        violaciones["fuera_de_ventana"] = [
+            {"horario": horarios[self.slot[i]], "comprador": nombres_c[self.comprador[i]],
+             "vendedor": nombres_v[self.vendedor[i]],
+             "participante": "vendedor" if fuera_v[i] else "comprador"}
+            for i in np.flatnonzero(fuera_v | fuera_c).tolist()
+        ]
+
+        # Pares prohibidos por la configuración
+        ids_v = organizador.ids_vendedor.ids
+        codigos_prohibidos = np.array(
+            [ids_c[c] * num_v + ids_v[v] for c, v in organizador.pares_prohibidos if c in ids_c and v in ids_v],
+            dtype=np.int64)
+        violaciones["par_prohibido"] = [
+            {"horario": horarios[self.slot[i]], "comprador": nombres_c[self.comprador[i]],
+             "vendedor": nombres_v[self.vendedor[i]]}
+            for i in np.flatnonzero(np.isin(pares, codigos_prohibidos)).tolist()
+        ]
+
+        total = sum(len(lista) for lista in violaciones.values())
+        return {"tiene_violaciones": total > 0, "total_violaciones": total, "violaciones": violaciones}